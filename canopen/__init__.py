@@ -1,5 +1,5 @@
 from canopen.exception import CANopenError
-from canopen.network import Network
+from canopen.network import Network, AsyncNetwork
 from canopen.node import Node, LocalNode, RemoteNode
 from canopen.objectdictionary import ObjectDictionary
 
@@ -1 +1,7 @@
+from canopen.network.capture import CaptureWriter, read_capture, replay
+from canopen.network.executor import Executor
+from canopen.network.loopback import LoopbackBus, LoopbackNotifier
+from canopen.network.metrics import Metrics
+from canopen.network.transmitqueue import TransmitQueue
 from canopen.network.network import Network, MessageListener
+from canopen.network.asyncnetwork import AsyncNetwork
@@ -0,0 +1,72 @@
+import can
+from canopen.util.asynccondition import _running_loop
+from .network import Network
+
+
+class AsyncNetwork(Network):
+	""" Representation of a CANopen network for asyncio applications.
+	
+	This class works like ``Network``, but the builtin notifier receives the messages through the asyncio support of python-can and all callbacks are called on the event loop.
+	Together with the awaitable variants of the services, like ``SDOClient.upload_async`` or ``SYNCConsumer.wait_for_sync_async``, no thread is needed for a waiting caller.
+	"""
+	def __init__(self, loop = None, executor = None, transmit_queue = None, metrics = None):
+		""" Initialises an ``AsyncNetwork``
+		Raises TypeError if the executor is not None and not an instance of ``Executor``.
+		Raises TypeError if the transmit queue is not None and not an instance of ``TransmitQueue``.
+		Raises TypeError if the metrics are not None and not an instance of ``Metrics``.
+		
+		:param loop: The event loop to receive the messages in. If None, the running event loop of the caller of ``attach`` is used.
+		
+		:param executor: The executor to run the callbacks with. If None, the callbacks are called on the event loop.
+		
+		:param transmit_queue: The transmit queue to send the messages with. If None, the messages are sent directly by the thread calling ``send``.
+		
+		:param metrics: The ``Metrics`` to record the traffic and the callbacks in. If None, nothing is recorded.
+		
+		:raises: TypeError
+		"""
+		Network.__init__(self, executor, transmit_queue, metrics)
+		self._loop = loop
+		# The running event loop of the caller of attach, if no event loop is given
+		self._attached_loop = None
+	
+	def attach(self, bus, builtin_notifier = True, auto_filters = False):
+		""" Attach the network to a CAN bus.
+		Raises TypeError if the bus is not a subclass of can.BusABC
+		Raises ValueError if the network is already attached to the bus.
+		Raises RuntimeError if the builtin notifier is used, the network has no event loop and the caller does not run on an event loop.
+		
+		:param bus: The can bus to connect.
+		
+		:param builtin_notifier: Use the builtin notifier or not. If False, all (relevant) CAN messages must be passed to on_message on the event loop.
+		
+		:param auto_filters: If True, the acceptance filters of the bus are set to the identifiers of the subscribed messages and updated on every change of the subscriptions.
+		
+		:raises: RuntimeError, TypeError, ValueError
+		"""
+		loop = self._loop
+		if builtin_notifier and loop == None:
+			loop = _running_loop()
+		
+		Network.attach(self, bus, False, auto_filters)
+		
+		if builtin_notifier:
+			self._notifier = can.Notifier(self._bus, self._listeners, loop = loop)
+			self._attached_loop = loop
+	
+	def detach(self):
+		""" Detach the network from a CAN bus.
+		Raises RuntimeError if the network is not attached to a bus.
+		
+		:raises: RuntimeError
+		"""
+		Network.detach(self)
+		self._attached_loop = None
+	
+	@property
+	def loop(self):
+		""" Returns the event loop of the network. If no event loop was given, it is the running event loop of the caller of ``attach`` while the network is attached with the builtin notifier, otherwise None.
+		"""
+		if self._loop != None:
+			return self._loop
+		return self._attached_loop
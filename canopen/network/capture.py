@@ -0,0 +1,169 @@
+import struct
+import threading
+import time
+import can
+
+
+#: The header at the beginning of each capture file
+HEADER = b"COCAP\x00\x01\x00"
+
+#: The format of one record: timestamp, identifier, flags, DLC and 8 data bytes
+RECORD = struct.Struct("<dIBB8s")
+
+FLAG_EXTENDED = 0x01
+FLAG_REMOTE = 0x02
+FLAG_ERROR = 0x04
+FLAG_TX = 0x08
+
+
+class CaptureWriter(object):
+	""" Writer for binary capture files.
+	
+	Each frame is stored as a record of fixed size with the timestamp, the identifier, the flags, the DLC and 8 data bytes. The records are written through a buffered file.
+	Assign a ``CaptureWriter`` to ``Network.recorder`` to capture all received and sent frames of a network.
+	"""
+	def __init__(self, file, buffer_size = 65536):
+		""" Initializes a ``CaptureWriter`` and writes the header.
+		
+		:param file: The path of the capture file to create or a binary file object opened for writing.
+		
+		:param buffer_size: The size of the write buffer in bytes, if a path is given.
+		"""
+		if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+			self._file = open(file, "wb", buffering = buffer_size)
+			self._close_file = True
+		else:
+			self._file = file
+			self._close_file = False
+		self._lock = threading.Lock()
+		self._count = 0
+		self._file.write(HEADER)
+	
+	def __enter__(self):
+		return self
+	
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+	
+	def write(self, message, tx = False):
+		""" Writes a record of the message.
+		Raises ValueError if the writer is closed.
+		
+		:param message: The message to record.
+		
+		:param tx: True if the message was sent, False if it was received.
+		
+		:raises: ValueError
+		"""
+		flags = 0
+		if message.is_extended_id:
+			flags |= FLAG_EXTENDED
+		if message.is_remote_frame:
+			flags |= FLAG_REMOTE
+		if message.is_error_frame:
+			flags |= FLAG_ERROR
+		if tx:
+			flags |= FLAG_TX
+		timestamp = message.timestamp
+		if not timestamp:
+			timestamp = time.time()
+		record = RECORD.pack(timestamp, message.arbitration_id, flags, message.dlc, bytes(message.data[:8]))
+		with self._lock:
+			self._file.write(record)
+			self._count += 1
+	
+	def flush(self):
+		""" Flushes the buffer to the file.
+		"""
+		with self._lock:
+			self._file.flush()
+	
+	def close(self):
+		""" Flushes the buffer and closes the file, if it was opened by the writer.
+		"""
+		with self._lock:
+			if self._close_file:
+				self._file.close()
+			else:
+				self._file.flush()
+	
+	@property
+	def count(self):
+		""" Returns the number of written records.
+		"""
+		return self._count
+
+
+def read_capture(file):
+	""" Reads a capture file.
+	Raises ValueError if the file is not a capture file or ends within a record.
+	
+	:param file: The path of the capture file or a binary file object opened for reading.
+	
+	:returns: A generator, which yields a tuple of the message and a boolean, which is True if the message was sent.
+	
+	:raises: ValueError
+	"""
+	if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+		with open(file, "rb") as f:
+			yield from read_capture(f)
+		return
+	
+	if _read(file, len(HEADER)) != HEADER:
+		raise ValueError()
+	
+	size = RECORD.size
+	while True:
+		chunk = _read(file, size * 4096)
+		for timestamp, message_id, flags, dlc, data in RECORD.iter_unpack(chunk[:len(chunk) - len(chunk) % size]):
+			message = can.Message(timestamp = timestamp, arbitration_id = message_id,
+				is_extended_id = bool(flags & FLAG_EXTENDED), is_remote_frame = bool(flags & FLAG_REMOTE), is_error_frame = bool(flags & FLAG_ERROR),
+				dlc = dlc, data = None if flags & FLAG_REMOTE else data[:dlc])
+			yield message, bool(flags & FLAG_TX)
+		if len(chunk) % size:
+			# The file is truncated within a record
+			raise ValueError()
+		if len(chunk) < size * 4096:
+			return
+
+
+def _read(file, size):
+	""" Reads the given number of bytes. Less bytes are returned only at the end of the file, as a read of e.g. a pipe or a socket may return less than requested. """
+	data = file.read(size)
+	while data and len(data) < size:
+		chunk = file.read(size - len(data))
+		if not chunk:
+			break
+		data += chunk
+	return data
+
+
+def replay(network, file, realtime = True, include_tx = False):
+	""" Replays a capture file into ``Network.on_message``. The network does not need to be attached to a bus.
+	
+	:param network: The network to pass the messages to.
+	
+	:param file: The path of the capture file or a binary file object opened for reading.
+	
+	:param realtime: If True, the messages are passed with the original timing. If False, the messages are passed as fast as possible.
+	
+	:param include_tx: If True, the sent messages are replayed too.
+	
+	:returns: The number of replayed messages.
+	
+	:raises: ValueError
+	"""
+	count = 0
+	start = None
+	for message, tx in read_capture(file):
+		if tx and not include_tx:
+			continue
+		if realtime:
+			if start == None:
+				start = (message.timestamp, time.perf_counter())
+			delay = (message.timestamp - start[0]) - (time.perf_counter() - start[1])
+			if delay > 0:
+				time.sleep(delay)
+		network.on_message(message)
+		count += 1
+	return count
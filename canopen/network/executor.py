@@ -0,0 +1,141 @@
+import collections
+import threading
+
+
+class Executor(object):
+	""" Executor for the callbacks of a ``Network``.
+	
+	The callbacks are executed by a pool of worker threads instead of the thread which passes the messages to ``Network.on_message``.
+	Messages with the same identifier are always handled by the same worker, thus they are processed strictly in the order of reception.
+	Each worker has a bounded queue. If the queue is full, the overflow policy selects whether the oldest queued message is dropped or the caller blocks until there is space in the queue.
+	"""
+	DROP_OLDEST = "drop-oldest"
+	BLOCK = "block"
+	
+	def __init__(self, workers = 4, queue_depth = 256, overflow = DROP_OLDEST):
+		""" Initializes an ``Executor`` and starts the worker threads.
+		
+		:param workers: The number of worker threads. Must be a positive integer.
+		
+		:param queue_depth: The maximum number of pending messages per worker. Must be a positive integer.
+		
+		:param overflow: The overflow policy. Must be one of ``Executor.DROP_OLDEST`` or ``Executor.BLOCK``.
+		
+		:raises: ValueError
+		"""
+		if int(workers) < 1:
+			raise ValueError()
+		if int(queue_depth) < 1:
+			raise ValueError()
+		if overflow not in [self.DROP_OLDEST, self.BLOCK]:
+			raise ValueError()
+		
+		self._queue_depth = int(queue_depth)
+		self._overflow = overflow
+		self._workers = tuple(_Worker(self._queue_depth, self._overflow) for i in range(int(workers)))
+		
+		for worker in self._workers:
+			worker.start()
+	
+	def submit(self, message_id, function, *args):
+		""" Queues a call of ``function`` with ``args``. Calls with the same message identifier are executed in the order of submission.
+		Raises RuntimeError if the executor is stopped.
+		
+		:param message_id: The identifier of the message, used to select the worker.
+		
+		:param function: The function to call.
+		
+		:param args: The arguments to pass to the function.
+		
+		:raises: RuntimeError
+		"""
+		self._workers[message_id % len(self._workers)].submit(function, args)
+	
+	def stop(self):
+		""" Stops all workers. Pending calls are discarded and counted as dropped.
+		"""
+		for worker in self._workers:
+			worker.stop()
+		for worker in self._workers:
+			if worker is not threading.current_thread():
+				worker.join()
+	
+	@property
+	def dropped(self):
+		""" Returns the number of messages dropped due to queue overflow or stop.
+		"""
+		return sum(worker.dropped for worker in self._workers)
+	
+	@property
+	def overflow(self):
+		""" Returns the overflow policy.
+		"""
+		return self._overflow
+	
+	@property
+	def queue_depth(self):
+		""" Returns the maximum number of pending messages per worker.
+		"""
+		return self._queue_depth
+	
+	@property
+	def workers(self):
+		""" Returns the number of worker threads.
+		"""
+		return len(self._workers)
+
+
+class _Worker(threading.Thread):
+	def __init__(self, queue_depth, overflow):
+		threading.Thread.__init__(self, daemon = True)
+		
+		self._queue_depth = queue_depth
+		self._overflow = overflow
+		self._queue = collections.deque()
+		self._lock = threading.Lock()
+		self._not_empty = threading.Condition(self._lock)
+		self._not_full = threading.Condition(self._lock)
+		self._terminate = False
+		self.dropped = 0
+	
+	def submit(self, function, args):
+		with self._lock:
+			if self._terminate:
+				raise RuntimeError()
+			
+			if len(self._queue) >= self._queue_depth:
+				if self._overflow == Executor.BLOCK:
+					while len(self._queue) >= self._queue_depth and not self._terminate:
+						self._not_full.wait()
+					if self._terminate:
+						self.dropped += 1
+						return
+				else:
+					self._queue.popleft()
+					self.dropped += 1
+			
+			self._queue.append((function, args))
+			self._not_empty.notify()
+	
+	def stop(self):
+		with self._lock:
+			self._terminate = True
+			self.dropped += len(self._queue)
+			self._queue.clear()
+			self._not_empty.notify_all()
+			self._not_full.notify_all()
+	
+	def run(self):
+		while True:
+			with self._lock:
+				while not self._queue and not self._terminate:
+					self._not_empty.wait()
+				if self._terminate:
+					return
+				function, args = self._queue.popleft()
+				self._not_full.notify()
+			
+			try:
+				function(*args)
+			except:
+				pass
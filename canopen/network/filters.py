@@ -0,0 +1,55 @@
+#: The maximum number of identifiers, for which the filters are computed. The time of the computation grows steeply with the number of identifiers, and bus hardware supports only a few filters anyway. For more identifiers, a single filter accepting all messages is returned.
+MAX_IDENTIFIERS = 256
+
+
+def acceptance_filters(identifiers, extended = False):
+	""" Returns a small list of acceptance filters, which matches exactly the given message identifiers.
+	
+	Identifiers which differ only in some bits are merged into one filter with these bits masked out (like the prime implicants of the Quine-McCluskey algorithm). Afterwards, the filters needed to cover all identifiers are selected.
+	The filters are in the format of ``can.BusABC.set_filters``.
+	If there are more than ``MAX_IDENTIFIERS`` identifiers, a single filter accepting all messages is returned.
+	
+	:param identifiers: An iterable of message identifiers.
+	
+	:param extended: True if the identifiers are for extended frames (29 bit), False for standard frames (11 bit).
+	
+	:returns: A list of dictionaries with the keys "can_id", "can_mask" and "extended".
+	"""
+	full_mask = 0x1FFFFFFF if extended else 0x7FF
+	identifiers = set(identifiers)
+	if len(identifiers) > MAX_IDENTIFIERS:
+		return [{"can_id": 0, "can_mask": 0, "extended": bool(extended)}]
+	
+	# Generate all implicants by merging pairs of implicants which differ in exactly one bit of the mask.
+	# The identifier of an implicant has all bits outside the mask cleared, thus the merge is always done from the partner with the cleared bit.
+	primes = set()
+	level = set((can_id, full_mask) for can_id in identifiers)
+	while level:
+		merged = set()
+		next_level = set()
+		for can_id, can_mask in level:
+			bit = 1
+			while bit <= can_mask:
+				if can_mask & bit and not can_id & bit:
+					partner = (can_id | bit, can_mask)
+					if partner in level:
+						next_level.add((can_id, can_mask & ~bit))
+						merged.add((can_id, can_mask))
+						merged.add(partner)
+				bit <<= 1
+		primes |= level - merged
+		level = next_level
+	
+	# Select the implicants, starting with the one which covers the most uncovered identifiers.
+	covers = {}
+	for can_id, can_mask in primes:
+		covers[(can_id, can_mask)] = set(x for x in identifiers if x & can_mask == can_id)
+	
+	selected = []
+	uncovered = set(identifiers)
+	while uncovered:
+		best = max(sorted(covers), key = lambda k: len(covers[k] & uncovered))
+		selected.append(best)
+		uncovered -= covers.pop(best)
+	
+	return [{"can_id": can_id, "can_mask": can_mask, "extended": bool(extended)} for can_id, can_mask in sorted(selected)]
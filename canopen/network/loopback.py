@@ -0,0 +1,231 @@
+import collections
+import copy
+import threading
+import time
+import can
+
+
+class LoopbackBus(can.BusABC):
+	""" In-process loopback bus.
+	
+	All messages sent on a ``LoopbackBus`` are delivered to all other ``LoopbackBus`` instances on the same channel. If a ``Network`` is attached with the builtin notifier, the messages are passed directly to ``Network.on_message``, thus no thread and queue per bus is needed.
+	Otherwise the messages are queued and can be read with ``recv``.
+	
+	In the default mode, the messages of a channel are delivered by one thread per channel.
+	In the deterministic mode, no thread is used. The messages are delivered in the order of sending when ``process`` is called, including the messages sent by the callbacks during the delivery. As nothing is delivered in the background, blocking calls like ``SDOClient.upload`` do not work in this mode.
+	"""
+	_channels = {}
+	_channels_lock = threading.Lock()
+	
+	def __init__(self, channel = 0, deterministic = False, receive_own_messages = False, can_filters = None, **config):
+		""" Initializes a ``LoopbackBus`` and connects it to the channel.
+		Raises ValueError if the channel exists with a different mode.
+		
+		:param channel: The name of the channel. All buses with the same channel are connected.
+		
+		:param deterministic: If True, the messages are delivered only when ``process`` is called. All buses of a channel must use the same mode.
+		
+		:param receive_own_messages: If True, the bus receives its own messages too.
+		
+		:param can_filters: The acceptance filters, see ``can.BusABC.set_filters``.
+		
+		:raises: ValueError
+		"""
+		self.channel_info = "Loopback channel " + str(channel)
+		self._receive_own_messages = receive_own_messages
+		self._listeners = ()
+		self._queue = collections.deque()
+		self._queue_condition = threading.Condition()
+		self._is_shutdown = False
+		can.BusABC.__init__(self, channel, can_filters, **config)
+		
+		with LoopbackBus._channels_lock:
+			channel_object = LoopbackBus._channels.get(channel)
+			if channel_object == None:
+				channel_object = _Channel(channel, deterministic)
+				LoopbackBus._channels[channel] = channel_object
+			elif channel_object.deterministic != bool(deterministic):
+				raise ValueError()
+			channel_object.add(self)
+		self._channel = channel_object
+	
+	def send(self, msg, timeout = None):
+		""" Sends a message to all other buses of the channel. The message is copied, thus it may be modified and reused after this call.
+		Raises can.CanError if the bus is shut down.
+		
+		:param msg: The message to send.
+		
+		:param timeout: Ignored.
+		
+		:raises: can.CanError
+		"""
+		if self._is_shutdown:
+			raise can.CanError("Bus is shut down")
+		message = copy.copy(msg)
+		message.data = bytearray(msg.data)
+		message.timestamp = time.time()
+		message.channel = self._channel.name
+		self._channel.put(self, message)
+	
+	def process(self):
+		""" Delivers all pending messages of the channel in the deterministic mode, including the messages sent during the delivery.
+		In the default mode, nothing is done.
+		
+		:returns: The number of delivered messages.
+		"""
+		if not self._channel.deterministic:
+			return 0
+		return self._channel.process()
+	
+	def shutdown(self):
+		""" Disconnects the bus from the channel.
+		"""
+		if self._is_shutdown:
+			return
+		self._is_shutdown = True
+		with LoopbackBus._channels_lock:
+			if self._channel.remove(self):
+				del LoopbackBus._channels[self._channel.name]
+		with self._queue_condition:
+			self._queue_condition.notify_all()
+		can.BusABC.shutdown(self)
+	
+	def add_listener(self, listener):
+		""" Adds a listener, to which the received messages are passed directly instead of queueing them for ``recv``.
+		
+		:param listener: A ``can.Listener``.
+		"""
+		self._listeners = self._listeners + (listener,)
+	
+	def remove_listener(self, listener):
+		""" Removes a listener.
+		Raises ValueError if the listener is not found.
+		
+		:param listener: A ``can.Listener``.
+		
+		:raises: ValueError
+		"""
+		listeners = list(self._listeners)
+		listeners.remove(listener)
+		self._listeners = tuple(listeners)
+	
+	def _receive(self, message):
+		if not self._matches_filters(message):
+			return
+		listeners = self._listeners
+		if listeners:
+			for listener in listeners:
+				try:
+					listener.on_message_received(message)
+				except:
+					pass
+		else:
+			with self._queue_condition:
+				self._queue.append(message)
+				self._queue_condition.notify()
+	
+	def _recv_internal(self, timeout):
+		with self._queue_condition:
+			if not self._queue and not self._is_shutdown:
+				self._queue_condition.wait(timeout)
+			if self._queue:
+				return self._queue.popleft(), True
+		return None, True
+	
+	@property
+	def deterministic(self):
+		""" Returns True if the channel uses the deterministic mode.
+		"""
+		return self._channel.deterministic
+
+
+class LoopbackNotifier(object):
+	""" Counterpart of ``can.Notifier`` for a ``LoopbackBus``. The listeners are registered at the bus and called directly by the channel.
+	"""
+	def __init__(self, bus, listeners):
+		""" Registers the listeners at the bus.
+		
+		:param bus: A ``LoopbackBus``.
+		
+		:param listeners: A list of ``can.Listener``.
+		"""
+		self._bus = bus
+		self._listeners = list(listeners)
+		for listener in self._listeners:
+			bus.add_listener(listener)
+	
+	def stop(self, timeout = None):
+		""" Removes the listeners from the bus.
+		
+		:param timeout: Ignored.
+		"""
+		for listener in self._listeners:
+			self._bus.remove_listener(listener)
+		self._listeners = []
+
+
+class _Channel(object):
+	def __init__(self, name, deterministic):
+		self.name = name
+		self.deterministic = bool(deterministic)
+		self._buses = ()
+		self._pending = collections.deque()
+		self._condition = threading.Condition()
+		self._processing = False
+		self._thread = None
+	
+	def add(self, bus):
+		self._buses = self._buses + (bus,)
+		if not self.deterministic and self._thread == None:
+			self._thread = threading.Thread(target = self._run, daemon = True)
+			self._thread.start()
+	
+	def remove(self, bus):
+		""" Removes the bus and returns True if the channel is empty. """
+		self._buses = tuple(b for b in self._buses if b is not bus)
+		if self._buses:
+			return False
+		with self._condition:
+			self._thread = None
+			self._condition.notify_all()
+		return True
+	
+	def put(self, sender, message):
+		with self._condition:
+			self._pending.append((sender, message))
+			self._condition.notify()
+	
+	def process(self):
+		with self._condition:
+			if self._processing:
+				# Called from a callback, the outer call delivers the messages
+				return 0
+			self._processing = True
+		count = 0
+		try:
+			while True:
+				with self._condition:
+					if not self._pending:
+						return count
+					sender, message = self._pending.popleft()
+				self._deliver(sender, message)
+				count += 1
+		finally:
+			with self._condition:
+				self._processing = False
+	
+	def _deliver(self, sender, message):
+		for bus in self._buses:
+			if bus is not sender or bus._receive_own_messages:
+				bus._receive(message)
+	
+	def _run(self):
+		thread = threading.current_thread()
+		while True:
+			with self._condition:
+				while not self._pending and self._thread is thread:
+					self._condition.wait()
+				if self._thread is not thread:
+					return
+				sender, message = self._pending.popleft()
+			self._deliver(sender, message)
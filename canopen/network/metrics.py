@@ -0,0 +1,125 @@
+import bisect
+import sys
+import threading
+import traceback
+
+
+class Metrics(object):
+	""" Traffic metrics of a ``Network``.
+	
+	If a ``Metrics`` object is passed to a ``Network``, it counts the received and sent frames per identifier, the received frames without subscriber and the exceptions raised by callbacks of the network and the services.
+	Additionally, it records histograms of the execution time of the callbacks and of the latency between the reception of a message (``message.timestamp``) and its dispatch.
+	
+	All values are read with ``snapshot``. The recording takes only a few dictionary and list operations per message, thus it may be left enabled in production.
+	"""
+	#: The upper bounds of the histogram buckets in seconds. The last bucket counts all greater values.
+	BOUNDS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0)
+	
+	def __init__(self):
+		""" Initializes an empty ``Metrics`` object.
+		"""
+		self._lock = threading.Lock()
+		self.reset()
+	
+	def reset(self):
+		""" Resets all counters and histograms.
+		"""
+		with self._lock:
+			self._rx = {}
+			self._tx = {}
+			self._unsubscribed = 0
+			self._exceptions = 0
+			self._last_traceback = None
+			self._callback_time = _Histogram()
+			self._latency = _Histogram()
+	
+	def snapshot(self):
+		""" Returns a snapshot of all metrics as a dictionary with the following keys:
+		
+		* "rx": dictionary of the identifier to the number of received frames
+		* "tx": dictionary of the identifier to the number of sent frames
+		* "unsubscribed": the number of received frames without subscriber
+		* "exceptions": the number of exceptions raised by callbacks
+		* "last_traceback": the formatted traceback of the last exception or None
+		* "callback_time": histogram of the execution time of the callbacks
+		* "latency": histogram of the time between the reception and the dispatch of the messages
+		
+		The identifiers of extended frames are marked with bit 29, like COB IDs. Each histogram is a dictionary with the keys "bounds", "counts", "count", "sum" and "max". The times are in seconds.
+		"""
+		with self._lock:
+			return {
+				"rx": dict(self._rx),
+				"tx": dict(self._tx),
+				"unsubscribed": self._unsubscribed,
+				"exceptions": self._exceptions,
+				"last_traceback": self._last_traceback,
+				"callback_time": self._callback_time.snapshot(),
+				"latency": self._latency.snapshot()}
+	
+	def record_rx(self, message, subscribed):
+		""" Records a received message.
+		
+		:param message: The received message.
+		
+		:param subscribed: True if there is at least one subscriber for the message.
+		"""
+		key = message.arbitration_id | (1 << 29) if message.is_extended_id else message.arbitration_id
+		with self._lock:
+			self._rx[key] = self._rx.get(key, 0) + 1
+			if not subscribed:
+				self._unsubscribed += 1
+	
+	def record_tx(self, message):
+		""" Records a sent message.
+		
+		:param message: The sent message.
+		"""
+		key = message.arbitration_id | (1 << 29) if message.is_extended_id else message.arbitration_id
+		with self._lock:
+			self._tx[key] = self._tx.get(key, 0) + 1
+	
+	def record_exception(self, exception = None):
+		""" Records an exception with its traceback.
+		
+		:param exception: The exception. If None, the exception which is currently handled is recorded, thus it must be called inside an except clause.
+		"""
+		if exception == None:
+			exception = sys.exc_info()[1]
+		text = "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+		with self._lock:
+			self._exceptions += 1
+			self._last_traceback = text
+	
+	def record_callback_time(self, seconds):
+		""" Records the execution time of a callback.
+		
+		:param seconds: The execution time in seconds.
+		"""
+		with self._lock:
+			self._callback_time.add(seconds)
+	
+	def record_latency(self, seconds):
+		""" Records the time between the reception and the dispatch of a message.
+		
+		:param seconds: The latency in seconds.
+		"""
+		with self._lock:
+			self._latency.add(seconds)
+
+
+class _Histogram(object):
+	def __init__(self):
+		self.counts = [0] * (len(Metrics.BOUNDS) + 1)
+		self.count = 0
+		self.sum = 0.0
+		self.max = 0.0
+	
+	def add(self, value):
+		self.counts[bisect.bisect_left(Metrics.BOUNDS, value)] += 1
+		self.count += 1
+		self.sum += value
+		if value > self.max:
+			self.max = value
+	
+	def snapshot(self):
+		return {"bounds": Metrics.BOUNDS, "counts": list(self.counts), "count": self.count, "sum": self.sum, "max": self.max}
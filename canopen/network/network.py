@@ -1,6 +1,14 @@
 import collections
+import threading
+import time
 import can
 import canopen
+from .capture import CaptureWriter
+from .executor import Executor
+from .filters import acceptance_filters
+from .loopback import LoopbackBus, LoopbackNotifier
+from .metrics import Metrics
+from .transmitqueue import TransmitQueue
 
 
 class Network(collections.abc.Collection):
@@ -11,13 +19,45 @@ class Network(collections.abc.Collection):
 	To use Network together with a CAN bus, first the CAN bus instance must be created and then the network attached to the bus.
 	In the end, the network may be detached from the CAN bus.
 	"""
-	def __init__(self):
+	def __init__(self, executor = None, transmit_queue = None, metrics = None):
 		""" Initialises a ``Network``
+		Raises TypeError if the executor is not None and not an instance of ``Executor``.
+		Raises TypeError if the transmit queue is not None and not an instance of ``TransmitQueue``.
+		Raises TypeError if the metrics are not None and not an instance of ``Metrics``.
+		
+		:param executor: The executor to run the callbacks with. If None, the callbacks are called by the thread which passes the messages to ``on_message``.
+		
+		:param transmit_queue: The transmit queue to send the messages with. If None, the messages are sent directly by the thread calling ``send``.
+		
+		:param metrics: The ``Metrics`` to record the traffic and the callbacks in. If None, nothing is recorded.
+		
+		:raises: TypeError
 		"""
+		if executor != None and not isinstance(executor, Executor):
+			raise TypeError()
+		if transmit_queue != None and not isinstance(transmit_queue, TransmitQueue):
+			raise TypeError()
+		if metrics != None and not isinstance(metrics, Metrics):
+			raise TypeError()
+		
+		self._executor = executor
+		self._transmit_queue = transmit_queue
+		self._metrics = metrics
+		self._recorder = None
 		self._bus = None
 		self._listeners = [MessageListener(self)]
 		self._notifier = None
-		self._subscribers = {}
+		# Immutable tuples of callbacks, one slot for each of the 2048 standard identifiers and a sparse mapping for the extended identifiers.
+		# The tuples are replaced (copy-on-write) on subscribe and unsubscribe, thus on_message can iterate over them without locking.
+		self._subscribers_standard = [()] * 2048
+		self._subscribers_extended = {}
+		self._subscribers_lock = threading.Lock()
+		
+		self._auto_filters = False
+		self._filters_delay = 0.05
+		self._filters_pending = False
+		self._filters_lock = threading.Lock()
+		self._filters_update_lock = threading.Lock()
 		
 		self._items_id = {}
 		self._items_name = {}
@@ -96,7 +136,7 @@ class Network(collections.abc.Collection):
 		self._items_id[node.id] = node
 		self._items_name[node.name] = node
 	
-	def attach(self, bus, builtin_notifier = True):
+	def attach(self, bus, builtin_notifier = True, auto_filters = False):
 		""" Attach the network to a CAN bus.
 		Raises TypeError if the bus is not a subclass of can.BusABC
 		Raises ValueError if the network is already attached to the bus.
@@ -105,6 +145,8 @@ class Network(collections.abc.Collection):
 		
 		:param builtin_notifier: Use the builtin notifier or not. If False, all (relevant) CAN messages must be passed to on_message.
 		
+		:param auto_filters: If True, the acceptance filters of the bus are set to the identifiers of the subscribed messages and updated on every change of the subscriptions.
+		
 		:raises: TypeError, ValueError
 		"""
 		if not isinstance(bus, can.BusABC):
@@ -115,8 +157,17 @@ class Network(collections.abc.Collection):
 			self.detach()
 		
 		self._bus = bus
+		if self._transmit_queue != None:
+			self._transmit_queue.attach(bus)
+		if auto_filters:
+			with self._filters_update_lock:
+				self._auto_filters = True
+			self._update_filters()
 		if builtin_notifier:
-			self._notifier = can.Notifier(self._bus, self._listeners)
+			if isinstance(bus, LoopbackBus):
+				self._notifier = LoopbackNotifier(self._bus, self._listeners)
+			else:
+				self._notifier = can.Notifier(self._bus, self._listeners)
 	
 	def detach(self):
 		""" Detach the network from a CAN bus.
@@ -130,6 +181,12 @@ class Network(collections.abc.Collection):
 		if self._notifier != None:
 			self._notifier.stop()
 			self._notifier = None
+		with self._filters_update_lock:
+			if self._auto_filters:
+				self._auto_filters = False
+				self._bus.set_filters(None)
+		if self._transmit_queue != None:
+			self._transmit_queue.detach()
 		self._bus = None
 	
 	def is_attached(self):
@@ -138,7 +195,7 @@ class Network(collections.abc.Collection):
 		return self._bus != None
 	
 	def send(self, message):
-		""" Sends a CAN message on the CAN bus.
+		""" Sends a CAN message on the CAN bus. If the network has a transmit queue, the message is queued.
 		Raises RuntimeError if the network is not attached to a bus.
 		
 		:param message: The message to send.
@@ -148,28 +205,76 @@ class Network(collections.abc.Collection):
 		if not self.is_attached():
 			raise RuntimeError()
 		
-		self._bus.send(message)
+		if self._transmit_queue != None:
+			self._transmit_queue.submit(message)
+		else:
+			self._bus.send(message)
+		if self._metrics != None:
+			self._metrics.record_tx(message)
+		# The recorder is read once, as it may be removed concurrently
+		recorder = self._recorder
+		if recorder != None:
+			recorder.write(message, True)
 	
-	def subscribe(self, callback, message_id):
+	def send_many(self, messages):
+		""" Sends a sequence of CAN messages on the CAN bus in the given order.
+		The attachment is checked once for the whole sequence, thus a burst of messages, like the PDOs of a cycle, is handed to the bus without any overhead between the messages.
+		Raises RuntimeError if the network is not attached to a bus.
+		
+		:param messages: An iterable of the messages to send.
+		
+		:raises: RuntimeError
+		"""
+		bus = self._bus
+		if bus == None:
+			raise RuntimeError()
+		
+		if self._transmit_queue != None:
+			send = self._transmit_queue.submit
+		else:
+			send = bus.send
+		metrics = self._metrics
+		recorder = self._recorder
+		for message in messages:
+			send(message)
+			if metrics != None:
+				metrics.record_tx(message)
+			if recorder != None:
+				recorder.write(message, True)
+	
+	def subscribe(self, callback, message_id, extended = False):
 		""" Adds a callback for messages with a specific message id to the network.
 		Raises TypeError if callback is not callable
+		Raises ValueError if the message identifier is out of range.
 		
 		:param callback: The function to call with the matching messages.
 		
 		:param message_id: The identifier of the messages for which the callback should be called.
+			Must be in range 0x000 ... 0x7FF for standard frames or 0x00000000 ... 0x1FFFFFFF for extended frames.
 		
-		:raises: TypeError
+		:param extended: True if the callback should be called for extended frames, False for standard frames.
+		
+		:raises: TypeError, ValueError
 		"""
 		if not callable(callback):
 			raise TypeError()
 		
 		message_id = int(message_id)
 		
-		if message_id not in self._subscribers:
-			self._subscribers[message_id] = []
-		self._subscribers[message_id].append(callback)
+		with self._subscribers_lock:
+			if extended:
+				if message_id < 0 or message_id > 0x1FFFFFFF:
+					raise ValueError()
+				self._subscribers_extended[message_id] = self._subscribers_extended.get(message_id, ()) + (callback,)
+			else:
+				if message_id < 0 or message_id > 0x7FF:
+					raise ValueError()
+				self._subscribers_standard[message_id] = self._subscribers_standard[message_id] + (callback,)
+		
+		if self._auto_filters:
+			self._schedule_filters()
 	
-	def unsubscribe(self, callback, message_id):
+	def unsubscribe(self, callback, message_id, extended = False):
 		""" Removes a callback for messagees with a specific message id from the network.
 		Raises KeyError if there are no callbacks for the message identifier.
 		Raises ValueError if the callback is not in the list of callbacks for the message identifier.
@@ -178,22 +283,143 @@ class Network(collections.abc.Collection):
 		
 		:param message_id: The identifier of the messages.
 		
+		:param extended: True if the callback was added for extended frames, False for standard frames.
+		
 		:raises: KeyError, ValueError
-		"""		
-		self._subscribers[message_id].remove(callback)
+		"""
+		message_id = int(message_id)
+		
+		with self._subscribers_lock:
+			if extended:
+				callbacks = self._subscribers_extended[message_id]
+			else:
+				if message_id < 0 or message_id > 0x7FF or not self._subscribers_standard[message_id]:
+					raise KeyError()
+				callbacks = self._subscribers_standard[message_id]
+			
+			i = callbacks.index(callback)
+			callbacks = callbacks[:i] + callbacks[i + 1:]
+			
+			if extended:
+				if callbacks:
+					self._subscribers_extended[message_id] = callbacks
+				else:
+					del self._subscribers_extended[message_id]
+			else:
+				self._subscribers_standard[message_id] = callbacks
+		
+		if self._auto_filters:
+			self._schedule_filters()
 	
 	def on_message(self, message):
 		""" Handler for received messages.
 		This method distributes the message to the callbacks. All (relevant) message must be passed to this handler if ``Network.attach`` was called with ``builtin_notifier`` set to ``False``.
 		"""
-		if message.arbitration_id not in self._subscribers:
+		# The recorder is read once, as it may be removed concurrently
+		recorder = self._recorder
+		if recorder != None:
+			recorder.write(message, False)
+		
+		if message.is_extended_id:
+			callbacks = self._subscribers_extended.get(message.arbitration_id, ())
+		elif 0 <= message.arbitration_id <= 0x7FF:
+			callbacks = self._subscribers_standard[message.arbitration_id]
+		else:
+			# Invalid standard identifier, which must not wrap around in the table
+			callbacks = ()
+		
+		if self._metrics != None:
+			self._metrics.record_rx(message, bool(callbacks))
+		
+		if self._executor == None:
+			self._dispatch(callbacks, message)
+		elif callbacks:
+			self._executor.submit(message.arbitration_id, self._dispatch, callbacks, message)
+	
+	def _schedule_filters(self):
+		""" Schedules an update of the acceptance filters. All changes of the subscriptions within the debounce interval are merged into one update.
+		The update is called by a worker of the shared scheduler, thus the computation does not delay the other timers of the scheduler.
+		"""
+		with self._filters_lock:
+			if self._filters_pending:
+				return
+			self._filters_pending = True
+		
+		canopen.util.Scheduler.default().call_later(self._filters_delay, self._update_filters)
+	
+	def _update_filters(self):
+		""" Sets the acceptance filters of the bus to the identifiers of the subscribed messages. """
+		with self._filters_update_lock:
+			with self._filters_lock:
+				self._filters_pending = False
+			if not self._auto_filters:
+				return
+			
+			with self._subscribers_lock:
+				standard = [message_id for message_id, callbacks in enumerate(self._subscribers_standard) if callbacks]
+				extended = list(self._subscribers_extended)
+			
+			self._bus.set_filters(acceptance_filters(standard) + acceptance_filters(extended, True))
+	
+	def _dispatch(self, callbacks, message):
+		metrics = self._metrics
+		if metrics != None:
+			self._dispatch_metrics(metrics, callbacks, message)
 			return
 		
-		for callback in self._subscribers[message.arbitration_id]:
+		for callback in callbacks:
 			try:
 				callback(message)
 			except:
 				pass
+	
+	def _dispatch_metrics(self, metrics, callbacks, message):
+		if not callbacks:
+			return
+		if message.timestamp:
+			metrics.record_latency(max(time.time() - message.timestamp, 0.0))
+		for callback in callbacks:
+			start = time.perf_counter()
+			try:
+				callback(message)
+			except:
+				metrics.record_exception()
+			metrics.record_callback_time(time.perf_counter() - start)
+	
+	@property
+	def executor(self):
+		""" Returns the executor of the network or None, if the callbacks are called directly.
+		"""
+		return self._executor
+	
+	@property
+	def metrics(self):
+		""" Returns the metrics of the network or None.
+		"""
+		return self._metrics
+	
+	@property
+	def recorder(self):
+		""" Returns the ``CaptureWriter``, which records all received and sent messages, or None.
+		"""
+		return self._recorder
+	
+	@recorder.setter
+	def recorder(self, recorder):
+		""" Sets the ``CaptureWriter`` to record all received and sent messages with. None stops the recording. The previous writer is not closed.
+		Raises TypeError if the recorder is not None and not an instance of ``CaptureWriter``.
+		
+		:raises: TypeError
+		"""
+		if recorder != None and not isinstance(recorder, CaptureWriter):
+			raise TypeError()
+		self._recorder = recorder
+	
+	@property
+	def transmit_queue(self):
+		""" Returns the transmit queue of the network or None.
+		"""
+		return self._transmit_queue
 
 
 class MessageListener(can.Listener):
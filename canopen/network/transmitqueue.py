@@ -0,0 +1,252 @@
+import copy
+import heapq
+import itertools
+import threading
+import time
+
+
+class TransmitQueue(object):
+	""" Transmit queue for the messages of a ``Network``.
+	
+	The messages are queued and sent by a worker thread in the order of the CAN arbitration, i.e. the message with the lowest identifier first. Messages of the same identifier are sent in the order of submission.
+	Optionally, the bus load is limited by a budget in frames per second, in bits per second or both. The number of bits of a frame is calculated without stuff bits.
+	
+	For each priority class the number of sent messages and the latency between submission and transmission is recorded. The priority class of a standard frame is the function code, i.e. the upper 4 bits of the identifier. For an extended frame it is the upper 4 bits of the 29 bit identifier.
+	"""
+	def __init__(self, frames_per_second = None, bits_per_second = None, queue_depth = 1024):
+		""" Initializes a ``TransmitQueue`` and starts the worker thread.
+		
+		:param frames_per_second: The maximum number of frames per second or None for no limit.
+		
+		:param bits_per_second: The maximum number of bits per second or None for no limit.
+		
+		:param queue_depth: The maximum number of pending messages. If the queue is full, the sender blocks until there is space in the queue. Must be a positive integer.
+		
+		:raises: ValueError
+		"""
+		if frames_per_second != None and frames_per_second <= 0:
+			raise ValueError()
+		if bits_per_second != None and bits_per_second <= 0:
+			raise ValueError()
+		if int(queue_depth) < 1:
+			raise ValueError()
+		
+		self._frames_per_second = frames_per_second
+		self._bits_per_second = bits_per_second
+		self._queue_depth = int(queue_depth)
+		
+		# Allow a burst of 10 ms, but at least one frame of maximum size
+		self._frames_capacity = None
+		self._frames_tokens = 0
+		if frames_per_second != None:
+			self._frames_capacity = max(frames_per_second * 0.01, 1)
+			self._frames_tokens = self._frames_capacity
+		self._bits_capacity = None
+		self._bits_tokens = 0
+		if bits_per_second != None:
+			self._bits_capacity = max(bits_per_second * 0.01, _frame_bits(True, False, 8))
+			self._bits_tokens = self._bits_capacity
+		self._refill_time = time.monotonic()
+		
+		self._bus = None
+		self._queue = []
+		self._sequence = itertools.count()
+		self._sending = False
+		self._lock = threading.Lock()
+		self._changed = threading.Condition(self._lock)
+		self._terminate = False
+		self._dropped = 0
+		self._errors = 0
+		self._statistics = {}
+		
+		self._thread = threading.Thread(target = self._run, daemon = True)
+		self._thread.start()
+	
+	def attach(self, bus):
+		""" Sets the bus to send the messages on. Called by ``Network.attach``.
+		
+		:param bus: The bus.
+		"""
+		with self._lock:
+			self._bus = bus
+	
+	def detach(self):
+		""" Removes the bus. Pending messages are discarded and counted as dropped. Called by ``Network.detach``.
+		"""
+		with self._lock:
+			self._bus = None
+			self._dropped += len(self._queue)
+			self._queue.clear()
+			self._changed.notify_all()
+	
+	def submit(self, message):
+		""" Queues a message for transmission. The message is copied, thus it may be modified and reused after this call.
+		Raises RuntimeError if the transmit queue is stopped or not attached to a bus.
+		
+		:param message: The message to send.
+		
+		:raises: RuntimeError
+		"""
+		item = copy.copy(message)
+		item.data = bytearray(message.data)
+		if item.is_extended_id:
+			key = ((item.arbitration_id >> 18) << 19) | (1 << 18) | (item.arbitration_id & 0x3FFFF)
+		else:
+			key = item.arbitration_id << 19
+		
+		with self._lock:
+			while len(self._queue) >= self._queue_depth and self._bus != None and not self._terminate:
+				self._changed.wait()
+			if self._terminate or self._bus == None:
+				raise RuntimeError()
+			
+			heapq.heappush(self._queue, (key, next(self._sequence), time.monotonic(), item))
+			self._changed.notify_all()
+	
+	def flush(self, timeout = None):
+		""" Waits until all queued messages are sent.
+		
+		:param timeout: The time to wait in seconds, or ``None``
+		
+		:returns: True if the queue is empty, False if the timeout occured.
+		"""
+		with self._lock:
+			return self._changed.wait_for(lambda: not self._queue and not self._sending, timeout)
+	
+	def stop(self):
+		""" Stops the worker thread. Pending messages are discarded and counted as dropped.
+		"""
+		with self._lock:
+			self._terminate = True
+			self._dropped += len(self._queue)
+			self._queue.clear()
+			self._changed.notify_all()
+		if self._thread is not threading.current_thread():
+			self._thread.join()
+	
+	def reset_statistics(self):
+		""" Resets the statistics of all priority classes.
+		"""
+		with self._lock:
+			self._statistics = {}
+	
+	@property
+	def bits_per_second(self):
+		""" Returns the budget in bits per second or None.
+		"""
+		return self._bits_per_second
+	
+	@property
+	def dropped(self):
+		""" Returns the number of messages discarded on detach or stop.
+		"""
+		return self._dropped
+	
+	@property
+	def errors(self):
+		""" Returns the number of messages, for which the bus raised an exception.
+		"""
+		return self._errors
+	
+	@property
+	def frames_per_second(self):
+		""" Returns the budget in frames per second or None.
+		"""
+		return self._frames_per_second
+	
+	@property
+	def pending(self):
+		""" Returns the number of queued messages.
+		"""
+		return len(self._queue)
+	
+	@property
+	def queue_depth(self):
+		""" Returns the maximum number of pending messages.
+		"""
+		return self._queue_depth
+	
+	@property
+	def statistics(self):
+		""" Returns the statistics as a dictionary of the priority classes, which have sent messages.
+		Each value is a dictionary with the keys "count", "latency_mean" and "latency_max". The latencies are in seconds.
+		"""
+		with self._lock:
+			return {c: {"count": s[0], "latency_mean": s[1] / s[0], "latency_max": s[2]} for c, s in self._statistics.items()}
+	
+	def _refill(self):
+		now = time.monotonic()
+		elapsed = now - self._refill_time
+		self._refill_time = now
+		if self._frames_capacity != None:
+			self._frames_tokens = min(self._frames_capacity, self._frames_tokens + elapsed * self._frames_per_second)
+		if self._bits_capacity != None:
+			self._bits_tokens = min(self._bits_capacity, self._bits_tokens + elapsed * self._bits_per_second)
+	
+	def _delay(self, bits):
+		""" Returns the time until the budget allows to send a frame with the given number of bits. """
+		delay = 0
+		if self._frames_capacity != None and self._frames_tokens < 1:
+			delay = (1 - self._frames_tokens) / self._frames_per_second
+		if self._bits_capacity != None and self._bits_tokens < bits:
+			delay = max(delay, (bits - self._bits_tokens) / self._bits_per_second)
+		return delay
+	
+	def _run(self):
+		while True:
+			with self._lock:
+				while True:
+					if self._terminate:
+						return
+					if not self._queue or self._bus == None:
+						self._changed.wait()
+						continue
+					
+					# Peek only, because a message with a higher priority may be submitted while waiting for the budget
+					message = self._queue[0][3]
+					bits = _frame_bits(message.is_extended_id, message.is_remote_frame, message.dlc)
+					self._refill()
+					delay = self._delay(bits)
+					if delay > 0:
+						self._changed.wait(delay)
+						continue
+					break
+				
+				key, sequence, submitted, message = heapq.heappop(self._queue)
+				if self._frames_capacity != None:
+					self._frames_tokens -= 1
+				if self._bits_capacity != None:
+					self._bits_tokens -= bits
+				bus = self._bus
+				self._sending = True
+				self._changed.notify_all()
+			
+			latency = None
+			try:
+				bus.send(message)
+				latency = time.monotonic() - submitted
+			except:
+				pass
+			
+			with self._lock:
+				if latency == None:
+					self._errors += 1
+				else:
+					priority_class = key >> 26
+					statistics = self._statistics.get(priority_class)
+					if statistics == None:
+						self._statistics[priority_class] = [1, latency, latency]
+					else:
+						statistics[0] += 1
+						statistics[1] += latency
+						statistics[2] = max(statistics[2], latency)
+				self._sending = False
+				self._changed.notify_all()
+
+
+def _frame_bits(extended, remote, dlc):
+	""" Returns the number of bits of a frame without stuff bits, including the interframe space. """
+	bits = 67 if extended else 47
+	if not remote:
+		bits += 8 * min(dlc, 8)
+	return bits
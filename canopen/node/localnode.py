@@ -74,18 +74,7 @@ class LocalNode(Node):
 		:raises: KeyError
 		"""
 		if not (index, subindex) in self._data:
-			try:
-				item = self._dictionary[index]
-			except:
-				raise KeyError()
-				
-			if not isinstance(item, canopen.objectdictionary.Variable):
-				try:
-					item = item[subindex]
-				except:
-					raise KeyError()
-			
-			return item.default_value
+			return self._dictionary.variable(index, subindex).default_value
 		else:
 			return self._data[(index, subindex)]
 	
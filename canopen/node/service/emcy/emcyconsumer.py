@@ -40,7 +40,7 @@ class EMCYConsumer(Service):
 			self.detach()
 		
 		if cob_id_emcy & (1 << 29):
-			self._node.network.subscribe(self.on_emcy, cob_id_emcy & 0x1FFFFFFF)
+			self._node.network.subscribe(self.on_emcy, cob_id_emcy & 0x1FFFFFFF, True)
 		else:
 			self._node.network.subscribe(self.on_emcy, cob_id_emcy & 0x7FF)
 		
@@ -56,7 +56,7 @@ class EMCYConsumer(Service):
 			raise RuntimeError()
 		
 		if self._cob_id_emcy & (1 << 29):
-			self._node.network.unsubscribe(self.on_emcy, self._cob_id_emcy & 0x1FFFFFFF)
+			self._node.network.unsubscribe(self.on_emcy, self._cob_id_emcy & 0x1FFFFFFF, True)
 		else:
 			self._node.network.unsubscribe(self.on_emcy, self._cob_id_emcy & 0x7FF)
 		
@@ -70,8 +70,6 @@ class EMCYConsumer(Service):
 	def on_emcy(self, message):
 		if not self._enabled:
 			return
-		if message.is_extended_id != bool(self._cob_id_emcy & (1 << 29)):
-			return
 		
 		error_code, error_register, data = struct.unpack("<HB5s", message.data)
 		
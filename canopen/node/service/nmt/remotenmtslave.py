@@ -27,6 +27,7 @@ class RemoteNMTSlave(Service):
 		self.add_event("heartbeat")
 		self.add_event("guarding")
 		self._identifier_ec = None
+		self._guard_request = None
 		
 		# The state and toggle bit of the next guarding response is unknown, but maybe the node is in initialization state. Pretend there was a previous guarding response with the inverted toggle bit.
 		self._state = INITIALIZATION
@@ -49,6 +50,7 @@ class RemoteNMTSlave(Service):
 		
 		self._node.network.subscribe(self.on_error_control, identifier_ec)
 		
+		self._guard_request = can.Message(arbitration_id = identifier_ec, is_extended_id = False, is_remote_frame = True, dlc = 1)
 		self._identifier_ec = identifier_ec
 	
 	def detach(self):
@@ -64,6 +66,7 @@ class RemoteNMTSlave(Service):
 		self._node.network.unsubscribe(self.on_error_control, self._identifier_ec)
 		
 		self._identifier_ec = None
+		self._guard_request = None
 	
 	def is_attached(self):
 		""" Returns True if the service is attached.
@@ -123,8 +126,7 @@ class RemoteNMTSlave(Service):
 	
 	def send_guard_request(self):
 		""" Sends a guard request. """
-		message = can.Message(arbitration_id = self._identifier_ec, is_extended_id = False, is_remote_frame = True, dlc = 1)
-		self._node.network.send(message)
+		self._node.network.send(self._guard_request)
 	
 	def timer_callback(self):
 		""" Handler for timer events. """
@@ -151,8 +153,7 @@ class RemoteNMTSlave(Service):
 			self._state = message.data[0] & 0x7F
 		self._toggle_bit = message.data[0] & 0x80
 		if self._heartbeat_time > 0:
-			self._timer.cancel()
-			self._timer.start(self._heartbeat_time, False)
+			self._timer.restart(self._heartbeat_time, False)
 	
 	@property
 	def state(self):
@@ -1,6 +1,23 @@
 from canopen.node.service.service import Service
 from canopen.node.service.mappedvariable import MappedVariable
-from canopen.objectdictionary import Variable
+from canopen.objectdictionary.datatypes import *
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+
+# The numpy type of the decoded values for each data type, which can be decoded in batches
+_array_types = {
+	BOOLEAN: "?",
+	INTEGER8: "<i1", INTEGER16: "<i2", INTEGER24: "<i4", INTEGER32: "<i4",
+	INTEGER40: "<i8", INTEGER48: "<i8", INTEGER56: "<i8", INTEGER64: "<i8",
+	UNSIGNED8: "<u1", UNSIGNED16: "<u2", UNSIGNED24: "<u4", UNSIGNED32: "<u4",
+	UNSIGNED40: "<u8", UNSIGNED48: "<u8", UNSIGNED56: "<u8", UNSIGNED64: "<u8",
+	REAL32: "<f4", REAL64: "<f8"}
+
+_signed_types = [INTEGER8, INTEGER16, INTEGER24, INTEGER32, INTEGER40, INTEGER48, INTEGER56, INTEGER64]
 
 
 class ObjectMapping(object):
@@ -61,15 +78,9 @@ class ObjectMapping(object):
 		# If the index does not belong to a dummy value (index < 0x20), use the variable of the dictionary
 		if index >= 0x20:
 			try:
-				variable = self._service.node.dictionary[index]
+				variable = self._service.node.dictionary.variable(index, subindex)
 			except:
 				raise ValueError()
-			
-			if not isinstance(variable, Variable):
-				try:
-					variable = variable[subindex]
-				except:
-					raise ValueError()
 		
 		self._items.append((variable, size))
 		self._size += size
@@ -80,6 +91,77 @@ class ObjectMapping(object):
 		self._items.clear()
 		self._size = 0
 	
+	def decode_array(self, data, columns = False):
+		""" Decodes a batch of frames with this mapping using numpy. Each frame is read as a little endian 64 bit integer, from which the mapped variables are extracted by shifting and masking, starting with the lowest bit. Dummy entries are skipped.
+		Raises ImportError if numpy is not installed.
+		Raises ValueError if the data is not a multiple of 8 bytes or an array of other elements than bytes, the mapping exceeds 64 bits, a mapped variable has a data type without a fixed size or two mapped variables have the same name.
+		
+		:param data: The payloads of the frames. Must be a bytes-like object with N * 8 bytes or a numpy array of N * 8 bytes of the type uint8 or int8, e.g. of the shape (N, 8).
+		
+		:param columns: If True, a dictionary with one array per mapped variable is returned. Otherwise a structured array with one field per mapped variable.
+		
+		:returns: A numpy structured array of length N or a dictionary of the names of the variables and arrays of length N.
+		
+		:raises: ImportError, ValueError
+		"""
+		if numpy == None:
+			raise ImportError()
+		if self._size > 64:
+			raise ValueError()
+		
+		if isinstance(data, numpy.ndarray):
+			# Wider elements would be truncated to bytes silently
+			if data.dtype not in (numpy.uint8, numpy.int8):
+				raise ValueError()
+			frames = numpy.ascontiguousarray(data).view(numpy.uint8).ravel()
+		else:
+			frames = numpy.frombuffer(data, dtype = numpy.uint8)
+		if len(frames) % 8:
+			raise ValueError()
+		raw = frames.view("<u8")
+		
+		result = {}
+		offset = 0
+		for variable, size in self._items:
+			if isinstance(variable, tuple) or variable.index < 0x20 or size == 0:
+				offset += size
+				continue
+			data_type = variable.data_type
+			if data_type not in _array_types:
+				raise ValueError()
+			# The results are keyed by name, thus a later variable would replace the column of an earlier one
+			if variable.name in result:
+				raise ValueError()
+			
+			value = raw >> numpy.uint64(offset)
+			if size < 64:
+				value = value & numpy.uint64((1 << size) - 1)
+			offset += size
+			
+			if data_type == BOOLEAN:
+				value = value != 0
+			elif data_type == REAL32:
+				value = value.astype("<u4").view("<f4")
+			elif data_type == REAL64:
+				value = value.view("<f8")
+			elif data_type in _signed_types:
+				value = value.view("<i8")
+				if size < 64:
+					# Sign extension of the lowest size bits
+					sign = 1 << (size - 1)
+					value = (value ^ sign) - sign
+				value = value.astype(_array_types[data_type])
+			else:
+				value = value.astype(_array_types[data_type])
+			result[variable.name] = value
+		
+		if columns:
+			return result
+		array = numpy.empty(len(raw), dtype = [(name, value.dtype) for name, value in result.items()])
+		for name, value in result.items():
+			array[name] = value
+		return array
+	
 	@property
 	def size(self):
 		""" Returns the overall number of bits of the mapped variables.
@@ -1,4 +1,5 @@
 import threading
+import canopen.util
 
 from canopen.node.service.sync import SYNCConsumer
 from canopen.node.service.objectmapping import ObjectMapping
@@ -24,12 +25,13 @@ class PDOConsumer(SYNCConsumer):
 			raise ValueError()
 		
 		SYNCConsumer.__init__(self, node)
-		self.add_event("pdo")
+		self._pdo_event = self.add_event("pdo")
 		self._cob_id_rx = None
 
 		self._transmission_type = int(transmission_type)
 		self._data = None
 		self._pdo_condition = threading.Condition()
+		self._pdo_async_condition = canopen.util.AsyncCondition()
 		
 		self.mapping = ObjectMapping(self)
 	
@@ -54,7 +56,7 @@ class PDOConsumer(SYNCConsumer):
 		SYNCConsumer.attach(self, cob_id_sync)
 		
 		if cob_id_rx & (1 << 29):
-			self._node.network.subscribe(self.on_pdo, cob_id_rx & 0x1FFFFFFF)
+			self._node.network.subscribe(self.on_pdo, cob_id_rx & 0x1FFFFFFF, True)
 		else:
 			self._node.network.subscribe(self.on_pdo, cob_id_rx & 0x7FF)
 		
@@ -66,7 +68,7 @@ class PDOConsumer(SYNCConsumer):
 		SYNCConsumer.detach(self)
 		
 		if self._cob_id_rx & (1 << 29):
-			self._node.network.unsubscribe(self.on_pdo, self._cob_id_rx & 0x1FFFFFFF)
+			self._node.network.unsubscribe(self.on_pdo, self._cob_id_rx & 0x1FFFFFFF, True)
 		else:
 			self._node.network.unsubscribe(self.on_pdo, self._cob_id_rx & 0x7FF)
 		
@@ -91,6 +93,17 @@ class PDOConsumer(SYNCConsumer):
 			gotit = self._pdo_condition.wait(timeout)
 		return gotit
 	
+	async def wait_for_pdo_async(self, timeout = None):
+		""" Awaitable variant of ``wait_for_pdo``. Waits for the reception of the PDO message, without blocking the event loop.
+		
+		:param timeout: The time to wait in seconds, or ``None``
+		
+		:returns: True if the PDO message was received, False if the timeout occured, or if the service is disabled
+		"""
+		if not self._enabled:
+			return False
+		return await self._pdo_async_condition.wait(timeout)
+	
 	def on_pdo(self, message):
 		"""
 		Handler for PDO messages.
@@ -99,12 +112,12 @@ class PDOConsumer(SYNCConsumer):
 			return
 		if message.is_remote_frame:
 			return
-		if message.is_extended_id != bool(self._cob_id_rx & (1 << 29)):
-			return
 		self._data = message.data
-		self.notify("pdo", self)
+		if self._pdo_event.callbacks:
+			self._pdo_event.notify(self)
 		with self._pdo_condition:
 			self._pdo_condition.notify_all()
+		self._pdo_async_condition.notify_all()
 	
 	@property
 	def data(self):
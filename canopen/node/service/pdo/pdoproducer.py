@@ -26,6 +26,7 @@ class PDOProducer(SYNCConsumer):
 		SYNCConsumer.__init__(self, node)
 		self.add_event("rtr")
 		self._cob_id_tx = None
+		self._message = None
 		
 		self._transmission_type = int(transmission_type)
 		self._data = None
@@ -51,10 +52,15 @@ class PDOProducer(SYNCConsumer):
 		SYNCConsumer.attach(self, cob_id_sync)
 		
 		if cob_id_tx & (1 << 29):
-			self._node.network.subscribe(self.on_pdo, cob_id_tx & 0x1FFFFFFF)
+			self._node.network.subscribe(self.on_pdo, cob_id_tx & 0x1FFFFFFF, True)
 		else:
 			self._node.network.subscribe(self.on_pdo, cob_id_tx & 0x7FF)
-			
+		
+		data = bytearray(self._data) if self._data != None else None
+		if cob_id_tx & (1 << 29):
+			self._message = can.Message(arbitration_id = cob_id_tx & 0x1FFFFFFF, is_extended_id = True, data = data)
+		else:
+			self._message = can.Message(arbitration_id = cob_id_tx & 0x7FF, is_extended_id = False, data = data)
 		self._cob_id_tx = int(cob_id_tx)
 		
 	def detach(self):
@@ -63,11 +69,12 @@ class PDOProducer(SYNCConsumer):
 		SYNCConsumer.detach(self)
 		
 		if self._cob_id_tx & (1 << 29):
-			self._node.network.unsubscribe(self.on_pdo, self._cob_id_tx & 0x1FFFFFFF)
+			self._node.network.unsubscribe(self.on_pdo, self._cob_id_tx & 0x1FFFFFFF, True)
 		else:
 			self._node.network.unsubscribe(self.on_pdo, self._cob_id_tx & 0x7FF)
 		
 		self._cob_id_tx = None
+		self._message = None
 	
 	def is_attached(self):
 		""" Returns True if the service is attached.
@@ -75,20 +82,21 @@ class PDOProducer(SYNCConsumer):
 		return self._cob_id_tx != None
 
 	def send(self):
+		""" Sends the PDO with the actual data.
+		Raises RuntimeError if no data is set.
+		
+		:raises: RuntimeError
+		"""
 		if self._data == None:
 			raise RuntimeError()
 		
-		if self._cob_id_tx & (1 << 29):
-			message = can.Message(arbitration_id = self._cob_id_tx & 0x1FFFFFFF, is_extended_id = True, data = self._data)
-		else:
-			message = can.Message(arbitration_id = self._cob_id_tx & 0x7FF, is_extended_id = False, data = self._data)
+		# The message is read once, as the data setter may replace it concurrently
+		message = self._message
 		self._node.network.send(message)
 	
 	def on_pdo(self, message):
 		if not message.is_remote_frame:
 			return
-		if message.is_extended_id != bool(self._cob_id_tx & (1 << 29)):
-			return
 		self.notify("rtr", self)
 	
 	@property
@@ -98,6 +106,18 @@ class PDOProducer(SYNCConsumer):
 	@data.setter
 	def data(self, data):
 		self._data = data
+		message = self._message
+		if message != None and data != None:
+			# A new message is swapped in, thus a message, which is just being sent, is never changed
+			self._message = can.Message(arbitration_id = message.arbitration_id, is_extended_id = message.is_extended_id, data = bytearray(data))
+	
+	@property
+	def message(self):
+		""" Returns the message of the PDO with the actual data, or None if the service is not attached.
+		It may be passed to ``Network.send_many`` to send the PDOs of several services at once.
+		The message is shared with the service and must be treated as read-only. A new message is swapped in when the data is set, thus later changes of the data do not affect the returned message.
+		"""
+		return self._message
 	
 	@property
 	def transmission_type(self):
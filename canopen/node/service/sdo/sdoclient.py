@@ -1,11 +1,11 @@
 import struct
 import can
 import threading
+import canopen.util
 
 from canopen.node.service import Service
 from canopen.sdo.abortcodes import TOGGLE_BIT_NOT_ALTERNATED, SDO_PROTOCOL_TIMED_OUT, COMMAND_SPECIFIER_NOT_VALID, GENERAL_ERROR, LENGTH_DOES_NOT_MATCH
 from canopen.sdo.exception import SDOAbortError
-from canopen.objectdictionary import Variable
 
 
 class SDOClient(Service):
@@ -34,6 +34,10 @@ class SDOClient(Service):
 		self._index = 0
 		self._subindex = 0
 		self._condition = threading.Condition()
+		self._async_condition = canopen.util.AsyncCondition()
+		# One lock serializes the synchronous and the awaitable transfers, as they share the transfer state
+		self._transfer_lock = threading.Lock()
+		self._transfer_released = canopen.util.AsyncCondition()
 		self._timeout = float(timeout)
 	
 	def attach(self, cob_id_rx = None, cob_id_tx = None):
@@ -63,7 +67,7 @@ class SDOClient(Service):
 		self._state = 0x80
 		
 		if cob_id_rx & (1 << 29):
-			self._node.network.subscribe(self.on_response, cob_id_rx & 0x1FFFFFFF)
+			self._node.network.subscribe(self.on_response, cob_id_rx & 0x1FFFFFFF, True)
 		else:
 			self._node.network.subscribe(self.on_response, cob_id_rx & 0x7FF)
 		
@@ -80,7 +84,7 @@ class SDOClient(Service):
 			raise RuntimeError()
 		
 		if self._cob_id_rx & (1 << 29):
-			self._node.network.unsubscribe(self.on_response, self._cob_id_rx & 0x1FFFFFFF)
+			self._node.network.unsubscribe(self.on_response, self._cob_id_rx & 0x1FFFFFFF, True)
 		else:
 			self._node.network.unsubscribe(self.on_response, self._cob_id_rx & 0x7FF)
 		
@@ -100,46 +104,44 @@ class SDOClient(Service):
 		
 		:raises: TimeoutError, SDOAbortError
 		"""
-		item = self._node.dictionary[index]
+		item = self._node.dictionary.variable(index, subindex)
 		
-		if not isinstance(item, Variable):
-			item = item[subindex]
+		self._transfer_lock.acquire()
+		try:
+			with self._condition:
+				self._initiate_upload(index, subindex)
+				
+				if not self._condition.wait(self._timeout):
+					self._abort(index, subindex, SDO_PROTOCOL_TIMED_OUT)
+					raise TimeoutError()
+				
+				return self._finish_upload(item)
+		finally:
+			self._release_transfer()
+	
+	async def upload_async(self, index, subindex):
+		""" Awaitable variant of ``upload``. Concurrent transfers of the same client are serialized, also against ``upload`` and ``download`` from other threads.
 		
-		with self._condition:
-			self._index = index
-			self._subindex = subindex
-			self._toggle_bit = 0x00
-			self._buffer = b""
-			
-			request_command = 0x40
-			request_data = b"\x00\x00\x00\x00"
-			
-			self._state = request_command
-			
-			d = struct.pack("<BHB4s", request_command, index, subindex, request_data)
-			if self._cob_id_tx & (1 << 29):
-				request = can.Message(arbitration_id = self._cob_id_tx & 0x1FFFFFFF, is_extended_id = True, data = d)
-			else:
-				request = can.Message(arbitration_id = self._cob_id_tx & 0x7FF, is_extended_id = False, data = d)
-			self._node.network.send(request)
+		:param index: An integer. Range 0x0000 ... 0xFFFF. The object index
+		
+		:param subindex: An integer. Range 0x00 ... 0xFF. The object subindex.
+		
+		:raises: TimeoutError, SDOAbortError
+		"""
+		item = self._node.dictionary.variable(index, subindex)
+		
+		await self._acquire_transfer_async()
+		try:
+			waiter = self._async_condition.waiter()
+			self._initiate_upload(index, subindex)
 			
-			if not self._condition.wait(self._timeout):
+			if not await self._async_condition.wait(self._timeout, waiter):
 				self._abort(index, subindex, SDO_PROTOCOL_TIMED_OUT)
 				raise TimeoutError()
 			
-			if self._state == 0x40:
-				try:
-					value = item.decode(self._buffer)
-				except:
-					self._abort(self._index, self._subindex, LENGTH_DOES_NOT_MATCH)
-					raise SDOAbortError(LENGTH_DOES_NOT_MATCH)
-				
-				self._state = 0x80
-				return value
-			else:
-				self._state = 0x80
-				#TODO: Get specific exception from lower half.
-				raise SDOAbortError(GENERAL_ERROR)
+			return self._finish_upload(item)
+		finally:
+			self._release_transfer()
 	
 	def download(self, index, subindex, value):
 		"""
@@ -151,43 +153,127 @@ class SDOClient(Service):
 		
 		:raises: TimeoutError, SDOAbortError
 		"""
-		item = self._node.dictionary[index]
+		item = self._node.dictionary.variable(index, subindex)
 		
-		if not isinstance(item, Variable):
-			item = item[subindex]
+		self._transfer_lock.acquire()
+		try:
+			with self._condition:
+				self._initiate_download(index, subindex, item.encode(value))
+				
+				if not self._condition.wait(self._timeout):
+					self._abort(index, subindex, SDO_PROTOCOL_TIMED_OUT)
+					raise TimeoutError()
+				
+				self._finish_download()
+		finally:
+			self._release_transfer()
+	
+	async def download_async(self, index, subindex, value):
+		""" Awaitable variant of ``download``. Concurrent transfers of the same client are serialized, also against ``upload`` and ``download`` from other threads.
 		
-		with self._condition:
-			self._index = index
-			self._subindex = subindex
-			self._buffer = item.encode(value)
-			self._data_size = len(self._buffer)
-			self._toggle_bit = 0x00
-			
-			if self._data_size > 0 and self._data_size <= 4: # Expedited transfer
-				request_command = 0x20 | ((4 - self._data_size) << 2) | (1 << 1) | (1 << 0)
-				request_data = self._buffer
-			else: # Segmented transfer
-				request_command = 0x20 | (1 << 0)
-				request_data = struct.pack("<L", self._data_size)
-			
-			self._state = request_command
-			
-			d = struct.pack("<BHB4s", request_command, index, subindex, request_data)
-			if self._cob_id_tx & (1 << 29):
-				request = can.Message(arbitration_id = self._cob_id_tx & 0x1FFFFFFF, is_extended_id = True, data = d)
-			else:
-				request = can.Message(arbitration_id = self._cob_id_tx & 0x7FF, is_extended_id = False, data = d)
-			self._node.network.send(request)
+		:param index: An integer. Range 0x0000 ... 0xFFFF. The object index
+		
+		:param subindex: An integer. Range 0x00 ... 0xFF. The object subindex.
+		
+		:param value: An object. The data to write
+		
+		:raises: TimeoutError, SDOAbortError
+		"""
+		item = self._node.dictionary.variable(index, subindex)
+		
+		await self._acquire_transfer_async()
+		try:
+			waiter = self._async_condition.waiter()
+			self._initiate_download(index, subindex, item.encode(value))
 			
-			if not self._condition.wait(self._timeout):
+			if not await self._async_condition.wait(self._timeout, waiter):
 				self._abort(index, subindex, SDO_PROTOCOL_TIMED_OUT)
 				raise TimeoutError()
 			
-			if self._state & 0xE0 != 0x20:
-				self._state = 0x80
-				#TODO: Get specific exception from lower half.
-				raise SDOAbortError(GENERAL_ERROR)
+			self._finish_download()
+		finally:
+			self._release_transfer()
+	
+	async def _acquire_transfer_async(self):
+		""" Acquires the transfer lock without blocking the event loop. """
+		while True:
+			# The waiter is registered before the attempt, thus a release in between is not lost
+			waiter = self._transfer_released.waiter()
+			if self._transfer_lock.acquire(False):
+				return
+			await self._transfer_released.wait(None, waiter)
+	
+	def _release_transfer(self):
+		self._transfer_lock.release()
+		self._transfer_released.notify_all()
+	
+	def _initiate_upload(self, index, subindex):
+		self._index = index
+		self._subindex = subindex
+		self._toggle_bit = 0x00
+		self._buffer = b""
+		
+		request_command = 0x40
+		request_data = b"\x00\x00\x00\x00"
+		
+		self._state = request_command
+		
+		d = struct.pack("<BHB4s", request_command, index, subindex, request_data)
+		if self._cob_id_tx & (1 << 29):
+			request = can.Message(arbitration_id = self._cob_id_tx & 0x1FFFFFFF, is_extended_id = True, data = d)
+		else:
+			request = can.Message(arbitration_id = self._cob_id_tx & 0x7FF, is_extended_id = False, data = d)
+		self._node.network.send(request)
+	
+	def _finish_upload(self, item):
+		if self._state == 0x40:
+			try:
+				value = item.decode(self._buffer)
+			except:
+				self._abort(self._index, self._subindex, LENGTH_DOES_NOT_MATCH)
+				raise SDOAbortError(LENGTH_DOES_NOT_MATCH)
+			
 			self._state = 0x80
+			return value
+		else:
+			self._state = 0x80
+			#TODO: Get specific exception from lower half.
+			raise SDOAbortError(GENERAL_ERROR)
+	
+	def _initiate_download(self, index, subindex, data):
+		self._index = index
+		self._subindex = subindex
+		self._buffer = data
+		self._data_size = len(self._buffer)
+		self._toggle_bit = 0x00
+		
+		if self._data_size > 0 and self._data_size <= 4: # Expedited transfer
+			request_command = 0x20 | ((4 - self._data_size) << 2) | (1 << 1) | (1 << 0)
+			request_data = self._buffer
+		else: # Segmented transfer
+			request_command = 0x20 | (1 << 0)
+			request_data = struct.pack("<L", self._data_size)
+		
+		self._state = request_command
+		
+		d = struct.pack("<BHB4s", request_command, index, subindex, request_data)
+		if self._cob_id_tx & (1 << 29):
+			request = can.Message(arbitration_id = self._cob_id_tx & 0x1FFFFFFF, is_extended_id = True, data = d)
+		else:
+			request = can.Message(arbitration_id = self._cob_id_tx & 0x7FF, is_extended_id = False, data = d)
+		self._node.network.send(request)
+	
+	def _finish_download(self):
+		if self._state & 0xE0 != 0x20:
+			self._state = 0x80
+			#TODO: Get specific exception from lower half.
+			raise SDOAbortError(GENERAL_ERROR)
+		self._state = 0x80
+	
+	def _notify(self):
+		with self._condition:
+			self._condition.notify_all()
+		self._async_condition.notify_all()
 	
 	def on_response(self, message):
 		""" Handler for upload and download responses from the SDO server. """
@@ -222,8 +308,7 @@ class SDOClient(Service):
 		self._node.network.send(message)
 		
 		self._state = 0x80
-		with self._condition:
-			self._condition.notify_all()
+		self._notify()
 	
 	def _on_upload_segment(self, message):
 		response_command, response_data = struct.unpack_from("<B7s", message.data)
@@ -246,8 +331,7 @@ class SDOClient(Service):
 				self._abort(self._index, self._subindex, 0x06070010)
 				return
 			
-			with self._condition:
-				self._condition.notify_all()
+			self._notify()
 		else:
 			self._toggle_bit ^= (1 << 4)
 			
@@ -274,8 +358,7 @@ class SDOClient(Service):
 		size = len(self._buffer)
 		
 		if size == 0:
-			with self._condition:
-				self._condition.notify_all()
+			self._notify()
 		else:
 			self._toggle_bit ^= (1 << 4)
 			if size > 7:
@@ -315,8 +398,7 @@ class SDOClient(Service):
 			self._buffer = response_data[:size]
 			self._data_size = size
 			
-			with self._condition:
-				self._condition.notify_all()
+			self._notify()
 		else:
 			if response_command & (1 << 0): # size indicated
 				self._buffer = b""
@@ -347,8 +429,7 @@ class SDOClient(Service):
 			return
 		
 		if self._state & (1 << 1): # Expedited transfer
-			with self._condition:
-				self._condition.notify_all()
+			self._notify()
 		else: # Segmented transfer
 			size = len(self._buffer)
 		
@@ -371,8 +452,7 @@ class SDOClient(Service):
 	def _on_abort(self, message):
 		self._state = 0x80
 		
-		with self._condition:
-			self._condition.notify_all()
+		self._notify()
 	
 	def _on_block_upload(self, message):
 		self._abort(0, 0, COMMAND_SPECIFIER_NOT_VALID)
@@ -3,7 +3,6 @@ import can
 
 from canopen.node.service import Service
 from canopen.sdo.abortcodes import TOGGLE_BIT_NOT_ALTERNATED, COMMAND_SPECIFIER_NOT_VALID, OBJECT_DOES_NOT_EXIST, SUBINDEX_DOES_NOT_EXIST, NO_DATA_AVAILABLE, GENERAL_ERROR, NO_ERROR
-from canopen.objectdictionary import Variable
 
 
 class SDOServer(Service):
@@ -60,7 +59,7 @@ class SDOServer(Service):
 		self._state = 0x80
 		
 		if cob_id_rx & (1 << 29):
-			self._node.network.subscribe(self.on_request, cob_id_rx & 0x1FFFFFFF)
+			self._node.network.subscribe(self.on_request, cob_id_rx & 0x1FFFFFFF, True)
 		else:
 			self._node.network.subscribe(self.on_request, cob_id_rx & 0x7FF)
 		
@@ -76,7 +75,7 @@ class SDOServer(Service):
 			self._abort(self._index, self._subindex, NO_ERROR)
 		
 		if self._cob_id_rx & (1 << 29):
-			self._node.network.unsubscribe(self.on_request, self._cob_id_rx & 0x1FFFFFFF)
+			self._node.network.unsubscribe(self.on_request, self._cob_id_rx & 0x1FFFFFFF, True)
 		else:
 			self._node.network.unsubscribe(self.on_request, self._cob_id_rx & 0x7FF)
 		
@@ -131,6 +130,17 @@ class SDOServer(Service):
 			message = can.Message(arbitration_id = self._cob_id_tx & 0x7FF, is_extended_id = False, data = d)
 		self._node.network.send(message)
 	
+	def _variable(self, index, subindex):
+		""" Returns the variable of the object dictionary at the index and subindex. If there is no such variable, the transfer is aborted and None is returned. """
+		try:
+			return self._node.dictionary.variable(index, subindex)
+		except:
+			if index in self._node.dictionary:
+				self._abort(index, subindex, SUBINDEX_DOES_NOT_EXIST)
+			else:
+				self._abort(index, subindex, OBJECT_DOES_NOT_EXIST)
+			return None
+	
 	def _on_download_segment(self, message):
 		request_command, request_data = struct.unpack_from("<B7s", message.data)
 		
@@ -153,19 +163,10 @@ class SDOServer(Service):
 				return
 			
 			# Try to get object dictionary item - the dictionary may have changed since initiate
-			try:
-				item = self._node.dictionary[self._index]
-			except:
-				self._abort(self._index, self._subindex, OBJECT_DOES_NOT_EXIST)
+			item = self._variable(self._index, self._subindex)
+			if item == None:
 				return
 			
-			if not isinstance(item, Variable):
-				try:
-					item = item[self._subindex]
-				except:
-					self._abort(self._index, self._subindex, SUBINDEX_DOES_NOT_EXIST)
-					return
-			
 			try:
 				data = item.decode(self._buffer)
 			except:
@@ -196,19 +197,10 @@ class SDOServer(Service):
 	def _on_initiate_download(self, message):
 		request_command, index, subindex, request_data = struct.unpack("<BHB4s", message.data)
 		
-		try:
-			item = self._node.dictionary[index]
-		except:
-			self._abort(index, subindex, OBJECT_DOES_NOT_EXIST)
+		item = self._variable(index, subindex)
+		if item == None:
 			return
 		
-		if not isinstance(item, Variable):
-			try:
-				item = item[subindex]
-			except:
-				self._abort(index, subindex, SUBINDEX_DOES_NOT_EXIST)
-				return
-		
 		if "w" not in item.access_type:
 			# 0x06010002 Attempt to write a read only object.
 			self._abort(index, subindex, 0x06010002)
@@ -259,19 +251,10 @@ class SDOServer(Service):
 	def _on_initiate_upload(self, message):
 		request_command, index, subindex, request_data = struct.unpack("<BHB4s", message.data)
 		
-		try:
-			item = self._node.dictionary[index]
-		except:
-			self._abort(index, subindex, OBJECT_DOES_NOT_EXIST)
+		item = self._variable(index, subindex)
+		if item == None:
 			return
 		
-		if not isinstance(item, Variable):
-			try:
-				item = item[subindex]
-			except:
-				self._abort(index, subindex, SUBINDEX_DOES_NOT_EXIST)
-				return
-		
 		if "r" not in item.access_type and item.access_type != "const":
 			# 0x06010001 Attempt to read a write only object.
 			self._abort(index, subindex, 0x06010001)
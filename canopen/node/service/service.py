@@ -1,4 +1,9 @@
+import asyncio
+import sys
+import threading
 from canopen.node import Node
+from canopen.util import AsyncBatcher
+from canopen.util.asynccondition import _running_loop
 
 
 class Service(object):
@@ -19,7 +24,10 @@ class Service(object):
 		
 		self._node = node
 		self._callbacks = {}
+		# Serializes the replacement of the callback tuples of the dispatchers, which is a read-modify-write
+		self._callbacks_lock = threading.Lock()
 		self._enabled = True
+		self._error_handler = None
 	
 	def attach(self):
 		""" Attach handler. Must be called when the node gets attached to the network.
@@ -61,22 +69,34 @@ class Service(object):
 		"""
 		return self._enabled
 	
-	def add_callback(self, event, callback):
+	def add_callback(self, event, callback, loop = None):
 		""" Adds the given callback for the event.
+		The callback may be a coroutine function. Its calls are run as tasks on the event loop, which are started in batches by an ``AsyncBatcher``, thus a burst of events wakes up the event loop only once.
 		Raises TypeError if the callback is not callable.
 		Raises KeyError if the event is not supported/found.
+		Raises RuntimeError if the callback is a coroutine function and there is no event loop to run it on.
 		
 		:param event: The name of the event
 		
 		:param callback: The callback function.
 			Must be callable
 		
-		:raises: TypeError, KeyError
+		:param loop: The event loop to run a coroutine function on. If None, the event loop of an ``AsyncNetwork`` the node is attached to or the running event loop of the calling thread is used. Ignored for other callbacks.
+		
+		:raises: TypeError, KeyError, RuntimeError
 		"""
 		if not callable(callback):
 			raise TypeError()
 		
-		self._callbacks[event].append(callback)
+		dispatcher = self._callbacks[event]
+		if asyncio.iscoroutinefunction(callback):
+			if loop == None:
+				loop = getattr(self._node.network, "loop", None)
+			if loop == None:
+				loop = _running_loop()
+			callback = _AsyncCallback(self, callback, AsyncBatcher.for_loop(loop))
+		with self._callbacks_lock:
+			dispatcher.callbacks = dispatcher.callbacks + (callback,)
 	
 	def add_event(self, event):
 		""" Adds an event to this service.
@@ -84,15 +104,19 @@ class Service(object):
 		
 		:param event: The name of the event.
 		
-		:raises: ValueError
+		:returns: The ``Event`` dispatcher of the event. Services keep it to notify the callbacks without looking up the event by name.
+		
+		:raises: KeyError
 		"""
 		if event in self._callbacks:
 			raise KeyError()
 		
-		self._callbacks[event] = []
+		dispatcher = Event(self, event)
+		self._callbacks[event] = dispatcher
+		return dispatcher
 	
 	def remove_callback(self, event, callback):
-		""" Removes the callback for the event.
+		""" Removes the callback for the event. Calls of a coroutine function, which are already queued, are still run.
 		Raises KeyError if the event is not supported/found.
 		Raises ValueError if the callback was not found.
 		
@@ -103,7 +127,11 @@ class Service(object):
 		
 		:raises: KeyError, ValueError
 		"""
-		self._callbacks[event].remove(callback)
+		dispatcher = self._callbacks[event]
+		with self._callbacks_lock:
+			callbacks = list(dispatcher.callbacks)
+			callbacks.remove(callback)
+			dispatcher.callbacks = tuple(callbacks)
 	
 	def remove_event(self, event):
 		""" Removes an event from the service.
@@ -117,7 +145,7 @@ class Service(object):
 	
 	def notify(self, event, *args):
 		""" Call the callbacks for the given event. First argument for each callback is event.
-		If a callback raises an exception, it will be dropped.
+		If a callback raises an exception, it is passed to the error handler.
 		Raises KeyError if the event is not found.
 		
 		:param event: The name of the event
@@ -125,15 +153,99 @@ class Service(object):
 		:param args: A list of arguments to pass additionally to the callback
 		
 		:raises: KeyError
-		"""		
-		for callback in self._callbacks[event]:
+		"""
+		self._callbacks[event].notify(*args)
+	
+	def _callback_error(self, event, callback, exception):
+		network = self._node.network
+		if network != None and network.metrics != None:
+			network.metrics.record_exception(exception)
+		handler = self._error_handler
+		if handler != None:
 			try:
-				callback(event, *args)
+				handler(self, event, callback, exception)
 			except:
 				pass
 	
+	@property
+	def error_handler(self):
+		""" Returns the error handler, which is called with the service, the event, the callback and the exception if a callback raises an exception. If None, the exceptions are dropped.
+		"""
+		return self._error_handler
+	
+	@error_handler.setter
+	def error_handler(self, handler):
+		""" Sets the error handler. Exceptions raised by the handler are dropped.
+		Raises TypeError if the handler is not callable and not None.
+		
+		:param handler: The error handler or None.
+		
+		:raises: TypeError
+		"""
+		if handler != None and not callable(handler):
+			raise TypeError()
+		self._error_handler = handler
+	
 	@property
 	def node(self):
 		""" Returns the node this service belongs to.
 		"""
 		return self._node
+
+
+class Event(object):
+	""" Dispatcher for one event of a service.
+	
+	The callbacks are kept in a tuple, which is replaced when a callback is added or removed. Thus notifying needs neither a lock nor a copy of the list, and an event without callbacks returns immediately. The replacement is done under the lock of the service.
+	"""
+	__slots__ = ("_service", "_name", "callbacks")
+	
+	def __init__(self, service, name):
+		self._service = service
+		self._name = name
+		self.callbacks = ()
+	
+	def notify(self, *args):
+		""" Calls the callbacks with the name of the event and ``args``.
+		
+		:param args: The arguments to pass additionally to the callbacks.
+		"""
+		for callback in self.callbacks:
+			try:
+				callback(self._name, *args)
+			except:
+				self._service._callback_error(self._name, callback, sys.exc_info()[1])
+	
+	@property
+	def name(self):
+		""" Returns the name of the event.
+		"""
+		return self._name
+
+
+class _AsyncCallback(object):
+	""" Wrapper, which submits the calls of a coroutine function to an ``AsyncBatcher``. It compares equal to the coroutine function, thus ``remove_callback`` finds it. """
+	__slots__ = ("_service", "_function", "_batcher")
+	
+	def __init__(self, service, function, batcher):
+		self._service = service
+		self._function = function
+		self._batcher = batcher
+	
+	def __call__(self, event, *args):
+		self._batcher.submit(self._function, (event,) + args, lambda task: self._done(event, task))
+	
+	def __eq__(self, other):
+		if isinstance(other, _AsyncCallback):
+			return self._function == other._function
+		return self._function == other
+	
+	def __hash__(self):
+		return hash(self._function)
+	
+	def _done(self, event, task):
+		if task.cancelled():
+			return
+		exception = task.exception()
+		if exception != None:
+			self._service._callback_error(event, self._function, exception)
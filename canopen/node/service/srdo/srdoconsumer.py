@@ -55,11 +55,11 @@ class SRDOConsumer(SYNCConsumer):
 		SYNCConsumer.attach(self, cob_id_sync)
 		
 		if cob_id_1 & (1 << 29):
-			self._node.network.subscribe(self.on_message1, cob_id_1 & 0x1FFFFFFF)
+			self._node.network.subscribe(self.on_message1, cob_id_1 & 0x1FFFFFFF, True)
 		else:
 			self._node.network.subscribe(self.on_message1, cob_id_1 & 0x7FF)
 		if cob_id_2 & (1 << 29):
-			self._node.network.subscribe(self.on_message2, cob_id_2 & 0x1FFFFFFF)
+			self._node.network.subscribe(self.on_message2, cob_id_2 & 0x1FFFFFFF, True)
 		else:
 			self._node.network.subscribe(self.on_message2, cob_id_2 & 0x7FF)
 		
@@ -72,11 +72,11 @@ class SRDOConsumer(SYNCConsumer):
 		SYNCConsumer.detach(self)
 		
 		if self._cob_id_1 & (1 << 29):
-			self._node.network.unsubscribe(self.on_message1, self._cob_id_1 & 0x1FFFFFFF)
+			self._node.network.unsubscribe(self.on_message1, self._cob_id_1 & 0x1FFFFFFF, True)
 		else:
 			self._node.network.unsubscribe(self.on_message1, self._cob_id_1 & 0x7FF)
 		if self._cob_id_2 & (1 << 29):
-			self._node.network.unsubscribe(self.on_message2, self._cob_id_2 & 0x1FFFFFFF)
+			self._node.network.unsubscribe(self.on_message2, self._cob_id_2 & 0x1FFFFFFF, True)
 		else:
 			self._node.network.unsubscribe(self.on_message2, self._cob_id_2 & 0x7FF)
 	
@@ -94,8 +94,6 @@ class SRDOConsumer(SYNCConsumer):
 			return
 		if message.is_remote_frame:
 			return
-		if message.is_extended_id != bool(self._cob_id_1 & (1 << 29)):
-			return
 		
 		self._normal_data = message.data
 	
@@ -105,8 +103,6 @@ class SRDOConsumer(SYNCConsumer):
 			return
 		if message.is_remote_frame:
 			return
-		if message.is_extended_id != bool(self._cob_id_2 & (1 << 29)):
-			return
 		
 		self._complement_data = message.data
 	
@@ -4,6 +4,15 @@ from canopen.node.service import Service
 from canopen.node.service.objectmapping import ObjectMapping
 
 
+def _message(cob_id, data):
+	""" Returns a new message for the COB ID with a copy of the data. """
+	data = bytearray(data) if data != None else None
+	if cob_id & (1 << 29):
+		return can.Message(arbitration_id = cob_id & 0x1FFFFFFF, is_extended_id = True, data = data)
+	else:
+		return can.Message(arbitration_id = cob_id & 0x7FF, is_extended_id = False, data = data)
+
+
 class SRDOProducer(Service):
 	""" SRDOProducer
 	"""
@@ -17,6 +26,8 @@ class SRDOProducer(Service):
 		Service.__init__(self, node)
 		self._cob_id_1 = None
 		self._cob_id_2 = None
+		self._normal_message = None
+		self._complement_message = None
 		
 		self._normal_data = None
 		self._complement_data = None
@@ -49,6 +60,8 @@ class SRDOProducer(Service):
 		if self.is_attached():
 			self.detach()
 		
+		self._normal_message = _message(cob_id_1, self._normal_data)
+		self._complement_message = _message(cob_id_2, self._complement_data)
 		self._cob_id_1 = int(cob_id_1)
 		self._cob_id_2 = int(cob_id_2)
 	
@@ -63,6 +76,8 @@ class SRDOProducer(Service):
 				
 		self._cob_id_1 = None
 		self._cob_id_2 = None
+		self._normal_message = None
+		self._complement_message = None
 	
 	def is_attached(self):
 		""" Returns True if the service is attached.
@@ -73,17 +88,8 @@ class SRDOProducer(Service):
 		if self._normal_data == None or self._complement_data == None:
 			raise RuntimeError()
 		
-		if self._cob_id_1 & (1 << 29):
-			message = can.Message(arbitration_id = self._cob_id_1 & 0x1FFFFFFF, is_extended_id = True, data = self._normal_data)
-		else:
-			message = can.Message(arbitration_id = self._cob_id_1 & 0x7FF, is_extended_id = False, data = self._normal_data)
-		self._node.network.send(message)
-		
-		if self._cob_id_2 & (1 << 29):
-			message = can.Message(arbitration_id = self._cob_id_2 & 0x1FFFFFFF, is_extended_id = True, data = self._complement_data)
-		else:
-			message = can.Message(arbitration_id = self._cob_id_2 & 0x7FF, is_extended_id = False, data = self._complement_data)
-		self._node.network.send(message)
+		# The messages are read once, as the data setters may replace them concurrently
+		self._node.network.send_many([self._normal_message, self._complement_message])
 	
 	@property
 	def normal_data(self):
@@ -92,6 +98,9 @@ class SRDOProducer(Service):
 	@normal_data.setter
 	def normal_data(self, data):
 		self._normal_data = data
+		if self._cob_id_1 != None and data != None:
+			# A new message is swapped in, thus a message, which is just being sent, is never changed
+			self._normal_message = _message(self._cob_id_1, data)
 	
 	@property
 	def complement_data(self):
@@ -100,3 +109,6 @@ class SRDOProducer(Service):
 	@complement_data.setter
 	def complement_data(self, data):
 		self._complement_data = data
+		if self._cob_id_2 != None and data != None:
+			# A new message is swapped in, thus a message, which is just being sent, is never changed
+			self._complement_message = _message(self._cob_id_2, data)
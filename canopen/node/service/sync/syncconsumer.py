@@ -1,5 +1,5 @@
-import struct
 import threading
+import canopen.util
 
 from canopen.node.service import Service
 
@@ -21,10 +21,11 @@ class SYNCConsumer(Service):
 		:raises: TypeError
 		"""
 		Service.__init__(self, node)
-		self.add_event("sync")
+		self._sync_event = self.add_event("sync")
 		self._cob_id_sync = None
 		
 		self._sync_condition = threading.Condition()
+		self._sync_async_condition = canopen.util.AsyncCondition()
 	
 	def attach(self, cob_id_sync = None):
 		""" Attach handler. Must be called when the node gets attached to the network.
@@ -42,7 +43,7 @@ class SYNCConsumer(Service):
 			self.detach()
 		
 		if cob_id_sync & (1 << 29):
-			self._node.network.subscribe(self.on_sync, cob_id_sync & 0x1FFFFFFF)
+			self._node.network.subscribe(self.on_sync, cob_id_sync & 0x1FFFFFFF, True)
 		else:
 			self._node.network.subscribe(self.on_sync, cob_id_sync & 0x7FF)
 		
@@ -58,7 +59,7 @@ class SYNCConsumer(Service):
 			raise RuntimeError()
 		
 		if self._cob_id_sync & (1 << 29):
-			self._node.network.unsubscribe(self.on_sync, self._cob_id_sync & 0x1FFFFFFF)
+			self._node.network.unsubscribe(self.on_sync, self._cob_id_sync & 0x1FFFFFFF, True)
 		else:
 			self._node.network.unsubscribe(self.on_sync, self._cob_id_sync & 0x7FF)
 		
@@ -75,16 +76,15 @@ class SYNCConsumer(Service):
 			return
 		if message.is_remote_frame:
 			return
-		if message.is_extended_id != bool(self._cob_id_sync & (1 << 29)):
-			return
-		if message.dlc == 1:
-			counter, = struct.unpack_from("<B", message.data)
-		else:
-			counter = None
-		
-		self.notify("sync", self, counter)
+		if self._sync_event.callbacks:
+			if message.dlc == 1:
+				counter = message.data[0]
+			else:
+				counter = None
+			self._sync_event.notify(self, counter)
 		with self._sync_condition:
 			self._sync_condition.notify_all()
+		self._sync_async_condition.notify_all()
 	
 	def wait_for_sync(self, timeout = None):
 		""" Wait until the reception of SYNC message or until a timeout occurs.
@@ -100,3 +100,14 @@ class SYNCConsumer(Service):
 		with self._sync_condition:
 			gotit = self._sync_condition.wait(timeout)
 		return gotit
+	
+	async def wait_for_sync_async(self, timeout = None):
+		""" Awaitable variant of ``wait_for_sync``. Waits until the reception of SYNC message or until a timeout occurs, without blocking the event loop.
+		
+		:param timeout: The time to wait in seconds, or ``None``
+		
+		:returns: True if the sync message was received, False if the timeout occured, or if the service is disabled
+		"""
+		if not self._enabled:
+			return False
+		return await self._sync_async_condition.wait(timeout)
@@ -19,6 +19,9 @@ class SYNCProducer(Service):
 		"""
 		Service.__init__(self, node)
 		self._cob_id_sync = None
+		self._message = None
+		# The messages with a counter by the counter value, built on first use and never changed afterwards
+		self._messages = {}
 	
 	def attach(self, cob_id_sync = None):
 		""" Attach handler. Must be called when the node gets attached to the network.
@@ -35,6 +38,11 @@ class SYNCProducer(Service):
 		if self.is_attached():
 			self.detach()
 		
+		if cob_id_sync & (1 << 29):
+			self._message = can.Message(arbitration_id = cob_id_sync & 0x1FFFFFFF, is_extended_id = True)
+		else:
+			self._message = can.Message(arbitration_id = cob_id_sync & 0x7FF, is_extended_id = False)
+		self._messages = {}
 		self._cob_id_sync = int(cob_id_sync)
 	
 	def detach(self):
@@ -44,6 +52,8 @@ class SYNCProducer(Service):
 			raise RuntimeError()
 		
 		self._cob_id_sync = None
+		self._message = None
+		self._messages = {}
 		
 	def is_attached(self):
 		""" Returns True if the service is attached.
@@ -55,14 +65,13 @@ class SYNCProducer(Service):
 		
 		:param counter: The counter value to send with the SYNC message. If None, the counter value is omitted from the SYNC message.
 		"""
-		if self._cob_id_sync & (1 << 29):
-			message = can.Message(arbitration_id = self._cob_id_sync & 0x1FFFFFFF, is_extended_id = True)
-		else:
-			message = can.Message(arbitration_id = self._cob_id_sync & 0x7FF, is_extended_id = False)
-			
-		if counter == None:
-			message.dlc = 0
-		else:
-			d = struct.pack("<B", int(counter))
-			message.data = d
+		message = self._message
+		if counter != None:
+			counter = int(counter)
+			messages = self._messages
+			template = message
+			message = messages.get(counter)
+			if message == None:
+				message = can.Message(arbitration_id = template.arbitration_id, is_extended_id = template.is_extended_id, data = struct.pack("<B", counter))
+				messages[counter] = message
 		self._node.network.send(message)
@@ -1,5 +1,6 @@
 import threading
 import canopen.objectdictionary
+import canopen.util
 
 from canopen.node.service import Service
 from canopen.objectdictionary import Variable
@@ -22,6 +23,7 @@ class TIMEConsumer(Service):
 		self._cob_id_time = None
 		
 		self._time_condition = threading.Condition()
+		self._time_async_condition = canopen.util.AsyncCondition()
 	
 	def attach(self, cob_id_time = None):
 		""" Attach handler. Must be called when the node gets attached to the network.
@@ -39,7 +41,7 @@ class TIMEConsumer(Service):
 			self.detach()
 		
 		if cob_id_time & (1 << 29):
-			self._node.network.subscribe(self.on_time, cob_id_time & 0x1FFFFFFF)
+			self._node.network.subscribe(self.on_time, cob_id_time & 0x1FFFFFFF, True)
 		else:
 			self._node.network.subscribe(self.on_time, cob_id_time & 0x7FF)
 		
@@ -55,7 +57,7 @@ class TIMEConsumer(Service):
 			raise RuntimeError()
 		
 		if self._cob_id_time & (1 << 29):
-			self._node.network.unsubscribe(self.on_time, self._cob_id_time & 0x1FFFFFFF)
+			self._node.network.unsubscribe(self.on_time, self._cob_id_time & 0x1FFFFFFF, True)
 		else:
 			self._node.network.unsubscribe(self.on_time, self._cob_id_time & 0x7FF)
 		
@@ -72,8 +74,6 @@ class TIMEConsumer(Service):
 			return
 		if message.is_remote_frame:
 			return
-		if message.is_extended_id != bool(self._cob_id_time & (1 << 29)):
-			return
 		if message.dlc < 6:
 			return
 		
@@ -81,6 +81,7 @@ class TIMEConsumer(Service):
 		self.notify("time", self, timestamp)
 		with self._time_condition:
 			self._time_condition.notify_all()
+		self._time_async_condition.notify_all()
 	
 	def wait_for_time(self, timeout = None):
 		""" Wait until the reception of TIME message or until a timeout occurs.
@@ -96,3 +97,14 @@ class TIMEConsumer(Service):
 		with self._time_condition:
 			gotit = self._time_condition.wait(timeout)
 		return gotit
+	
+	async def wait_for_time_async(self, timeout = None):
+		""" Awaitable variant of ``wait_for_time``. Waits until the reception of TIME message or until a timeout occurs, without blocking the event loop.
+		
+		:param timeout: The time to wait in seconds, or ``None``
+		
+		:returns: True if the time message was received, False if the timeout occured, or if the service is disabled.
+		"""
+		if not self._enabled:
+			return False
+		return await self._time_async_condition.wait(timeout)
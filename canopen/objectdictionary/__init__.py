@@ -4,5 +4,6 @@ from canopen.objectdictionary.datatypes import *
 from canopen.objectdictionary.defstruct import DefStruct
 from canopen.objectdictionary.deftype import DefType
 from canopen.objectdictionary.domain import Domain
+from canopen.objectdictionary.overlay import Overlay
 from canopen.objectdictionary.record import Record
 from canopen.objectdictionary.variable import Variable
@@ -8,12 +8,17 @@ class DefStruct(Array):
 	
 	This class is the representation of a DefStruct of an object dictionary. It is a mutable auto-associative mapping and may contain zero or more variables.
 	"""
+	__slots__ = ()
+	
+	_object_type = 6
+	
 	def __init__(self, name, index, description = ""):
 		Array.__init__(self, name, index, UNSIGNED16, description)
-		self._object_type = 6
 	
 	def add(self, value):
 		""" Adds a variable to the record. It may be accessed later by the name or the subindex. """
+		if self._frozen:
+			raise TypeError()
 		if not isinstance(value, Variable):
 			raise TypeError()
 		# Allow objects with object type 7 (Variable) only. DefType and Domain are sub-classes of Variable and thus will pass the isinstance check.
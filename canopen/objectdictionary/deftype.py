@@ -8,9 +8,12 @@ class DefType(Variable):
 	This class is a representation of a DefType of an object dictionary. Basically this is a Variable with fixed subindex, data_type and access_type.
 	Upon read, it should return the number of bits needed to encode the type.
 	"""
+	__slots__ = ()
+	
+	_object_type = 5
+	
 	def __init__(self, name, index, description = ""):
 		Variable.__init__(self, name, index, 0, UNSIGNED32, "ro", description)
-		self._object_type = 5
 	
 	@property
 	def access_type(self):
@@ -7,6 +7,9 @@ class Domain(Variable):
 	
 	This class is a representation of a Domain object of an object dictionary. Basically this is a Variable with fixed subindex and data_type.
 	"""
+	__slots__ = ()
+	
+	_object_type = 2
+	
 	def __init__(self, name, index, access_type = "rw", description = ""):
 		Variable.__init__(self, name, index, 0, DOMAIN, access_type, description)
-		self._object_type = 2
@@ -0,0 +1,271 @@
+import hashlib
+import marshal
+import os
+import re
+import sys
+import canopen.objectdictionary
+
+
+#: The version of the format of the cache files. It is part of the name of the cache files, thus an incompatible format is never read.
+CACHE_VERSION = 1
+
+# The access types of EDS files and the corresponding access type of a Variable
+_access_types = {"ro": "ro", "wo": "wo", "rw": "rw", "rwr": "rw", "rww": "rw", "const": "const"}
+
+# The PDO mapping of a mappable variable by the access type of EDS files
+_pdo_mappings = {"ro": "t", "wo": "r", "rw": "tr", "rwr": "t", "rww": "r", "const": "t"}
+
+_integer_types = [canopen.objectdictionary.INTEGER8, canopen.objectdictionary.INTEGER16, canopen.objectdictionary.INTEGER24, canopen.objectdictionary.INTEGER32,
+	canopen.objectdictionary.INTEGER40, canopen.objectdictionary.INTEGER48, canopen.objectdictionary.INTEGER56, canopen.objectdictionary.INTEGER64,
+	canopen.objectdictionary.UNSIGNED8, canopen.objectdictionary.UNSIGNED16, canopen.objectdictionary.UNSIGNED24, canopen.objectdictionary.UNSIGNED32,
+	canopen.objectdictionary.UNSIGNED40, canopen.objectdictionary.UNSIGNED48, canopen.objectdictionary.UNSIGNED56, canopen.objectdictionary.UNSIGNED64]
+
+_string_types = [canopen.objectdictionary.VISIBLE_STRING, canopen.objectdictionary.OCTET_STRING, canopen.objectdictionary.UNICODE_STRING]
+
+_real_types = [canopen.objectdictionary.REAL32, canopen.objectdictionary.REAL64]
+
+# The names of the sections of objects and sub-objects, in lower case
+_object_section = re.compile(r"^([0-9a-f]{4})$")
+_subobject_section = re.compile(r"^([0-9a-f]{4})sub([0-9a-f]+)$")
+
+
+def load(file, node_id = None, cache = None):
+	""" Loads an object dictionary from an EDS or DCF file.
+	For a DCF file, the ``ParameterValue`` of an object is used as default value, if present. ``$NODEID`` in values is replaced by the node id.
+	Raises ValueError if the file contains an invalid object, or a duplicated index, subindex or name. The message names the duplicate.
+	
+	:param file: The path of the file or a file object opened for reading, in text or binary mode.
+	
+	:param node_id: The node id for ``$NODEID``. If None, the ``NodeID`` of the ``DeviceComissioning`` section of a DCF file or 0 is used.
+	
+	:param cache: A directory for the cache. If given, the parsed dictionary is stored in a compact binary form, keyed by the hash of the content of the file and the node id, and loaded from there on the next call.
+	
+	:returns: The object dictionary.
+	
+	:raises: ValueError
+	"""
+	if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+		with open(file, "rb") as f:
+			content = f.read()
+	else:
+		content = file.read()
+		if isinstance(content, str):
+			content = content.encode("utf-8")
+	
+	cache_path = None
+	if cache != None:
+		key = hashlib.sha256(content)
+		key.update(repr((node_id, sys.version_info[:2])).encode())
+		cache_path = os.path.join(cache, key.hexdigest() + "-" + str(CACHE_VERSION) + ".odcache")
+		try:
+			with open(cache_path, "rb") as f:
+				return _from_tuples(marshal.loads(f.read()))
+		except (OSError, ValueError, EOFError, TypeError, KeyError, IndexError):
+			# A missing, truncated or otherwise invalid cache file is ignored and replaced
+			pass
+	
+	try:
+		text = content.decode("utf-8")
+	except UnicodeDecodeError:
+		text = content.decode("latin-1")
+	dictionary = _build(_parse(text), node_id)
+	
+	if cache_path != None:
+		try:
+			os.makedirs(cache, exist_ok = True)
+			temporary_path = cache_path + "." + str(os.getpid()) + ".tmp"
+			with open(temporary_path, "wb") as f:
+				f.write(marshal.dumps(_to_tuples(dictionary)))
+			os.replace(temporary_path, cache_path)
+		except OSError:
+			pass
+	
+	return dictionary
+
+
+def _parse(text):
+	""" Returns a dictionary of the sections of an INI-style text. The names of sections and keys are converted to lower case. """
+	sections = {}
+	section = None
+	for line in text.splitlines():
+		line = line.strip()
+		if not line or line[0] == ";" or line[0] == "#":
+			continue
+		if line[0] == "[":
+			section = {}
+			sections[line[1:line.find("]")].strip().lower()] = section
+			continue
+		if section == None:
+			continue
+		key, separator, value = line.partition("=")
+		if separator:
+			value = value.strip()
+			# Strip trailing comments, but keep semicolons in strings without spaces before
+			position = value.find(" ;")
+			if position >= 0:
+				value = value[:position].rstrip()
+			section[key.strip().lower()] = value
+	return sections
+
+
+def _integer(value, node_id):
+	""" Parses an integer, which may contain ``$NODEID`` as term of a sum. """
+	value = value.strip()
+	if "$" in value:
+		value = value.upper().replace("$NODEID", str(node_id))
+		return sum(_integer(term, node_id) for term in value.split("+") if term.strip())
+	try:
+		return int(value, 0)
+	except ValueError:
+		return int(value, 10)
+
+
+def _value(value, data_type, node_id):
+	""" Returns the default value of the given string for the data type, or None if it is empty or can not be represented. """
+	if value == None or value == "":
+		return None
+	if data_type in _integer_types:
+		return _integer(value, node_id)
+	if data_type == canopen.objectdictionary.BOOLEAN:
+		return bool(_integer(value, node_id))
+	if data_type in _real_types:
+		return float(value)
+	if data_type in _string_types:
+		return value
+	return None
+
+
+def _variable(section, name, index, subindex, node_id):
+	data_type = _integer(section.get("datatype", "0x0007"), 0)
+	eds_access_type = section.get("accesstype", "rw").lower()
+	if eds_access_type not in _access_types:
+		raise ValueError()
+	pdo_mapping = "no"
+	if _integer(section.get("pdomapping", "0"), 0):
+		pdo_mapping = _pdo_mappings[eds_access_type]
+	
+	variable = canopen.objectdictionary.Variable(name, index, subindex, data_type, _access_types[eds_access_type], section.get("description", ""), pdo_mapping)
+	value = section.get("parametervalue")
+	if value == None or value == "":
+		value = section.get("defaultvalue")
+	value = _value(value, data_type, node_id)
+	if value != None:
+		variable.default_value = value
+	return variable
+
+
+def _build(sections, node_id):
+	""" Builds the object dictionary from the sections of an EDS or DCF file. """
+	if node_id == None:
+		node_id = _integer(sections.get("devicecomissioning", {}).get("nodeid", "0"), 0)
+	
+	# Collect the sub-objects by the index of the object
+	subobjects = {}
+	objects = []
+	for section_name, section in sections.items():
+		match = _object_section.match(section_name)
+		if match:
+			objects.append((int(match.group(1), 16), section))
+			continue
+		match = _subobject_section.match(section_name)
+		if match:
+			subobjects.setdefault(int(match.group(1), 16), []).append((int(match.group(2), 16), section))
+	
+	dictionary = canopen.ObjectDictionary()
+	for index, section in sorted(objects, key = lambda x: x[0]):
+		name = section.get("parametername", "")
+		object_type = _integer(section.get("objecttype", "0x7"), 0)
+		description = section.get("description", "")
+		compact = _integer(section.get("compactsubobj", "0"), 0)
+		
+		if object_type == 2:
+			o = canopen.objectdictionary.Domain(name, index, _access_types.get(section.get("accesstype", "rw").lower(), "rw"), description)
+		elif object_type == 5:
+			o = canopen.objectdictionary.DefType(name, index, description)
+		elif object_type == 7 and not compact:
+			o = _variable(section, name, index, 0, node_id)
+		elif object_type in [6, 8, 9] or compact:
+			if object_type == 6:
+				o = canopen.objectdictionary.DefStruct(name, index, description)
+			elif object_type == 9:
+				o = canopen.objectdictionary.Record(name, index, _integer(section.get("datatype", "0"), 0), description)
+			else:
+				o = canopen.objectdictionary.Array(name, index, _integer(section.get("datatype", "0"), 0), description)
+			
+			if compact:
+				# CiA 306: The sub-objects are not listed, sub-index 0 holds the number of entries
+				o.add(canopen.objectdictionary.Variable("NrOfObjects", index, 0x00, canopen.objectdictionary.UNSIGNED8, "ro", "", "no"))
+				o[0x00].default_value = compact
+				for subindex in range(1, compact + 1):
+					_add(o, _variable(section, name + str(subindex), index, subindex, node_id))
+			for subindex, subsection in sorted(subobjects.get(index, []), key = lambda x: x[0]):
+				_add(o, _variable(subsection, subsection.get("parametername", ""), index, subindex, node_id))
+		else:
+			raise ValueError()
+		
+		_add(dictionary, o)
+	
+	return dictionary
+
+
+def _add(container, item):
+	""" Adds the object to the object dictionary or the variable to the record or array.
+	Raises ValueError, which names the index, subindex or name, if it is already contained.
+	
+	:raises: ValueError
+	"""
+	try:
+		container.add(item)
+	except ValueError:
+		if isinstance(container, canopen.ObjectDictionary):
+			position = "index 0x{:04X}".format(item.index)
+		else:
+			position = "subindex 0x{:02X} of index 0x{:04X}".format(item.subindex, item.index)
+		if item.name in container:
+			raise ValueError("Duplicate ParameterName \"{}\" at {}".format(item.name, position))
+		raise ValueError("Duplicate {}".format(position))
+
+
+def _to_tuples(dictionary):
+	""" Converts the object dictionary to nested tuples of basic types for the cache. """
+	result = []
+	for o in dictionary:
+		if isinstance(o, canopen.objectdictionary.Variable) and not isinstance(o, (canopen.objectdictionary.Domain, canopen.objectdictionary.DefType)):
+			result.append(_variable_tuple(o))
+		elif isinstance(o, (canopen.objectdictionary.Domain, canopen.objectdictionary.DefType)):
+			result.append((o.object_type, o.name, o.index, o.description, o.access_type))
+		else:
+			result.append((o.object_type, o.name, o.index, o.description, o.data_type, [_variable_tuple(v) for v in o]))
+	return result
+
+
+def _variable_tuple(variable):
+	return (7, variable.name, variable.index, variable.description, variable.subindex, variable.data_type, variable.access_type, variable.pdo_mapping, variable.srdo_mapping, variable.default_value)
+
+
+def _from_variable_tuple(t):
+	return canopen.objectdictionary.Variable._restore(t[1], t[2], t[4], t[5], t[6], t[3], t[7], t[8], t[9])
+
+
+def _from_tuples(tuples):
+	""" Builds the object dictionary from the nested tuples of the cache. """
+	dictionary = canopen.ObjectDictionary()
+	for t in tuples:
+		object_type = t[0]
+		if object_type == 7:
+			o = _from_variable_tuple(t)
+		elif object_type == 2:
+			o = canopen.objectdictionary.Domain(t[1], t[2], t[4], t[3])
+		elif object_type == 5:
+			o = canopen.objectdictionary.DefType(t[1], t[2], t[3])
+		else:
+			if object_type == 6:
+				o = canopen.objectdictionary.DefStruct(t[1], t[2], t[3])
+			elif object_type == 9:
+				o = canopen.objectdictionary.Record(t[1], t[2], t[4], t[3])
+			else:
+				o = canopen.objectdictionary.Array(t[1], t[2], t[4], t[3])
+			# The variables are checked already, when the cache was written
+			o._extend([_from_variable_tuple(v) for v in t[5]])
+		dictionary.add(o)
+	return dictionary
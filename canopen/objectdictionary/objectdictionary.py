@@ -1,3 +1,4 @@
+import bisect
 import collections
 from .array import Array
 from .record import Record
@@ -8,17 +9,38 @@ class ObjectDictionary(collections.abc.Collection):
 	""" Representation of a CANopen object dictionary.
 	
 	This class is the representation of one CANopen object dictionary. It is a mutable auto-associative mapping and may contain zero or more elements of type Array, DefStruct, DefType, Record or Variable.
+	After ``freeze`` it is read-only and hashable, thus it may be shared by many nodes and threads. The differences of a node to a shared dictionary can be kept in an ``Overlay``.
+	The indexes are also kept in sorted order, thus ranges of objects, e.g. all RPDO communication parameters, are found with ``range`` and ``prefix`` without iterating over the whole dictionary.
+	After ``freeze`` the variables, including those of records and arrays, are also kept in a flat table by index and subindex, thus ``variable`` finds the variable of an SDO or PDO access with a single lookup. Mutable object dictionaries have no table, thus they do not pay its memory.
 	"""
 	def __init__(self):
 		self._items_index = {}
 		self._items_name = {}
+		# The indexes of the objects in ascending order
+		self._indexes = []
+		# The variables by (index, subindex). It is only filled by freeze.
+		self._variables = {}
+		self._frozen = False
+		self._hash = None
 	
 	def __eq__(self, other):
 		""" Indicates whether some other object is "equal to" this one. """
 		if type(self) != type(other):
 			return False
 		return self is other or (self._items_index == other._items_index)
+	
+	def __hash__(self):
+		""" Returns the hash of a frozen object dictionary.
+		Raises TypeError if the object dictionary is not frozen.
 		
+		:raises: TypeError
+		"""
+		if not self._frozen:
+			raise TypeError()
+		if self._hash == None:
+			self._hash = hash(frozenset(self._items_index.items()))
+		return self._hash
+	
 	def __contains__(self, key):
 		""" Returns True if the object dictionary contains a variable, record or array with the specified index or name. """
 		try:
@@ -46,12 +68,17 @@ class ObjectDictionary(collections.abc.Collection):
 	
 	def __delitem__(self, key):
 		""" Removes the variable, record or array identified by the name or the index from the object dictionary. """
+		if self._frozen:
+			raise TypeError()
 		item = self[key]
 		del self._items_index[item.index]
 		del self._items_name[item.name]
+		del self._indexes[bisect.bisect_left(self._indexes, item.index)]
 	
 	def add(self, value):
 		""" Adds a variable, record or array to the object dictionary. It may be accessed later by the name or the index. """
+		if self._frozen:
+			raise TypeError()
 		if not isinstance(value, (Array, Record, Variable)):
 			raise TypeError()
 		if value.index in self._items_index or value.name in self._items_name:
@@ -59,3 +86,82 @@ class ObjectDictionary(collections.abc.Collection):
 		
 		self._items_index[value.index] = value
 		self._items_name[value.name] = value
+		bisect.insort(self._indexes, value.index)
+	
+	def freeze(self):
+		""" Makes the object dictionary and all its objects read-only. Afterwards ``add`` and ``del`` raise TypeError and the setters of the objects raise AttributeError.
+		"""
+		for item in self._items_index.values():
+			item.freeze()
+		# The table is built completely and replaced at once, thus it is never changed while it is read by other threads
+		variables = {}
+		for item in self:
+			variables.update(_entries(item))
+		self._variables = variables
+		self._frozen = True
+	
+	def variable(self, index, subindex):
+		""" Returns the variable at the index and subindex, i.e. the variable at the index or the variable at the subindex of the record or array at the index. A variable at the index is returned for any subindex.
+		The variable is looked up in the table of a frozen object dictionary, otherwise in the object at the index.
+		Raises KeyError if there is no such variable.
+		
+		:param index: The index.
+		
+		:param subindex: The subindex.
+		
+		:returns: The variable.
+		
+		:raises: KeyError
+		"""
+		if self._frozen:
+			try:
+				return self._variables[(index, subindex)]
+			except KeyError:
+				pass
+		item = self[index]
+		if isinstance(item, Variable):
+			return item
+		return item[subindex]
+	
+	def range(self, start, stop):
+		""" Returns the objects with an index from ``start`` up to, but not including, ``stop`` in ascending order of the index. The objects are found by bisection of the sorted indexes, thus the time is proportional to the number of objects returned, not to the size of the object dictionary.
+		
+		:param start: The first index.
+		
+		:param stop: The index after the last index.
+		
+		:returns: A list of the variables, records and arrays.
+		"""
+		low = bisect.bisect_left(self._indexes, start)
+		high = bisect.bisect_left(self._indexes, stop, low)
+		return [self._items_index[index] for index in self._indexes[low:high]]
+	
+	def prefix(self, value, digits = 2):
+		""" Returns the objects, whose index starts with the given hexadecimal digits, in ascending order of the index. E.g. ``prefix(0x14)`` returns the objects from 0x1400 to 0x14FF and ``prefix(0x1A0, 3)`` the objects from 0x1A00 to 0x1A0F.
+		Raises ValueError if the number of digits is not between 1 and 4 or the value has more digits.
+		
+		:param value: The leading digits of the index.
+		
+		:param digits: The number of the leading hexadecimal digits.
+		
+		:returns: A list of the variables, records and arrays.
+		
+		:raises: ValueError
+		"""
+		if digits < 1 or digits > 4 or value < 0 or value >= 16 ** digits:
+			raise ValueError()
+		shift = 4 * (4 - digits)
+		return self.range(value << shift, (value + 1) << shift)
+	
+	@property
+	def frozen(self):
+		""" Returns True if the object dictionary is frozen.
+		"""
+		return self._frozen
+
+
+def _entries(item):
+	""" Returns the entries of the table for the variables of a variable, record or array. """
+	if isinstance(item, Variable):
+		return [((item.index, item.subindex), item)]
+	return [((item.index, variable.subindex), variable) for variable in item]
@@ -0,0 +1,156 @@
+import bisect
+import copy
+import heapq
+from .array import Array
+from .objectdictionary import ObjectDictionary
+from .record import Record
+from .variable import Variable
+
+
+class Overlay(ObjectDictionary):
+	""" Per-node differences to a shared, frozen object dictionary.
+	
+	The overlay holds only the objects added or modified for one node. All other lookups fall through to the base dictionary, thus many nodes can share one base without copying it.
+	Objects of the base can be removed with ``del`` and modified with ``modify``, which stores a mutable copy of the object in the overlay.
+	A frozen overlay has a table of its own for ``variable`` with the variables of the overlay and the visible variables of the base.
+	"""
+	def __init__(self, base):
+		""" Initializes an ``Overlay``.
+		Raises TypeError if the base is not an object dictionary.
+		Raises ValueError if the base is not frozen.
+		
+		:param base: The shared object dictionary. Must be frozen.
+		
+		:raises: TypeError, ValueError
+		"""
+		if not isinstance(base, ObjectDictionary):
+			raise TypeError()
+		if not base.frozen:
+			raise ValueError()
+		ObjectDictionary.__init__(self)
+		self._base = base
+		# The indexes of the objects of the base, which are removed or replaced by the overlay
+		self._hidden = set()
+	
+	def __eq__(self, other):
+		""" Indicates whether some other object is "equal to" this one. Overlays and object dictionaries are equal, if they contain the same objects. """
+		if not isinstance(other, ObjectDictionary):
+			return False
+		return self is other or ({item.index: item for item in self} == {item.index: item for item in other})
+	
+	def __hash__(self):
+		""" Returns the hash of a frozen overlay.
+		Raises TypeError if the overlay is not frozen.
+		
+		:raises: TypeError
+		"""
+		if not self._frozen:
+			raise TypeError()
+		if self._hash == None:
+			self._hash = hash(frozenset((item.index, item) for item in self))
+		return self._hash
+	
+	def __iter__(self):
+		""" Returns an iterator over all objects of the overlay and the visible objects of the base. """
+		for item in self._base:
+			if item.index not in self._hidden:
+				yield item
+		yield from self._items_index.values()
+	
+	def __len__(self):
+		""" Returns the number of objects of the overlay and the visible objects of the base. """
+		return len(self._base) - len(self._hidden) + len(self._items_index)
+	
+	def __getitem__(self, key):
+		""" Returns the variable, record or array identified by the name or the index, from the overlay or else from the base. """
+		if key in self._items_index:
+			return self._items_index[key]
+		if key in self._items_name:
+			return self._items_name[key]
+		item = self._base[key]
+		if item.index in self._hidden:
+			raise KeyError()
+		return item
+	
+	def __delitem__(self, key):
+		""" Removes the variable, record or array identified by the name or the index. Objects of the base are hidden. """
+		if self._frozen:
+			raise TypeError()
+		item = self[key]
+		if item.index in self._items_index:
+			del self._items_index[item.index]
+			del self._items_name[item.name]
+			del self._indexes[bisect.bisect_left(self._indexes, item.index)]
+		if item.index in self._base:
+			self._hidden.add(item.index)
+	
+	def add(self, value):
+		""" Adds a variable, record or array to the overlay. It may be accessed later by the name or the index. """
+		if self._frozen or not isinstance(value, (Array, Record, Variable)):
+			raise TypeError()
+		if value.index in self or value.name in self:
+			raise ValueError()
+		ObjectDictionary.add(self, value)
+		if value.index in self._base:
+			# The object replaces a removed object of the base
+			self._hidden.add(value.index)
+	
+	def modify(self, index, subindex = None):
+		""" Returns a mutable object of the overlay. An object of the base is copied into the overlay on the first call, the base itself is not changed.
+		Raises KeyError if the object is not found.
+		Raises TypeError if the overlay is frozen.
+		
+		:param index: The index of the object.
+		
+		:param subindex: If None, the object at the index is returned. Otherwise the variable at the subindex of the record or array at the index is returned.
+		
+		:returns: The variable, record or array.
+		
+		:raises: KeyError, TypeError
+		"""
+		if self._frozen:
+			raise TypeError()
+		item = self[index]
+		if item.frozen:
+			item = _thaw(item)
+			if item.index not in self._items_index:
+				bisect.insort(self._indexes, item.index)
+			self._items_index[item.index] = item
+			self._items_name[item.name] = item
+			self._hidden.add(item.index)
+		if subindex == None:
+			return item
+		
+		variable = item[subindex]
+		if variable.frozen:
+			variable = _thaw(variable)
+			item._extend([variable])
+		return variable
+	
+	def range(self, start, stop):
+		""" Returns the objects of the overlay and the visible objects of the base with an index from ``start`` up to, but not including, ``stop`` in ascending order of the index.
+		
+		:param start: The first index.
+		
+		:param stop: The index after the last index.
+		
+		:returns: A list of the variables, records and arrays.
+		"""
+		base = [item for item in self._base.range(start, stop) if item.index not in self._hidden]
+		return list(heapq.merge(base, ObjectDictionary.range(self, start, stop), key = lambda item: item.index))
+	
+	@property
+	def base(self):
+		""" Returns the shared object dictionary.
+		"""
+		return self._base
+
+
+def _thaw(item):
+	""" Returns a mutable shallow copy of a frozen variable, record or array. The variables of a record or array stay shared, until they are modified. """
+	item = copy.copy(item)
+	item._frozen = False
+	if hasattr(item, "_items_subindex"):
+		item._items_subindex = dict(item._items_subindex)
+		item._items_name = dict(item._items_name)
+	return item
@@ -0,0 +1,74 @@
+import math
+import canopen.objectdictionary
+from .eds import CACHE_VERSION, _to_tuples, _from_tuples
+
+
+def _literal(value):
+	""" Returns the Python literal of a value of the table. Lists are written as tuples, thus the table is a single constant of the compiled module. """
+	if isinstance(value, (list, tuple)):
+		return "(" + ", ".join(_literal(item) for item in value) + ("," if len(value) == 1 else "") + ")"
+	if isinstance(value, float) and not math.isfinite(value):
+		return "float(\"" + repr(value) + "\")"
+	return repr(value)
+
+
+def dump(dictionary, file, source = None):
+	""" Writes a Python module, which builds the object dictionary.
+	The objects are stored as a table of constants, thus importing the module is fast, especially from the cached ``.pyc`` file. The module has a function ``load``, which returns a new object dictionary on each call.
+	
+	:param dictionary: The object dictionary.
+	
+	:param file: A file object opened for writing in text mode.
+	
+	:param source: The name of the source of the dictionary for the docstring of the module, or None.
+	"""
+	file.write("\"\"\" Object dictionary" + (" of " + repr(source)[1:-1] if source != None else "") + ", generated by canopen.objectdictionary.pymodule. Do not edit.\n\"\"\"\n")
+	file.write("import canopen.objectdictionary.pymodule\n\n\n")
+	file.write("_table = (\n")
+	for item in _to_tuples(dictionary):
+		file.write("\t" + _literal(item) + ",\n")
+	file.write(")\n\n\n")
+	file.write("def load():\n")
+	file.write("\t\"\"\" Returns a new object dictionary. \"\"\"\n")
+	file.write("\treturn canopen.objectdictionary.pymodule.from_table(_table, " + repr(CACHE_VERSION) + ")\n")
+
+
+def from_table(table, version):
+	""" Builds an object dictionary from the table of a generated module.
+	Raises ValueError if the module was generated for another version of the table format.
+	
+	:param table: The table of the module.
+	
+	:param version: The version of the table format of the module.
+	
+	:returns: The object dictionary.
+	
+	:raises: ValueError
+	"""
+	if version != CACHE_VERSION:
+		raise ValueError()
+	return _from_tuples(table)
+
+
+if __name__ == "__main__":
+	import argparse
+	import os
+	import canopen.objectdictionary.tsv
+	import canopen.objectdictionary.xdd
+	
+	parser = argparse.ArgumentParser(description = "Generates a Python module from an EDS, DCF, XDD, XDC or TSV file")
+	parser.add_argument("input", help = "The path of the EDS, DCF, XDD, XDC or TSV file.")
+	parser.add_argument("output", help = "The path of the Python module.")
+	parser.add_argument("--node-id", type = int, help = "The node id for $NODEID.")
+	arguments = parser.parse_args()
+	
+	extension = os.path.splitext(arguments.input)[1].lower()
+	if extension in [".xdd", ".xdc"]:
+		dictionary = canopen.objectdictionary.xdd.load(arguments.input, arguments.node_id)
+	elif extension == ".tsv":
+		with open(arguments.input, "r", newline = "") as f:
+			dictionary = canopen.objectdictionary.tsv.load(f)
+	else:
+		dictionary = canopen.objectdictionary.eds.load(arguments.input, arguments.node_id)
+	with open(arguments.output, "w") as f:
+		dump(dictionary, f, os.path.basename(arguments.input))
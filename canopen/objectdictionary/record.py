@@ -1,4 +1,5 @@
 import collections
+import sys
 from .deftype import DefType
 from .domain import Domain
 from .variable import Variable
@@ -9,21 +10,25 @@ class Record(collections.abc.Collection):
 	
 	This class is the representation of a record of a CANopen object dictionary. It is a mutable auto-associative mapping and may contain zero or more variables.
 	"""
+	__slots__ = ("_name", "_index", "_description", "_data_type", "_items_subindex", "_items_name", "_frozen")
+	
+	_object_type = 9
+	
 	def __init__(self, name, index, data_type, description = ""):
 		if index < 0 or index > 65535:
 			raise ValueError()
 		if int(data_type) < 0x0000 or int(data_type) > 0x1000:
 			raise ValueError()
 		
-		self._name = str(name)
+		self._name = sys.intern(str(name))
 		self._index = int(index)
-		self._description = str(description)
+		self._description = sys.intern(str(description))
 		
-		self._object_type = 9
 		self._data_type = int(data_type)
 		
 		self._items_subindex = {}
 		self._items_name = {}
+		self._frozen = False
 	
 	def __eq__(self, other):
 		""" Indicates whether some other object is "equal to" this one. """
@@ -31,6 +36,16 @@ class Record(collections.abc.Collection):
 			return False
 		return self is other or (self._object_type == other._object_type and self._name == other._name and self._index == other._index and self._description == other._description and self._data_type == other._data_type and self._items_subindex == other._items_subindex)
 	
+	def __hash__(self):
+		""" Returns the hash of a frozen record.
+		Raises TypeError if the record is not frozen.
+		
+		:raises: TypeError
+		"""
+		if not self._frozen:
+			raise TypeError()
+		return hash((self._object_type, self._name, self._index, self._description, self._data_type, frozenset(self._items_subindex.items())))
+	
 	def __contains__(self, key):
 		""" Returns True if the record contains a variable with the specified subindex or name. """
 		try:
@@ -58,12 +73,16 @@ class Record(collections.abc.Collection):
 	
 	def __delitem__(self, key):
 		""" Removes the variable identified by the name of the subindex from the record. """
+		if self._frozen:
+			raise TypeError()
 		item = self[key]
 		del self._items_subindex[item.subindex]
 		del self._items_name[item.name]
 	
 	def add(self, value):
 		""" Adds a variable to the record. It may be accessed later by the name or the subindex. """
+		if self._frozen:
+			raise TypeError()
 		if not isinstance(value, Variable) or isinstance(value, (DefType, Domain)):
 			raise TypeError()
 		if value.subindex in self._items_subindex or value.name in self._items_name:
@@ -74,6 +93,14 @@ class Record(collections.abc.Collection):
 		self._items_subindex[value.subindex] = value
 		self._items_name[value.name] = value
 	
+	def _extend(self, variables):
+		""" Adds the variables to the record without the checks of ``add``, e.g. from a cache, which was checked already when it was written. A variable with the subindex of an existing variable replaces it. """
+		items_subindex = self._items_subindex
+		items_name = self._items_name
+		for variable in variables:
+			items_subindex[variable.subindex] = variable
+			items_name[variable.name] = variable
+	
 	@property
 	def object_type(self):
 		""" Returns the object type as defined in DS301 v4.02 Table 42: Object code usage.
@@ -94,7 +121,9 @@ class Record(collections.abc.Collection):
 	
 	@description.setter
 	def description(self, x):
-		self._description = x
+		if self._frozen:
+			raise AttributeError()
+		self._description = sys.intern(x) if type(x) == str else x
 	
 	@property
 	def data_type(self):
@@ -102,3 +131,16 @@ class Record(collections.abc.Collection):
 		Returns the data type as defined in DS301 v4.02 Table 44: Object dictionary data types.
 		"""
 		return self._data_type
+	
+	def freeze(self):
+		""" Makes the record and all its variables read-only. Afterwards ``add`` and ``del`` raise TypeError and the setters raise AttributeError.
+		"""
+		for item in self._items_subindex.values():
+			item.freeze()
+		self._frozen = True
+	
+	@property
+	def frozen(self):
+		""" Returns True if the record is frozen.
+		"""
+		return self._frozen
@@ -1,13 +1,120 @@
 import struct
 import calendar
+import sys
 from .datatypes import *
 
 
+_canopen_epoch = calendar.timegm((1984, 1, 1, 0, 0, 0))
+
+
+def _struct_codec(format):
+	""" Returns the decoder and the encoder for a data type, which is represented by a single value of a precompiled ``struct.Struct``. """
+	codec = struct.Struct(format)
+	unpack_from = codec.unpack_from
+	def decode(data):
+		return unpack_from(data)[0]
+	return decode, codec.pack
+
+
+def _int_codec(length, signed):
+	""" Returns the decoder and the encoder for an integer data type of a length, for which no ``struct`` format exists. """
+	def decode(data):
+		if len(data) < length:
+			raise ValueError()
+		return int.from_bytes(data[0:length], "little", signed = signed)
+	def encode(value):
+		return int.to_bytes(value, length, "little", signed = signed)
+	return decode, encode
+
+
+def _string_codec(encoding):
+	""" Returns the decoder and the encoder for a string data type. """
+	def decode(data):
+		return bytes.decode(data, encoding, errors = "replace")
+	def encode(value):
+		return str.encode(value, encoding)
+	return decode, encode
+
+
+_time = struct.Struct("<LH")
+
+
+def _decode_time_of_day(data):
+	m, d = _time.unpack_from(data)
+	m &= 0xFFFFFFF
+	return d * 24 * 60 * 60 + m / 1000 + _canopen_epoch
+
+
+def _encode_time_of_day(value):
+	if value < _canopen_epoch:
+		raise ValueError()
+	x = divmod(value - _canopen_epoch, 24 * 60 * 60)
+	return _time.pack(round(x[1] * 1000), int(x[0]))
+
+
+def _decode_time_difference(data):
+	m, d = _time.unpack_from(data)
+	m &= 0xFFFFFFF
+	return d * 24 * 60 * 60 + m / 1000
+
+
+def _encode_time_difference(value):
+	if value < 0:
+		raise ValueError()
+	x = divmod(value, 24 * 60 * 60)
+	return _time.pack(round(x[1] * 1000), int(x[0]))
+
+
+def _decode_domain(data):
+	return data
+
+
+_codecs = {
+	BOOLEAN: _struct_codec("<?"),
+	INTEGER8: _struct_codec("<b"),
+	INTEGER16: _struct_codec("<h"),
+	INTEGER32: _struct_codec("<l"),
+	UNSIGNED8: _struct_codec("<B"),
+	UNSIGNED16: _struct_codec("<H"),
+	UNSIGNED32: _struct_codec("<L"),
+	REAL32: _struct_codec("<f"),
+	VISIBLE_STRING: _string_codec("ascii"),
+	OCTET_STRING: _string_codec("utf-8"),
+	UNICODE_STRING: _string_codec("utf-16-le"),
+	TIME_OF_DAY: (_decode_time_of_day, _encode_time_of_day),
+	TIME_DIFFERENCE: (_decode_time_difference, _encode_time_difference),
+	DOMAIN: (_decode_domain, bytes),
+	INTEGER24: _int_codec(3, True),
+	REAL64: _struct_codec("<d"),
+	INTEGER40: _int_codec(5, True),
+	INTEGER48: _int_codec(6, True),
+	INTEGER56: _int_codec(7, True),
+	INTEGER64: _struct_codec("<q"),
+	UNSIGNED24: _int_codec(3, False),
+	UNSIGNED40: _int_codec(5, False),
+	UNSIGNED48: _int_codec(6, False),
+	UNSIGNED56: _int_codec(7, False),
+	UNSIGNED64: _struct_codec("<Q")}
+
+
+# The shared instances of the strings of the access types and mappings
+_access_types = {x: x for x in ["rw", "wo", "ro", "const"]}
+
+_mappings = {x: x for x in ["r", "t", "tr", "no"]}
+
+
 class Variable(object):
 	"""	This class is the representation of a Variable in an object dictionary.
+	
+	As a device profile contains thousands of variables, the instances use ``__slots__``, share the strings of the names and descriptions by interning them and share the default values, which depend on the data type only.
+	A frozen variable is read-only and hashable.
 	"""
+	__slots__ = ("_name", "_index", "_subindex", "_description", "_pdo_mapping", "_srdo_mapping", "_data_type", "_access_type", "_default_value", "_decoder", "_encoder", "_frozen")
+	
+	_object_type = 7
 	
-	_canopen_epoch = calendar.timegm((1984, 1, 1, 0, 0, 0))
+	_canopen_epoch = _canopen_epoch
+	__default_values = {BOOLEAN: False, REAL32: 0.0, REAL64: 0.0, VISIBLE_STRING: "", OCTET_STRING: "", UNICODE_STRING: "", DOMAIN: b"", TIME_OF_DAY: _canopen_epoch}
 	__sizes = {BOOLEAN: 1, INTEGER8: 8, INTEGER16: 16, INTEGER32: 32, UNSIGNED8: 8, UNSIGNED16: 16, UNSIGNED32: 32, REAL32: 32, VISIBLE_STRING: 0, OCTET_STRING: 0, UNICODE_STRING: 0, TIME_OF_DAY: 48, TIME_DIFFERENCE: 48, DOMAIN: 0, INTEGER24: 24, REAL64: 64, INTEGER40: 40, INTEGER48: 48, INTEGER56: 56, INTEGER64: 64, UNSIGNED24: 24, UNSIGNED40: 40, UNSIGNED48: 48, UNSIGNED56: 56, UNSIGNED64: 64}
 	
 	def __init__(self, name, index, subindex, data_type, access_type = "rw", description = "", pdo_mapping = "no", srdo_mapping = "no"):
@@ -39,234 +146,72 @@ class Variable(object):
 		if access_type not in ["rw", "wo", "ro", "const"]:
 			raise ValueError()
 		
-		self._name = str(name)
+		self._frozen = False
+		self._name = sys.intern(str(name))
 		self._index = int(index)
-		self._description = str(description)
+		self._description = sys.intern(str(description))
 		self.pdo_mapping = str(pdo_mapping)
 		self.srdo_mapping = str(srdo_mapping)
 		
-		self._object_type = 7
 		self._subindex = int(subindex)
 		self._data_type = int(data_type)
-		self._access_type = str(access_type)
-		
-		if self._data_type == BOOLEAN:
-			self._default_value = False
-		elif self._data_type in [REAL32, REAL64]:
-			self._default_value = 0.0	
-		elif self._data_type in [VISIBLE_STRING, OCTET_STRING, UNICODE_STRING]:
-			self._default_value = ""
-		elif self._data_type == DOMAIN:
-			self._default_value = b""
-		elif self._data_type == TIME_OF_DAY:
-			self._default_value = self._canopen_epoch
-		else:
-			self._default_value = 0
+		self._access_type = _access_types[access_type]
+		# The codec is bound once, thus encode and decode need no tests of the data type
+		self._decoder, self._encoder = _codecs[self._data_type]
+		self._default_value = self.__default_values.get(self._data_type, 0)
+	
+	@classmethod
+	def _restore(cls, name, index, subindex, data_type, access_type, description, pdo_mapping, srdo_mapping, default_value):
+		""" Creates a variable from values, which are already validated, e.g. by a cache, without the checks of ``__init__``. """
+		variable = cls.__new__(cls)
+		variable._frozen = False
+		variable._name = sys.intern(name)
+		variable._index = index
+		variable._subindex = subindex
+		variable._description = sys.intern(description)
+		variable._pdo_mapping = _mappings[pdo_mapping]
+		variable._srdo_mapping = _mappings[srdo_mapping]
+		variable._data_type = data_type
+		variable._access_type = _access_types[access_type]
+		variable._decoder, variable._encoder = _codecs[data_type]
+		variable._default_value = default_value
+		return variable
 	
 	def __eq__(self, other):
 		""" Indicates whether some other object is "equal to" this one. """
 		if type(self) != type(other):
 			return False
 		return self is other or (self._object_type == other._object_type and self._name == other._name and self._index == other._index and self._description == other._description and self._subindex == other._subindex and self._data_type == other._data_type and self._access_type == other._access_type and self._default_value == other.default_value)
+	
+	def __hash__(self):
+		""" Returns the hash of a frozen variable.
+		Raises TypeError if the variable is not frozen.
 		
+		:raises: TypeError
+		"""
+		if not self._frozen:
+			raise TypeError()
+		return hash((self._object_type, self._name, self._index, self._subindex, self._data_type, self._access_type, self._description, self._default_value))
+	
+	def freeze(self):
+		""" Makes the variable read-only. Afterwards the setters raise AttributeError.
+		"""
+		self._frozen = True
+	
 	def decode(self, data):
 		""" Returns the value for the given byte-like CANopen representation, depending on the type of the CANopen variable. """
-		value = None
-		
 		try:
-			if self._data_type == BOOLEAN:
-				value, = struct.unpack_from("<?", data)
-			
-			if self._data_type == INTEGER8:
-				value, = struct.unpack_from("<b", data)
-			
-			if self._data_type == INTEGER16:
-				value, = struct.unpack_from("<h", data)
-			
-			if self._data_type == INTEGER32:
-				value, = struct.unpack_from("<l", data)
-			
-			if self._data_type == UNSIGNED8:
-				value, = struct.unpack_from("<B", data)
-			
-			if self._data_type == UNSIGNED16:
-				value, = struct.unpack_from("<H", data)
-			
-			if self._data_type == UNSIGNED32:
-				value, = struct.unpack_from("<L", data)
-			
-			if self._data_type == REAL32:
-				value, = struct.unpack_from("<f", data)
-			
-			if self._data_type == VISIBLE_STRING:
-				value = bytes.decode(data, "ascii", errors = "replace")
-			
-			if self._data_type == OCTET_STRING:
-				value = bytes.decode(data, "utf-8", errors = "replace")
-			
-			if self._data_type == UNICODE_STRING:
-				value = bytes.decode(data, "utf-16-le", errors = "replace")
-			
-			if self._data_type == TIME_OF_DAY:
-				m, d = struct.unpack_from("<LH", data)
-				m &= 0xFFFFFFF
-				value = d * 24 * 60 * 60 + m / 1000 + self._canopen_epoch
-			
-			if self._data_type == TIME_DIFFERENCE:
-				m, d = struct.unpack_from("<LH", data)
-				m &= 0xFFFFFFF
-				value = d * 24 * 60 * 60 + m / 1000
-			
-			if self._data_type == DOMAIN:
-				value = data
-			
-			if self._data_type == INTEGER24:
-				if len(data) < 3:
-					raise ValueError()
-				value = int.from_bytes(data[0:3], "little", signed = True)
-			
-			if self._data_type == REAL64:
-				value, = struct.unpack_from("<q", data)
-			
-			if self._data_type == INTEGER40:
-				if len(data) < 5:
-					raise ValueError()
-				value = int.from_bytes(data[0:5], "little", signed = True)
-			
-			if self._data_type == INTEGER48:
-				if len(data) < 6:
-					raise ValueError()
-				value = int.from_bytes(data[0:6], "little", signed = True)
-			
-			if self._data_type == INTEGER56:
-				if len(data) < 7:
-					raise ValueError()
-				value = int.from_bytes(data[0:7], "little", signed = True)
-			
-			if self._data_type == INTEGER64:
-				value, = struct.unpack_from("<q", data)
-			
-			if self._data_type == UNSIGNED24:
-				if len(data) < 3:
-					raise ValueError()
-				value = int.from_bytes(data[0:3], "little", signed = False)
-			
-			if self._data_type == UNSIGNED40:
-				if len(data) < 5:
-					raise ValueError()
-				value = int.from_bytes(data[0:5], "little", signed = False)
-			
-			if self._data_type == UNSIGNED48:
-				if len(data) < 6:
-					raise ValueError()
-				value = int.from_bytes(data[0:6], "little", signed = False)
-			
-			if self._data_type == UNSIGNED56:
-				if len(data) < 7:
-					raise ValueError()
-				value = int.from_bytes(data[0:7], "little", signed = False)
-			
-			if self._data_type == UNSIGNED64:
-				value, = struct.unpack_from("<Q", data)
+			return self._decoder(data)
 		except:
 			raise ValueError()
-		
-		return value
 	
 	def encode(self, value):
 		""" Returns the byte-like CANopen representation of the given value, depending on the type of the CANopen variable. """
-		data = None
-		
 		try:
-			if self._data_type == BOOLEAN:
-				data = struct.pack("?", value)
-			
-			if self._data_type == INTEGER8:
-				data = struct.pack("<b", value)
-			
-			if self._data_type == INTEGER16:
-				data = struct.pack("<h", value)
-			
-			if self._data_type == INTEGER32:
-				data = struct.pack("<l", value)
-			
-			if self._data_type == UNSIGNED8:
-				data = struct.pack("<B", value)
-			
-			if self._data_type == UNSIGNED16:
-				data = struct.pack("<H", value)
-			
-			if self._data_type == UNSIGNED32:
-				data = struct.pack("<L", value)
-			
-			if self._data_type == REAL32:
-				data = struct.pack("<f", value)
-			
-			if self._data_type == VISIBLE_STRING:
-				data = str.encode(value, "ascii")
-			
-			if self._data_type == OCTET_STRING:
-				data = str.encode(value, "utf-8")
-			
-			if self._data_type == UNICODE_STRING:
-				data = str.encode(value, "utf-16-le")
-			
-			if self._data_type == TIME_OF_DAY:
-				if value < self._canopen_epoch:
-					raise ValueError()
-				x = divmod(value - self._canopen_epoch, 24 * 60 * 60)
-				d = int(x[0])
-				m = round(x[1] * 1000)
-				data = struct.pack("<LH", m, d)
-			
-			if self._data_type == TIME_DIFFERENCE:
-				if value < 0:
-					raise ValueError()
-				x = divmod(value, 24 * 60 * 60)
-				d = int(x[0])
-				m = round(x[1] * 1000)
-				data = struct.pack("<LH", m, d)
-			
-			if self._data_type == DOMAIN:
-				data = bytes(value)
-			
-			if self._data_type == INTEGER24:
-				data = int.to_bytes(value, 3, "little", signed = True)
-			
-			if self._data_type == REAL64:
-				data = struct.pack("<d", value)
-			
-			if self._data_type == INTEGER40:
-				data = int.to_bytes(value, 5, "little", signed = True)
-			
-			if self._data_type == INTEGER48:
-				data = int.to_bytes(value, 6, "little", signed = True)
-			
-			if self._data_type == INTEGER56:
-				data = int.to_bytes(value, 7, "little", signed = True)
-			
-			if self._data_type == INTEGER64:
-				data = struct.pack("<q", value)
-			
-			if self._data_type == UNSIGNED24:
-				data = int.to_bytes(value, 3, "little", signed = False)
-			
-			if self._data_type == UNSIGNED40:
-				data = int.to_bytes(value, 5, "little", signed = False)
-			
-			if self._data_type == UNSIGNED48:
-				data = int.to_bytes(value, 6, "little", signed = False)
-			
-			if self._data_type == UNSIGNED56:
-				data = int.to_bytes(value, 7, "little", signed = False)
-			
-			if self._data_type == UNSIGNED64:
-				data = struct.pack("<Q", value)
+			return self._encoder(value)
 		except:
 			raise ValueError()
-		
-		return data
-		
+	
 	@property
 	def object_type(self):
 		""" Returns the object type as defined in DS301 v4.02 Table 42: Object code usage.
@@ -293,7 +238,9 @@ class Variable(object):
 	
 	@description.setter
 	def description(self, x):
-		self._description = x
+		if self._frozen:
+			raise AttributeError()
+		self._description = sys.intern(x) if type(x) == str else x
 	
 	@property
 	def subindex(self):
@@ -315,9 +262,11 @@ class Variable(object):
 	
 	@access_type.setter
 	def access_type(self, x):
+		if self._frozen:
+			raise AttributeError()
 		if x not in ["rw", "wo", "ro", "const"]:
 			raise ValueError()
-		self._access_type = x
+		self._access_type = _access_types[x]
 	
 	@property
 	def default_value(self):
@@ -327,6 +276,8 @@ class Variable(object):
 	
 	@default_value.setter
 	def default_value(self, x):
+		if self._frozen:
+			raise AttributeError()
 		self._default_value = x
 	
 	@property
@@ -342,9 +293,11 @@ class Variable(object):
 	
 	@pdo_mapping.setter
 	def pdo_mapping(self, x):
+		if self._frozen:
+			raise AttributeError()
 		if x not in ["r", "t", "tr", "no"]:
 			raise ValueError()
-		self._pdo_mapping = x
+		self._pdo_mapping = _mappings[x]
 	
 	@property
 	def srdo_mapping(self):
@@ -352,6 +305,14 @@ class Variable(object):
 	
 	@srdo_mapping.setter
 	def srdo_mapping(self, x):
+		if self._frozen:
+			raise AttributeError()
 		if x not in ["r", "t", "tr", "no"]:
 			raise ValueError()
-		self._srdo_mapping = x
+		self._srdo_mapping = _mappings[x]
+	
+	@property
+	def frozen(self):
+		""" Returns True if the variable is frozen.
+		"""
+		return self._frozen
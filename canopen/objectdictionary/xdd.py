@@ -0,0 +1,173 @@
+import xml.etree.ElementTree
+import canopen.objectdictionary
+from .eds import _access_types, _pdo_mappings, _integer, _value
+
+
+# The access types of EDS files by the access of parameters of the ApplicationProcess. Parameters, which are not accessible by the network, are read-only.
+_parameter_access_types = {"const": "const", "read": "ro", "write": "wo", "readwrite": "rw", "readwriteinput": "rww", "readwriteoutput": "rwr", "noaccess": "ro"}
+
+# The data types by the elementary data types of IEC 61131-3 of parameters of the ApplicationProcess
+_parameter_data_types = {"BOOL": canopen.objectdictionary.BOOLEAN,
+	"SINT": canopen.objectdictionary.INTEGER8, "INT": canopen.objectdictionary.INTEGER16, "DINT": canopen.objectdictionary.INTEGER32, "LINT": canopen.objectdictionary.INTEGER64,
+	"USINT": canopen.objectdictionary.UNSIGNED8, "UINT": canopen.objectdictionary.UNSIGNED16, "UDINT": canopen.objectdictionary.UNSIGNED32, "ULINT": canopen.objectdictionary.UNSIGNED64,
+	"BYTE": canopen.objectdictionary.UNSIGNED8, "WORD": canopen.objectdictionary.UNSIGNED16, "DWORD": canopen.objectdictionary.UNSIGNED32, "LWORD": canopen.objectdictionary.UNSIGNED64,
+	"REAL": canopen.objectdictionary.REAL32, "LREAL": canopen.objectdictionary.REAL64,
+	"STRING": canopen.objectdictionary.VISIBLE_STRING, "WSTRING": canopen.objectdictionary.UNICODE_STRING}
+
+
+def _local_name(tag):
+	""" Returns the tag without the namespace. """
+	return tag.rpartition("}")[2]
+
+
+def load(file, node_id = None):
+	""" Loads an object dictionary from an XDD or XDC file (CiA 311).
+	The file is parsed incrementally and each element is discarded as soon as it is processed, thus the memory needed for parsing does not depend on the size of the file.
+	For a XDC file, the ``actualValue`` of an object is used as default value, if present. ``$NODEID`` in values is replaced by the node id.
+	An object with a ``uniqueIDRef`` takes the data type, the access type and the value, which it does not define itself, from the referenced parameter of the ``ApplicationProcess``.
+	Raises ValueError if the file contains an invalid object or an object refers to an unknown parameter.
+	
+	:param file: The path of the file or a binary file object opened for reading.
+	
+	:param node_id: The node id for ``$NODEID``. If None, the ``nodeID`` of the ``deviceCommissioning`` element of a XDC file or 0 is used.
+	
+	:returns: The object dictionary.
+	
+	:raises: ValueError
+	"""
+	dictionary = canopen.ObjectDictionary()
+	# Variables with $NODEID in the value. The node id of a XDC file is known only at the end, as the deviceCommissioning element follows the objects.
+	pending = []
+	commissioned_node_id = None
+	# The parameters of the ApplicationProcess by the unique id. The device profile precedes the communication network profile, thus they are known before the objects.
+	parameters = {}
+	
+	stack = []
+	for event, element in xml.etree.ElementTree.iterparse(file, events = ("start", "end")):
+		if event == "start":
+			stack.append(element)
+			continue
+		
+		stack.pop()
+		name = _local_name(element.tag)
+		if name == "CANopenObject":
+			dictionary.add(_object(element, pending, parameters))
+		elif name == "deviceCommissioning":
+			commissioned_node_id = element.get("nodeID")
+		elif name == "parameter" and stack and _local_name(stack[-1].tag) == "parameterList":
+			parameters[element.get("uniqueID")] = _parameter(element)
+		elif name == "CANopenSubObject" or (stack and _local_name(stack[-1].tag) in ["CANopenObject", "parameter"]):
+			# Sub-objects and the children of parameters are processed with their object or parameter
+			continue
+		
+		# Discard the element, so the tree does not grow
+		element.clear()
+		if stack:
+			stack[-1].remove(element)
+	
+	if node_id == None:
+		node_id = _integer(commissioned_node_id, 0) if commissioned_node_id else 0
+	for variable, value in pending:
+		value = _value(value, variable.data_type, node_id)
+		if value != None:
+			variable.default_value = value
+	
+	return dictionary
+
+
+def _parameter(element):
+	""" Returns the access type, the data type and the value of a parameter of the ApplicationProcess. The actual value is preferred over the default value.
+	Raises ValueError if the access is invalid.
+	
+	:raises: ValueError
+	"""
+	access_type = _parameter_access_types.get(element.get("access", "read").lower())
+	if access_type == None:
+		raise ValueError()
+	data_type = canopen.objectdictionary.UNSIGNED32
+	default_value = None
+	actual_value = None
+	for child in element:
+		name = _local_name(child.tag)
+		if name in _parameter_data_types:
+			data_type = _parameter_data_types[name]
+		elif name == "defaultValue":
+			default_value = child.get("value")
+		elif name == "actualValue":
+			actual_value = child.get("value")
+	if actual_value == None or actual_value == "":
+		actual_value = default_value
+	return access_type, data_type, actual_value
+
+
+def _variable(element, index, subindex, pending, parameters):
+	reference = element.get("uniqueIDRef")
+	if reference != None:
+		if reference not in parameters:
+			raise ValueError()
+		parameter_access_type, parameter_data_type, parameter_value = parameters[reference]
+	else:
+		parameter_access_type, parameter_data_type, parameter_value = "rw", canopen.objectdictionary.UNSIGNED32, None
+	
+	data_type = element.get("dataType")
+	data_type = _integer("0x" + data_type, 0) if data_type != None else parameter_data_type
+	xdd_access_type = element.get("accessType", parameter_access_type).lower()
+	if xdd_access_type not in _access_types:
+		raise ValueError()
+	mapping = element.get("PDOmapping", "no")
+	if mapping == "TPDO":
+		pdo_mapping = "t"
+	elif mapping == "RPDO":
+		pdo_mapping = "r"
+	elif mapping in ["default", "optional"]:
+		pdo_mapping = _pdo_mappings[xdd_access_type]
+	else:
+		pdo_mapping = "no"
+	
+	variable = canopen.objectdictionary.Variable(element.get("name", ""), index, subindex, data_type, _access_types[xdd_access_type], "", pdo_mapping)
+	value = element.get("actualValue")
+	if value == None or value == "":
+		value = element.get("defaultValue")
+	if value == None or value == "":
+		value = parameter_value
+	if value != None and "$" in value:
+		pending.append((variable, value))
+	else:
+		value = _value(value, data_type, 0)
+		if value != None:
+			variable.default_value = value
+	return variable
+
+
+def _object(element, pending, parameters):
+	""" Builds the object of a CANopenObject element with its sub-objects. """
+	try:
+		index = int(element.get("index"), 16)
+		object_type = int(element.get("objectType", "7"))
+	except (TypeError, ValueError):
+		raise ValueError()
+	name = element.get("name", "")
+	
+	if object_type == 2:
+		return canopen.objectdictionary.Domain(name, index, _access_types.get(element.get("accessType", "rw").lower(), "rw"))
+	if object_type == 5:
+		return canopen.objectdictionary.DefType(name, index)
+	if object_type == 7:
+		return _variable(element, index, 0, pending, parameters)
+	if object_type == 6:
+		o = canopen.objectdictionary.DefStruct(name, index)
+	elif object_type == 8:
+		o = canopen.objectdictionary.Array(name, index, _integer("0x" + element.get("dataType", "0"), 0))
+	elif object_type == 9:
+		o = canopen.objectdictionary.Record(name, index, _integer("0x" + element.get("dataType", "0"), 0))
+	else:
+		raise ValueError()
+	
+	for child in element:
+		if _local_name(child.tag) == "CANopenSubObject":
+			try:
+				subindex = int(child.get("subIndex"), 16)
+			except (TypeError, ValueError):
+				raise ValueError()
+			o.add(_variable(child, index, subindex, pending, parameters))
+	return o
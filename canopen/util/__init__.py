@@ -1 +1,4 @@
+from canopen.util.asyncbatcher import AsyncBatcher
+from canopen.util.asynccondition import AsyncCondition
+from canopen.util.scheduler import Scheduler
 from canopen.util.timer import Timer
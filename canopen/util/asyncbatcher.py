@@ -0,0 +1,106 @@
+import asyncio
+import collections
+import sys
+import threading
+import weakref
+
+
+class AsyncBatcher(object):
+	""" Runs coroutine functions on an event loop, called from any thread.
+	
+	The calls are queued and the event loop is woken up with ``call_soon_threadsafe`` only for the first call of a burst. The wake-up starts tasks for all calls queued until then, thus a burst of frames needs one wake-up instead of one per frame.
+	There is one ``AsyncBatcher`` per event loop, which is returned by ``AsyncBatcher.for_loop``.
+	"""
+	_instances = weakref.WeakKeyDictionary()
+	_instances_lock = threading.Lock()
+	
+	def __init__(self, loop):
+		""" Initializes an ``AsyncBatcher``.
+		
+		:param loop: The event loop to run the coroutines on.
+		"""
+		# A weak reference, as the batcher is the value of the loop in the weak dictionary of the instances
+		self._loop = weakref.ref(loop)
+		self._lock = threading.Lock()
+		self._pending = collections.deque()
+		self._scheduled = False
+		self._wakeups = 0
+	
+	@classmethod
+	def for_loop(cls, loop):
+		""" Returns the shared batcher of the event loop.
+		
+		:param loop: The event loop.
+		"""
+		with cls._instances_lock:
+			batcher = cls._instances.get(loop)
+			if batcher == None:
+				batcher = AsyncBatcher(loop)
+				cls._instances[loop] = batcher
+			return batcher
+	
+	def submit(self, function, args, done = None):
+		""" Queues a call of the coroutine function ``function`` with ``args``.
+		If the event loop is closed, the call is dropped.
+		
+		:param function: The coroutine function.
+		
+		:param args: A tuple of the arguments.
+		
+		:param done: A function, which is added as done callback to the task of the call, or None. If the call of the coroutine function raises an exception, it is called with a future, which holds the exception. Without a done callback, the exception is passed to the exception handler of the event loop.
+		"""
+		with self._lock:
+			self._pending.append((function, args, done))
+			if self._scheduled:
+				return
+			self._scheduled = True
+			self._wakeups += 1
+		try:
+			loop = self._loop()
+			if loop == None:
+				raise RuntimeError()
+			loop.call_soon_threadsafe(self._run)
+		except RuntimeError:
+			# The event loop is closed or gone
+			with self._lock:
+				self._pending.clear()
+				self._scheduled = False
+	
+	def _run(self):
+		with self._lock:
+			pending = self._pending
+			self._pending = collections.deque()
+			self._scheduled = False
+		loop = self._loop()
+		for function, args, done in pending:
+			try:
+				task = asyncio.ensure_future(function(*args), loop = loop)
+			except:
+				exception = sys.exc_info()[1]
+				if done == None:
+					loop.call_exception_handler({"message": "Exception in a call of AsyncBatcher", "exception": exception})
+					continue
+				# The exception takes the same path as an exception of a task
+				task = loop.create_future()
+				task.set_exception(exception)
+			if done != None:
+				task.add_done_callback(done)
+	
+	@property
+	def loop(self):
+		""" Returns the event loop or None, if it does not exist anymore.
+		"""
+		return self._loop()
+	
+	@property
+	def pending(self):
+		""" Returns the number of queued calls, for which no task is started yet.
+		"""
+		with self._lock:
+			return len(self._pending)
+	
+	@property
+	def wakeups(self):
+		""" Returns the number of wake-ups of the event loop.
+		"""
+		return self._wakeups
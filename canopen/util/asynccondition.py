@@ -0,0 +1,78 @@
+import asyncio
+import threading
+
+
+def _running_loop():
+	""" Returns the running event loop of the calling thread.
+	Raises RuntimeError if no event loop is running.
+	
+	:raises: RuntimeError
+	"""
+	# asyncio.get_running_loop is available since Python 3.7
+	if hasattr(asyncio, "get_running_loop"):
+		return asyncio.get_running_loop()
+	loop = asyncio._get_running_loop()
+	if loop == None:
+		raise RuntimeError()
+	return loop
+
+
+class AsyncCondition(object):
+	""" Awaitable counterpart of ``threading.Condition.wait`` and ``notify_all``.
+	
+	Any number of coroutines may wait for the next notification. All coroutines of one event loop share one future, thus a notification needs one wake-up per event loop, independent of the number of waiting coroutines.
+	``notify_all`` may be called from any thread.
+	"""
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._futures = {}
+	
+	def waiter(self):
+		""" Returns the future for the next notification on the running event loop of the caller.
+		The future is registered immediately, thus no notification is lost between the call of this method and awaiting the future.
+		Raises RuntimeError if no event loop is running.
+		
+		:raises: RuntimeError
+		"""
+		loop = _running_loop()
+		with self._lock:
+			future = self._futures.get(loop)
+			if future == None:
+				future = loop.create_future()
+				self._futures[loop] = future
+		return future
+	
+	async def wait(self, timeout = None, waiter = None):
+		""" Waits until the next notification or until a timeout occurs.
+		
+		:param timeout: The time to wait in seconds, or ``None``
+		
+		:param waiter: A future returned by ``waiter``. If None, a waiter is registered at the call of this method.
+		
+		:returns: True if the notification occured, False if the timeout occured.
+		"""
+		if waiter == None:
+			waiter = self.waiter()
+		try:
+			await asyncio.wait_for(asyncio.shield(waiter), timeout)
+		except asyncio.TimeoutError:
+			return False
+		return True
+	
+	def notify_all(self):
+		""" Wakes up all waiting coroutines.
+		"""
+		with self._lock:
+			futures = self._futures
+			self._futures = {}
+		for loop, future in futures.items():
+			try:
+				loop.call_soon_threadsafe(_resolve, future)
+			except RuntimeError:
+				# The event loop is closed
+				pass
+
+
+def _resolve(future):
+	if not future.done():
+		future.set_result(True)
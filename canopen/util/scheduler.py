@@ -0,0 +1,321 @@
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+
+class Scheduler(object):
+	""" Scheduler for deadlines, driven by one thread.
+	
+	The deadlines are kept in a heap and the thread sleeps until the earliest deadline. Scheduling a deadline wakes up the thread only if it is earlier than all pending deadlines and cancelling a deadline is O(1) without waking up the thread.
+	Without workers, the functions are called one after another by the thread of the scheduler, thus they should return quickly. With workers, the thread only passes the expired functions to a pool of worker threads, thus a slow function does not delay the other deadlines. The pool has no fixed size: a worker is started whenever all workers are busy and a worker, which has been idle for ``IDLE_TIMEOUT`` seconds, ends. Exceptions raised by the functions are dropped.
+	
+	All ``Timer`` instances share the scheduler returned by ``Scheduler.default``, which has workers.
+	
+	For a high resolution, a spin window can be set. The thread then wakes up this time before each deadline and busy-waits for the rest, which avoids the granularity of the wait functions of the operating system at the cost of CPU time.
+	"""
+	#: The maximum number of idle schedulers kept for reuse by ``acquire``
+	POOL_SIZE = 4
+	#: The time in seconds after which an idle worker thread ends
+	IDLE_TIMEOUT = 10.0
+	
+	_default = None
+	_default_lock = threading.Lock()
+	_pool = []
+	
+	def __init__(self, spin = 0.0, workers = False):
+		""" Initializes a ``Scheduler``. The thread is started with the first scheduled deadline.
+		Raises ValueError if the spin window is negative.
+		
+		:param spin: The spin window in seconds. If 0, no busy-waiting is done.
+		
+		:param workers: If True, the expired functions are called by a pool of worker threads. Otherwise they are called by the thread of the scheduler.
+		
+		:raises: ValueError
+		"""
+		if spin < 0:
+			raise ValueError()
+		
+		self._spin = spin
+		self._workers = _Workers(self) if workers else None
+		self._heap = []
+		self._sequence = itertools.count()
+		self._cancelled = 0
+		self._lock = threading.Lock()
+		self._wakeup = threading.Condition(self._lock)
+		self._thread = None
+		self._terminate = False
+	
+	@classmethod
+	def default(cls):
+		""" Returns the shared scheduler of the process.
+		"""
+		with cls._default_lock:
+			if cls._default == None:
+				cls._default = Scheduler(workers = True)
+			return cls._default
+	
+	@classmethod
+	def acquire(cls, spin = 0.0):
+		""" Returns a scheduler for exclusive use, e.g. by a high resolution timer. An idle scheduler released before is reused, thus its thread is not started again.
+		The scheduler has no workers, thus the functions are called by its thread without the latency of a worker.
+		Raises ValueError if the spin window is negative.
+		
+		:param spin: The spin window in seconds.
+		
+		:raises: ValueError
+		"""
+		if spin < 0:
+			raise ValueError()
+		with cls._default_lock:
+			if cls._pool:
+				scheduler = cls._pool.pop()
+				with scheduler._lock:
+					scheduler._spin = spin
+				return scheduler
+		return Scheduler(spin)
+	
+	@classmethod
+	def release(cls, scheduler):
+		""" Returns a scheduler obtained by ``acquire``. It is kept for reuse, if the pool is not full, otherwise it is stopped. All deadlines scheduled with it must be cancelled before.
+		
+		:param scheduler: The scheduler to release.
+		"""
+		with cls._default_lock:
+			if len(cls._pool) < cls.POOL_SIZE:
+				cls._pool.append(scheduler)
+				return
+		scheduler.stop()
+	
+	def schedule(self, deadline, function, *args):
+		""" Schedules a call of ``function`` with ``args`` at the deadline.
+		Raises RuntimeError if the scheduler is stopped.
+		
+		:param deadline: The deadline in seconds of ``time.perf_counter``.
+		
+		:param function: The function to call.
+		
+		:param args: The arguments to pass to the function.
+		
+		:returns: A handle with a ``cancel`` method.
+		
+		:raises: RuntimeError
+		"""
+		entry = _Entry(self, function, args)
+		with self._lock:
+			if self._terminate:
+				raise RuntimeError()
+			if self._thread == None:
+				self._thread = threading.Thread(target = self._run, daemon = True)
+				self._thread.start()
+			
+			heapq.heappush(self._heap, (deadline, next(self._sequence), entry))
+			if self._heap[0][2] is entry:
+				self._wakeup.notify()
+		return entry
+	
+	def call_later(self, delay, function, *args):
+		""" Schedules a call of ``function`` with ``args`` after ``delay`` seconds.
+		Raises RuntimeError if the scheduler is stopped.
+		
+		:param delay: The delay in seconds.
+		
+		:param function: The function to call.
+		
+		:param args: The arguments to pass to the function.
+		
+		:returns: A handle with a ``cancel`` method.
+		
+		:raises: RuntimeError
+		"""
+		return self.schedule(time.perf_counter() + delay, function, *args)
+	
+	def stop(self):
+		""" Stops the thread and the workers. Pending deadlines and calls are discarded.
+		"""
+		with self._lock:
+			self._terminate = True
+			self._heap.clear()
+			self._wakeup.notify()
+			thread = self._thread
+		if thread != None and thread is not threading.current_thread():
+			thread.join()
+		if self._workers != None:
+			self._workers.stop()
+	
+	@property
+	def spin(self):
+		""" Returns the spin window in seconds.
+		"""
+		return self._spin
+	
+	@property
+	def workers(self):
+		""" Returns the number of running worker threads or None if the functions are called by the thread of the scheduler.
+		"""
+		return self._workers.count if self._workers != None else None
+	
+	@property
+	def pending(self):
+		""" Returns the number of pending deadlines.
+		"""
+		with self._lock:
+			return len(self._heap) - self._cancelled
+	
+	def _cancel(self, entry):
+		with self._lock:
+			if entry.queued:
+				entry.queued = False
+				self._cancelled += 1
+				# Drop the cancelled entries, if they are the majority of the heap
+				if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+					self._heap = [item for item in self._heap if item[2].queued]
+					heapq.heapify(self._heap)
+					self._cancelled = 0
+	
+	def _run(self):
+		while True:
+			with self._lock:
+				while True:
+					if self._terminate:
+						return
+					heap = self._heap
+					while heap and not heap[0][2].queued:
+						heapq.heappop(heap)
+						self._cancelled -= 1
+					if not heap:
+						self._wakeup.wait()
+						continue
+					deadline = heap[0][0]
+					delay = deadline - time.perf_counter()
+					if delay > self._spin:
+						self._wakeup.wait(delay - self._spin)
+						continue
+					if delay > 0:
+						# Spin without holding the lock, then check again for an earlier or cancelled deadline
+						self._lock.release()
+						try:
+							while time.perf_counter() < deadline:
+								pass
+						finally:
+							self._lock.acquire()
+						continue
+					break
+				
+				entry = heapq.heappop(heap)[2]
+				entry.queued = False
+				if self._workers != None:
+					# All expired deadlines are passed to the workers at once
+					calls = [(entry.function, entry.args)]
+					now = time.perf_counter()
+					while heap and heap[0][0] <= now:
+						entry = heapq.heappop(heap)[2]
+						if entry.queued:
+							entry.queued = False
+							calls.append((entry.function, entry.args))
+						else:
+							self._cancelled -= 1
+			
+			if self._workers != None:
+				self._workers.submit(calls)
+				continue
+			try:
+				entry.function(*entry.args)
+			except:
+				pass
+
+
+class _Workers(object):
+	""" Pool of worker threads, which are started on demand and wait for further calls when idle. """
+	def __init__(self, scheduler):
+		self._scheduler = scheduler
+		self._queue = collections.deque()
+		self._lock = threading.Lock()
+		self._not_empty = threading.Condition(self._lock)
+		self._threads = set()
+		# The number of waiting threads, which are not notified yet
+		self._idle = 0
+		# The number of threads, which are notified or started, but did not take a call yet
+		self._waking = 0
+		self._terminate = False
+	
+	def submit(self, calls):
+		with self._lock:
+			if self._terminate:
+				return
+			self._queue.extend(calls)
+			self._wake()
+	
+	def _wake(self):
+		# A single thread is woken up or started. Each thread wakes up the next one as long as calls are queued, thus a burst of short calls is handled without waking up all threads, but no call waits for a busy thread.
+		if self._waking > 0:
+			return
+		self._waking += 1
+		if self._idle > 0:
+			self._idle -= 1
+			self._not_empty.notify()
+		else:
+			thread = threading.Thread(target = self._run, daemon = True)
+			self._threads.add(thread)
+			thread.start()
+	
+	@property
+	def count(self):
+		with self._lock:
+			return len(self._threads)
+	
+	def stop(self):
+		with self._lock:
+			self._terminate = True
+			self._queue.clear()
+			self._not_empty.notify_all()
+			threads = list(self._threads)
+		for thread in threads:
+			if thread is not threading.current_thread():
+				thread.join()
+	
+	def _run(self):
+		# The thread is started by _wake
+		woken = True
+		while True:
+			with self._lock:
+				while not self._queue and not self._terminate:
+					if woken:
+						self._waking -= 1
+						woken = False
+					self._idle += 1
+					woken = self._not_empty.wait(self._scheduler.IDLE_TIMEOUT)
+					if not woken:
+						# Not woken up by _wake, thus not counted as idle any more
+						self._idle -= 1
+						if not self._queue and not self._terminate:
+							self._threads.discard(threading.current_thread())
+							return
+				if self._terminate:
+					return
+				function, args = self._queue.popleft()
+				if woken:
+					self._waking -= 1
+					woken = False
+				if self._queue:
+					self._wake()
+			
+			try:
+				function(*args)
+			except:
+				pass
+
+
+class _Entry(object):
+	__slots__ = ("scheduler", "function", "args", "queued")
+	
+	def __init__(self, scheduler, function, args):
+		self.scheduler = scheduler
+		self.function = function
+		self.args = args
+		self.queued = True
+	
+	def cancel(self):
+		""" Cancels the call, if it is still pending. """
+		self.scheduler._cancel(self)
@@ -1,84 +1,279 @@
+import collections
+import sys
 import threading
 import time
+from .scheduler import Scheduler
 
 
-class Timer(threading.Thread):
-	def __init__(self, function, args = None, kwargs = None):
+class Timer(object):
+	#: The number of recent calls used for the 99th percentile of the jitter
+	JITTER_SAMPLES = 1000
+	
+	def __init__(self, function, args = None, kwargs = None, scheduler = None, spin = 0.0):
 		"""
 		Restartable timer.
 		After calling start, it waits ``interval`` seconds and then calls ```function```with ``args`` and ``kwargs```.
+		The deadlines of all timers are managed by one shared ``Scheduler``, thus a timer does not need a thread of its own. The function is called by a worker thread of the scheduler, which starts further workers as needed, thus a slow function does not delay other timers.
+		Calls of the function of one timer never overlap. A deadline, which expires while the function is still running, is not waited for by a worker, but passed to the running call, which calls the function again when it returns.
+		Exceptions raised by the function are passed to the ``error_handler``.
+		
+		:param scheduler: The scheduler to use. If None, the shared scheduler returned by ``Scheduler.default`` is used.
+		
+		:param spin: If greater than 0, the timer uses a high resolution scheduler of its own, which wakes up ``spin`` seconds before each deadline and busy-waits for the rest. Must not be used together with ``scheduler``.
+			The scheduler is taken from a pool on the first start and returned to the pool on stop, thus creating a timer never starts a thread.
 		"""
 		if not callable(function):
 			raise ValueError()
+		if spin < 0 or (spin > 0 and scheduler != None):
+			raise ValueError()
 		if args == None:
 			args = []
 		if kwargs == None:
 			kwargs = {}
 		
-		threading.Thread.__init__(self, daemon = True)
+		self._spin = spin
+		self._own_scheduler = spin > 0
+		if scheduler == None and not self._own_scheduler:
+			scheduler = Scheduler.default()
 		
+		# The scheduler of a high resolution timer is acquired on the first start
+		self._scheduler = scheduler
 		self._interval = 0.0
 		self._function = function
 		self._args = args
 		self._kwargs = kwargs
 		
 		self._execute_time = 0.0
-		self._periodic = threading.Event()
-		self._terminate = threading.Event()
-		self._trigger_lock = threading.RLock()
-		self._trigger = threading.Condition(self._trigger_lock)
-		self._condition = threading.Event()
-		
-		threading.Thread.start(self)
+		self._periodic = False
+		self._entry = None
+		# Incremented on every cancel, so a deadline of a canceled timer cycle is ignored
+		self._generation = 0
+		self._terminate = False
+		self._lock = threading.Lock()
+		# Held while the function is called, so cancel can wait for a running call
+		self._running = threading.RLock()
+		# True while a worker calls the function. The generation of a deadline, which expired meanwhile, is passed to that worker.
+		self._calling = False
+		self._deferred = None
+		self._stopped = threading.Event()
+		self._error_handler = None
 		
-		# wait until the timer can be triggered
-		with self._trigger:
-			pass
+		self._jitter_count = 0
+		self._jitter_sum = 0.0
+		self._jitter_min = None
+		self._jitter_max = None
+		self._jitter_samples = collections.deque(maxlen = self.JITTER_SAMPLES)
+		self._missed = 0
 	
 	def start(self, interval, periodic = False):
 		"""
-		Triggers the timer and starts a timer cycle. To restart a fresh timer cycle, a call to ``cancel`` followed by a call to ``start`` is needed.
+		Triggers the timer and starts a timer cycle. To restart a fresh timer cycle, a call to ``cancel`` followed by a call to ``start`` or a call to ``restart`` is needed.
+		Returns False if a timer cycle is already running or the timer is stopped.
 		"""
 		if interval <= 0.0:
 			raise ValueError()
-		if not self._trigger.acquire(False):
-			return False
-		self._execute_time = time.perf_counter() + interval
-		self._interval = interval
-		if periodic:
-			self._periodic.set()
-		else:
-			self._periodic.clear()
-		self._condition.clear()
-		self._trigger.notify()
-		self._trigger.release()
+		with self._lock:
+			if self._entry != None or self._terminate:
+				return False
+			self._schedule(time.perf_counter() + interval, interval, periodic)
+		return True
+	
+	def restart(self, interval, periodic = False):
+		"""
+		Cancels the current timer cycle and starts a fresh one. Unlike ``cancel``, it does not wait for a running call of the function.
+		Returns False if the timer is stopped.
+		"""
+		if interval <= 0.0:
+			raise ValueError()
+		with self._lock:
+			if self._terminate:
+				return False
+			self._cancel()
+			self._schedule(time.perf_counter() + interval, interval, periodic)
 		return True
 	
 	def cancel(self):
 		"""
 		Cancels the current timer cycle.
 		"""
-		self._periodic.clear()
-		self._condition.set()
-		# wait until the canceled timer cycle has passed by and a restart is possible
-		with self._trigger:
+		with self._lock:
+			self._cancel()
+		# wait until a running call of the function has finished and a restart is possible
+		with self._running:
 			pass
 	
-	def run(self):
-		with self._trigger:
-			while not self._terminate.is_set():
-				if not self._periodic.is_set():
-					self._trigger.wait()
-				self._condition.wait(self._execute_time - time.perf_counter())
-				if not self._condition.is_set():
-					self._function(*self._args, **self._kwargs)
-				self._execute_time += self._interval
+	def is_alive(self):
+		"""
+		Returns True until the timer is stopped.
+		"""
+		return not self._terminate
 	
 	def stop(self):
 		"""
 		Cancels the current timer cycle and terminates the timer.
 		"""
-		self._terminate.set()
-		self._condition.set()
-		with self._trigger:
-			self._trigger.notify()
+		with self._lock:
+			self._terminate = True
+			self._cancel()
+			scheduler = self._scheduler
+			if self._own_scheduler:
+				self._scheduler = None
+		if self._own_scheduler and scheduler != None:
+			Scheduler.release(scheduler)
+		self._stopped.set()
+	
+	def join(self, timeout = None):
+		"""
+		Waits until the timer is stopped and a running call of the function has finished, like ``threading.Thread.join`` of a timer thread.
+		
+		:param timeout: The maximum time to wait in seconds or None to wait without limit.
+		"""
+		if timeout == None:
+			self._stopped.wait()
+			with self._running:
+				pass
+			return
+		deadline = time.perf_counter() + timeout
+		if self._stopped.wait(timeout):
+			if self._running.acquire(timeout = max(deadline - time.perf_counter(), 0.0)):
+				self._running.release()
+	
+	@property
+	def daemon(self):
+		"""
+		Returns True, as a timer never keeps the process alive. Setting it raises RuntimeError like for a started thread.
+		"""
+		return True
+	
+	@daemon.setter
+	def daemon(self, value):
+		raise RuntimeError()
+	
+	@property
+	def error_handler(self):
+		"""
+		Returns the error handler, which is called with the timer and the exception if the function raises an exception. If None, the exceptions are dropped.
+		"""
+		return self._error_handler
+	
+	@error_handler.setter
+	def error_handler(self, handler):
+		"""
+		Sets the error handler. Exceptions raised by the handler are dropped.
+		Raises TypeError if the handler is not callable and not None.
+		
+		:param handler: The error handler or None.
+		
+		:raises: TypeError
+		"""
+		if handler != None and not callable(handler):
+			raise TypeError()
+		self._error_handler = handler
+	
+	def reset_statistics(self):
+		"""
+		Resets the jitter statistics and the count of missed periods.
+		"""
+		with self._lock:
+			self._jitter_count = 0
+			self._jitter_sum = 0.0
+			self._jitter_min = None
+			self._jitter_max = None
+			self._jitter_samples.clear()
+			self._missed = 0
+	
+	@property
+	def statistics(self):
+		"""
+		Returns the timing statistics as a dictionary with the following keys:
+		
+		* "count": the number of calls of the function
+		* "min", "mean", "max": the jitter, i.e. the delay between the deadline and the call of the function, in seconds
+		* "p99": the 99th percentile of the jitter of the last ``JITTER_SAMPLES`` calls in seconds
+		* "missed": the number of skipped periods in periodic mode
+		
+		The jitter values are None if the function was not called yet.
+		"""
+		with self._lock:
+			samples = sorted(self._jitter_samples)
+			return {
+				"count": self._jitter_count,
+				"min": self._jitter_min,
+				"mean": self._jitter_sum / self._jitter_count if self._jitter_count else None,
+				"max": self._jitter_max,
+				"p99": samples[min(len(samples) - 1, int(len(samples) * 0.99))] if samples else None,
+				"missed": self._missed}
+	
+	def _schedule(self, execute_time, interval, periodic):
+		self._execute_time = execute_time
+		self._interval = interval
+		self._periodic = periodic
+		if self._scheduler == None:
+			self._scheduler = Scheduler.acquire(self._spin)
+		self._entry = self._scheduler.schedule(execute_time, self._expired, self._generation)
+	
+	def _cancel(self):
+		self._generation += 1
+		if self._entry != None:
+			self._entry.cancel()
+			self._entry = None
+	
+	def _expired(self, generation):
+		with self._lock:
+			if generation != self._generation:
+				return
+			if self._calling:
+				self._deferred = generation
+				return
+			self._calling = True
+		
+		with self._running:
+			try:
+				while True:
+					self._call(generation)
+					with self._lock:
+						generation = self._deferred
+						self._deferred = None
+						if generation == None:
+							self._calling = False
+							return
+			except:
+				with self._lock:
+					self._calling = False
+					self._deferred = None
+				raise
+	
+	def _call(self, generation):
+		now = time.perf_counter()
+		with self._lock:
+			if generation != self._generation:
+				return
+			
+			jitter = now - self._execute_time
+			self._jitter_count += 1
+			self._jitter_sum += jitter
+			if self._jitter_min == None or jitter < self._jitter_min:
+				self._jitter_min = jitter
+			if self._jitter_max == None or jitter > self._jitter_max:
+				self._jitter_max = jitter
+			self._jitter_samples.append(jitter)
+			
+			if self._periodic:
+				# The next deadline is calculated from the previous one, keeping the average interval correct.
+				# Deadlines, which have already passed, are skipped and counted as missed periods.
+				execute_time = self._execute_time + self._interval
+				while execute_time <= now:
+					execute_time += self._interval
+					self._missed += 1
+				self._schedule(execute_time, self._interval, True)
+			else:
+				self._entry = None
+		try:
+			self._function(*self._args, **self._kwargs)
+		except:
+			handler = self._error_handler
+			if handler != None:
+				try:
+					handler(self, sys.exc_info()[1])
+				except:
+					pass
@@ -159,3 +159,16 @@ if __name__ == '__main__':
 	print("mean: " + str(numpy.mean(tc)))
 	print("stddev: " + str(numpy.std(tc)))
 	print("max: " + str(numpy.max(tc)))
+	
+	print("")
+	print("Step 4: Timing jitter, high resolution periodic mode")
+	for spin in [0.0, 0.001]:
+		jitter_timer = Timer(fkt, spin = spin)
+		jitter_timer.start(0.01, True)
+		time.sleep(5)
+		jitter_timer.stop()
+		
+		s = jitter_timer.statistics
+		print("spin: " + str(spin))
+		print("\tcalls: " + str(s["count"]) + ", missed periods: " + str(s["missed"]))
+		print("\tjitter min: " + str(s["min"]) + ", mean: " + str(s["mean"]) + ", max: " + str(s["max"]) + ", p99: " + str(s["p99"]))
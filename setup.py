@@ -18,6 +18,7 @@ setup(
 	python_requires = ">=3.6",
 	
 	install_requires = ["python-can>=3.0.0,<3.2"],
+	extras_require = {"numpy": ["numpy"]},
 	setup_requires = ["pytest-runner"],
 	tests_require = ["pytest", "pytest-timeout", "pytest-cov", "pytest-subtests", "hypothesis"],
 	
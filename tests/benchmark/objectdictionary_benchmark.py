@@ -0,0 +1,271 @@
+""" Benchmark of the memory and the load time of the object dictionary.
+
+The module is not collected by pytest, thus it is excluded from normal test runs. Run it from the root of the repository with:
+	
+	python -m tests.benchmark.objectdictionary_benchmark --output objectdictionary.json
+
+The results are written as JSON, so they can be compared across versions.
+"""
+import argparse
+import gc
+import importlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import py_compile
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import canopen
+import canopen.objectdictionary.eds
+import canopen.objectdictionary.pymodule
+import canopen.objectdictionary.xdd
+from canopen.objectdictionary import ObjectDictionary, Variable, Record, Array
+from canopen.objectdictionary.datatypes import *
+
+
+def build(entries = 5000):
+	""" Builds an object dictionary like a device profile with the given number of entries. 80% of the entries are variables of their own, the others are sub-entries of records and arrays with 10 sub-entries each.
+	The strings are built at runtime, like strings read from a file.
+	
+	:param entries: The number of entries, i.e. variables.
+	
+	:returns: The object dictionary.
+	"""
+	dictionary = ObjectDictionary()
+	access_types = ["rw", "ro", "wo", "const"]
+	data_types = [UNSIGNED8, UNSIGNED16, UNSIGNED32, INTEGER16, INTEGER32, REAL32, BOOLEAN, VISIBLE_STRING]
+	count = 0
+	index = 0x2000
+	while count < entries:
+		if index % 5 == 0:
+			container = Record if index % 10 == 0 else Array
+			item = container("".join(["Object ", hex(index)]), index, UNSIGNED8, "".join(["Object ", "description"]))
+			for subindex in range(10):
+				item.add(Variable("".join(["Entry ", str(subindex)]), index, subindex, data_types[subindex % 8], "".join(access_types[subindex % 4]), "".join(["Entry ", "description"]), "".join(["n", "o"])))
+			count += 10
+		else:
+			item = Variable("".join(["Object ", hex(index)]), index, 0, data_types[index % 8], "".join(access_types[index % 4]), "".join(["Object ", "description"]), "".join(["n", "o"]))
+			count += 1
+		dictionary.add(item)
+		index += 1
+	return dictionary
+
+
+def memory(entries = 5000):
+	""" Measures the memory allocated for an object dictionary, and in addition for the table of ``variable``, which is built by ``freeze``.
+	
+	:param entries: The number of entries.
+	
+	:returns: A dict with the allocated bytes and the bytes per entry of the mutable and the frozen object dictionary.
+	"""
+	gc.collect()
+	tracemalloc.start()
+	dictionary = build(entries)
+	gc.collect()
+	size, peak = tracemalloc.get_traced_memory()
+	dictionary.freeze()
+	gc.collect()
+	frozen_size, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return {"entries": entries, "objects": len(dictionary), "bytes": size, "bytes_per_entry": size / entries, "frozen_bytes": frozen_size, "frozen_bytes_per_entry": frozen_size / entries}
+
+
+def range_query(entries = [5000, 50000], repeat = 1000):
+	""" Measures the time of a query of 16 indexes with ``range`` against the scan of all objects.
+	
+	:param entries: The numbers of entries.
+	
+	:param repeat: The number of queries.
+	
+	:returns: A list with one dict per number of entries and the times per query in seconds.
+	"""
+	results = []
+	for count in entries:
+		dictionary = build(count)
+		start, stop = 0x2010, 0x2020
+		start_time = time.perf_counter()
+		for i in range(repeat):
+			dictionary.range(start, stop)
+		query = (time.perf_counter() - start_time) / repeat
+		start_time = time.perf_counter()
+		for i in range(max(1, repeat // 100)):
+			[item for item in dictionary if start <= item.index < stop]
+		scan = (time.perf_counter() - start_time) / max(1, repeat // 100)
+		results.append({"entries": count, "range": query, "scan": scan})
+	return results
+
+
+def eds_text(entries = 5000):
+	""" Returns the text of an EDS file with the given number of variables, 80% of them in sections of their own and the others in records with 10 sub-objects each.
+	
+	:param entries: The number of variables.
+	"""
+	lines = []
+	count = 0
+	index = 0x2000
+	while count < entries:
+		if index % 5 == 0:
+			lines += ["[%X]" % index, "ParameterName=Object %X" % index, "ObjectType=0x9", "SubNumber=10", ""]
+			for subindex in range(10):
+				lines += ["[%Xsub%X]" % (index, subindex), "ParameterName=Entry %d" % subindex, "ObjectType=0x7", "DataType=0x0007", "AccessType=rw", "DefaultValue=0x%X" % subindex, "PDOMapping=1", ""]
+			count += 10
+		else:
+			lines += ["[%X]" % index, "ParameterName=Object %X" % index, "ObjectType=0x7", "DataType=0x0006", "AccessType=ro", "DefaultValue=$NODEID+0x%X" % index, "PDOMapping=0", ""]
+			count += 1
+		index += 1
+	return "\n".join(lines)
+
+
+def eds_load(entries = 5000, repeat = 5):
+	""" Measures the time to load an EDS file by parsing the text and from the cache.
+	
+	:param entries: The number of variables.
+	
+	:param repeat: The number of measurements, of which the fastest is used.
+	
+	:returns: A dict with the times in seconds.
+	"""
+	directory = tempfile.mkdtemp()
+	try:
+		path = os.path.join(directory, "large.eds")
+		with open(path, "w") as f:
+			f.write(eds_text(entries))
+		cache = os.path.join(directory, "cache")
+		
+		parse = []
+		for i in range(repeat):
+			start_time = time.perf_counter()
+			canopen.objectdictionary.eds.load(path, 1)
+			parse.append(time.perf_counter() - start_time)
+		
+		canopen.objectdictionary.eds.load(path, 1, cache)
+		cached = []
+		for i in range(repeat):
+			start_time = time.perf_counter()
+			canopen.objectdictionary.eds.load(path, 1, cache)
+			cached.append(time.perf_counter() - start_time)
+		
+		return {"entries": entries, "parse": min(parse), "cache": min(cached), "cache_bytes": sum(os.path.getsize(os.path.join(cache, name)) for name in os.listdir(cache))}
+	finally:
+		shutil.rmtree(directory)
+
+
+def pymodule_load(entries = 5000, repeat = 5):
+	""" Measures the time to import a generated module from its compiled bytecode and to build the object dictionary.
+	
+	:param entries: The number of variables.
+	
+	:param repeat: The number of measurements, of which the fastest is used.
+	
+	:returns: A dict with the times in seconds.
+	"""
+	directory = tempfile.mkdtemp()
+	sys.path.insert(0, directory)
+	try:
+		dictionary = canopen.objectdictionary.eds.load(io.StringIO(eds_text(entries)), 1)
+		imports = []
+		loads = []
+		for i in range(repeat):
+			# A new name for each measurement, thus the module is not imported already
+			name = "benchmark_od_" + str(i)
+			path = os.path.join(directory, name + ".py")
+			with open(path, "w") as f:
+				canopen.objectdictionary.pymodule.dump(dictionary, f)
+			py_compile.compile(path, cfile = importlib.util.cache_from_source(path))
+			importlib.invalidate_caches()
+			
+			start_time = time.perf_counter()
+			module = importlib.import_module(name)
+			imports.append(time.perf_counter() - start_time)
+			start_time = time.perf_counter()
+			module.load()
+			loads.append(time.perf_counter() - start_time)
+			del sys.modules[name]
+		return {"entries": entries, "import": min(imports), "load": min(loads), "module_bytes": os.path.getsize(path)}
+	finally:
+		sys.path.remove(directory)
+		shutil.rmtree(directory)
+
+
+def xdd_text(entries = 5000):
+	""" Returns the content of a XDD file with the given number of variables, in the same layout as ``eds_text``.
+	
+	:param entries: The number of variables.
+	"""
+	lines = ["<?xml version=\"1.0\" encoding=\"utf-8\"?>", "<ISO15745ProfileContainer xmlns=\"http://www.canopen.org/xml/1.0\"><ISO15745Profile><ProfileBody><ApplicationLayers><CANopenObjectList>"]
+	count = 0
+	index = 0x2000
+	while count < entries:
+		if index % 5 == 0:
+			lines.append("<CANopenObject index=\"%X\" name=\"Object %X\" objectType=\"9\" subNumber=\"10\">" % (index, index))
+			for subindex in range(10):
+				lines.append("<CANopenSubObject subIndex=\"%02X\" name=\"Entry %d\" objectType=\"7\" dataType=\"0007\" accessType=\"rw\" defaultValue=\"0x%X\" PDOmapping=\"optional\"/>" % (subindex, subindex, subindex))
+			lines.append("</CANopenObject>")
+			count += 10
+		else:
+			lines.append("<CANopenObject index=\"%X\" name=\"Object %X\" objectType=\"7\" dataType=\"0006\" accessType=\"ro\" defaultValue=\"$NODEID+0x%X\" PDOmapping=\"no\"/>" % (index, index, index))
+			count += 1
+		index += 1
+	lines.append("</CANopenObjectList></ApplicationLayers></ProfileBody></ISO15745Profile></ISO15745ProfileContainer>")
+	return "\n".join(lines).encode("utf-8")
+
+
+def xdd_load(entries = [5000, 20000]):
+	""" Measures the time to load XDD files and the memory needed for parsing beyond the resulting dictionary, which should not depend on the size of the file.
+	
+	:param entries: The numbers of variables.
+	
+	:returns: A list with one dict per number of variables.
+	"""
+	results = []
+	for count in entries:
+		content = io.BytesIO(xdd_text(count))
+		start_time = time.perf_counter()
+		canopen.objectdictionary.xdd.load(content, 1)
+		duration = time.perf_counter() - start_time
+		
+		content.seek(0)
+		gc.collect()
+		tracemalloc.start()
+		dictionary = canopen.objectdictionary.xdd.load(content, 1)
+		size, peak = tracemalloc.get_traced_memory()
+		tracemalloc.stop()
+		results.append({"entries": count, "file_bytes": len(content.getvalue()), "duration": duration, "dictionary_bytes": size, "parse_bytes": peak - size})
+	return results
+
+
+def run(quick = False):
+	""" Runs all benchmarks.
+	
+	:param quick: If True, fewer measurements are done.
+	
+	:returns: A dict with the results and information about the environment.
+	"""
+	return {
+		"benchmark": "objectdictionary",
+		"canopen": canopen.__version__,
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"time": time.time(),
+		"quick": quick,
+		"results": {"memory": memory(5000), "range_query": range_query([5000] if quick else [5000, 50000]), "eds_load": eds_load(5000, 2 if quick else 5), "pymodule_load": pymodule_load(5000, 2 if quick else 5), "xdd_load": xdd_load([5000] if quick else [5000, 20000])}}
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description = "Memory benchmark of the object dictionary")
+	parser.add_argument("--output", help = "The path of the JSON file. If omitted, the results are written to stdout.")
+	parser.add_argument("--quick", action = "store_true", help = "Do fewer measurements.")
+	arguments = parser.parse_args()
+	
+	data = run(arguments.quick)
+	if arguments.output == None:
+		json.dump(data, sys.stdout, indent = "\t")
+		sys.stdout.write("\n")
+	else:
+		with open(arguments.output, "w") as f:
+			json.dump(data, f, indent = "\t")
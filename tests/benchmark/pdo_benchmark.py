@@ -0,0 +1,144 @@
+""" Benchmark of the transmission of PDOs.
+
+The module is not collected by pytest, thus it is excluded from normal test runs. Run it from the root of the repository with:
+	
+	python -m tests.benchmark.pdo_benchmark --output pdo.json
+
+The results are written as JSON, so they can be compared across versions.
+The frames are handed to a bus, which discards them, thus only the overhead of the services and the network is measured.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+import can
+import canopen
+from canopen.node.service.pdo import PDOProducer
+
+
+class _DiscardBus(can.BusABC):
+	""" A bus, which discards all sent messages. """
+	def __init__(self):
+		can.BusABC.__init__(self, None)
+	
+	def send(self, msg, timeout = None):
+		pass
+	
+	def _recv_internal(self, timeout):
+		time.sleep(timeout if timeout != None else 0.1)
+		return None, False
+
+
+def _setup(count):
+	""" Returns the bus, the network, the node and a list of ``count`` attached PDO producers. """
+	bus = _DiscardBus()
+	network = canopen.Network()
+	network.attach(bus)
+	node = canopen.Node("a", 1, canopen.ObjectDictionary())
+	node.attach(network)
+	producers = [PDOProducer(node) for i in range(count)]
+	for i, producer in enumerate(producers):
+		producer.attach(0x200 + i + node.id)
+		producer.data = bytes(8)
+	return bus, network, node, producers
+
+
+def _teardown(bus, network, node, producers):
+	for producer in producers:
+		producer.detach()
+	node.detach()
+	network.detach()
+	bus.shutdown()
+
+
+def burst(pdos = 4, count = 20000):
+	""" Measures a cycle, which sets the data of each PDO and sends all PDOs, in three ways:
+	``build`` stores the data and creates a new ``can.Message`` for each PDO on transmission like earlier versions,
+	``send`` uses ``PDOProducer.send`` and ``send_many`` passes the ``message`` of all PDOs to ``Network.send_many``.
+	
+	:param pdos: The number of PDOs per cycle.
+	
+	:param count: The number of cycles per measurement.
+	
+	:returns: A dict with the time per PDO in microseconds for each way.
+	"""
+	bus, network, node, producers = _setup(pdos)
+	data = bytes(range(8))
+	cob_ids = [producer.message.arbitration_id for producer in producers]
+	stored = [None] * pdos
+	
+	def build():
+		for i, cob_id in enumerate(cob_ids):
+			stored[i] = data
+			network.send(can.Message(arbitration_id = cob_id, is_extended_id = False, data = stored[i]))
+	
+	def send():
+		for producer in producers:
+			producer.data = data
+			producer.send()
+	
+	def send_many():
+		for producer in producers:
+			producer.data = data
+		network.send_many(producer.message for producer in producers)
+	
+	result = {"pdos": pdos}
+	for name, function in [("build", build), ("send", send), ("send_many", send_many)]:
+		duration = min(timeit.repeat(function, number = count, repeat = 3))
+		result[name] = duration / (count * pdos) * 1e6
+	
+	_teardown(bus, network, node, producers)
+	return result
+
+
+def message(count = 100000):
+	""" Measures the read of the ``message`` property.
+	
+	:param count: The number of reads per measurement.
+	
+	:returns: A dict with the time per read in microseconds.
+	"""
+	bus, network, node, producers = _setup(1)
+	producer = producers[0]
+	duration = min(timeit.repeat(lambda: producer.message, number = count, repeat = 3))
+	_teardown(bus, network, node, producers)
+	return {"count": count, "read": duration / count * 1e6}
+
+
+def run(quick = False):
+	""" Runs all benchmarks.
+	
+	:param quick: If True, fewer iterations are used.
+	
+	:returns: A dict with the results and information about the environment.
+	"""
+	factor = 0.1 if quick else 1.0
+	results = {}
+	results["burst"] = [burst(pdos, int(20000 * factor)) for pdos in [1, 4, 16]]
+	results["message"] = message(int(100000 * factor))
+	
+	return {
+		"benchmark": "pdo",
+		"canopen": canopen.__version__,
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"time": time.time(),
+		"quick": quick,
+		"results": results}
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description = "Benchmark of the transmission of PDOs")
+	parser.add_argument("--output", help = "The path of the JSON file. If omitted, the results are written to stdout.")
+	parser.add_argument("--quick", action = "store_true", help = "Use fewer iterations.")
+	arguments = parser.parse_args()
+	
+	data = run(arguments.quick)
+	if arguments.output == None:
+		json.dump(data, sys.stdout, indent = "\t")
+		sys.stdout.write("\n")
+	else:
+		with open(arguments.output, "w") as f:
+			json.dump(data, f, indent = "\t")
@@ -0,0 +1,193 @@
+""" Benchmark of the timer and the scheduler.
+
+The module is not collected by pytest, thus it is excluded from normal test runs. Run it from the root of the repository with:
+	
+	python -m tests.benchmark.timer_benchmark --output timer.json
+
+The results are written as JSON, so they can be compared across versions.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import canopen
+from canopen.util import Timer
+
+
+def _summary(values):
+	""" Returns count, min, mean, max and the 99th percentile of the values. """
+	if not values:
+		return {"count": 0, "min": None, "mean": None, "max": None, "p99": None}
+	ordered = sorted(values)
+	return {
+		"count": len(ordered),
+		"min": ordered[0],
+		"mean": sum(ordered) / len(ordered),
+		"max": ordered[-1],
+		"p99": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]}
+
+
+def _lateness(calls, start_time, interval):
+	""" Returns the time of each call after the latest point of the grid ``start_time + k * interval``. """
+	return [(t - start_time) % interval for t in calls]
+
+
+def start_cancel(timer_factory = Timer, count = 100000):
+	""" Measures the throughput of ``start`` followed by ``cancel``.
+	
+	:param timer_factory: A callable, which returns a timer for a function.
+	
+	:param count: The number of start/cancel cycles.
+	
+	:returns: A dict with the number of cycles per second.
+	"""
+	timer = timer_factory(lambda: None)
+	start_time = time.perf_counter()
+	for i in range(count):
+		timer.start(1.0)
+		timer.cancel()
+	duration = time.perf_counter() - start_time
+	timer.stop()
+	return {"count": count, "duration": duration, "per_second": count / duration}
+
+
+def periodic_jitter(interval, duration, timer_factory = Timer):
+	""" Measures the lateness of the calls of a periodic timer against the latest point of the ideal grid ``start + k * interval``. Missed periods are counted separately.
+	
+	:param interval: The interval in seconds.
+	
+	:param duration: The duration of the measurement in seconds.
+	
+	:param timer_factory: A callable, which returns a timer for a function.
+	
+	:returns: A dict with the summary of the lateness in seconds.
+	"""
+	calls = []
+	timer = timer_factory(lambda: calls.append(time.perf_counter()))
+	start_time = time.perf_counter()
+	timer.start(interval, True)
+	time.sleep(duration)
+	timer.stop()
+	
+	result = _summary(_lateness(calls, start_time, interval))
+	result["interval"] = interval
+	result["expected"] = int(duration / interval)
+	return result
+
+
+def overrun(interval = 0.5, first = 0.6, other = 0.2, duration = 1.8, timer_factory = Timer):
+	""" Measures a periodic timer with a callback, which takes longer than the interval on the first call. The timer should skip the missed period and return to the grid of the interval.
+	
+	:param interval: The interval in seconds.
+	
+	:param first: The duration of the first call in seconds.
+	
+	:param other: The duration of the other calls in seconds.
+	
+	:param duration: The duration of the measurement in seconds.
+	
+	:param timer_factory: A callable, which returns a timer for a function.
+	
+	:returns: A dict with the times between the calls and the phase error of each call against the grid.
+	"""
+	calls = []
+	def callback():
+		calls.append(time.perf_counter())
+		time.sleep(first if len(calls) == 1 else other)
+	
+	timer = timer_factory(callback)
+	start_time = time.perf_counter()
+	timer.start(interval, True)
+	time.sleep(duration)
+	timer.stop()
+	
+	deltas = [b - a for a, b in zip([start_time] + calls, calls)]
+	phase = [((t - start_time + interval / 2) % interval) - interval / 2 for t in calls]
+	result = {"interval": interval, "calls": len(calls), "deltas": deltas, "phase_error": phase}
+	statistics = getattr(timer, "statistics", None)
+	if statistics != None:
+		result["missed"] = statistics["missed"]
+	return result
+
+
+def scaling(counts, interval = 0.01, duration = 2.0, timer_factory = Timer):
+	""" Measures the lateness and the CPU time with many concurrent periodic timers.
+	
+	:param counts: The numbers of concurrent timers.
+	
+	:param interval: The interval in seconds.
+	
+	:param duration: The duration of each measurement in seconds.
+	
+	:param timer_factory: A callable, which returns a timer for a function.
+	
+	:returns: A list with one dict per number of timers.
+	"""
+	results = []
+	for count in counts:
+		calls = [[] for i in range(count)]
+		def make(i):
+			return lambda: calls[i].append(time.perf_counter())
+		timers = [timer_factory(make(i)) for i in range(count)]
+		
+		cpu_time = time.process_time()
+		start_times = []
+		for timer in timers:
+			start_times.append(time.perf_counter())
+			timer.start(interval, True)
+		time.sleep(duration)
+		for timer in timers:
+			timer.stop()
+		cpu_time = time.process_time() - cpu_time
+		
+		lateness = []
+		for start_time, timer_calls in zip(start_times, calls):
+			lateness += _lateness(timer_calls, start_time, interval)
+		result = _summary(lateness)
+		result["timers"] = count
+		result["expected"] = count * int(duration / interval)
+		result["cpu_time"] = cpu_time
+		results.append(result)
+	return results
+
+
+def run(quick = False, timer_factory = Timer):
+	""" Runs all benchmarks.
+	
+	:param quick: If True, shorter durations and fewer iterations are used.
+	
+	:param timer_factory: A callable, which returns a timer for a function.
+	
+	:returns: A dict with the results and information about the environment.
+	"""
+	factor = 0.2 if quick else 1.0
+	results = {}
+	results["start_cancel"] = start_cancel(timer_factory, int(100000 * factor))
+	results["periodic_jitter"] = [periodic_jitter(interval, max(10 * factor, 20 * interval), timer_factory) for interval in [0.001, 0.01, 0.1]]
+	results["overrun"] = overrun(timer_factory = timer_factory)
+	results["scaling"] = scaling([1, 10, 100, 1000], 0.01, 5 * factor, timer_factory)
+	
+	return {
+		"benchmark": "timer",
+		"canopen": canopen.__version__,
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"time": time.time(),
+		"quick": quick,
+		"results": results}
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description = "Benchmark of the timer and the scheduler")
+	parser.add_argument("--output", help = "The path of the JSON file. If omitted, the results are written to stdout.")
+	parser.add_argument("--quick", action = "store_true", help = "Use shorter durations and fewer iterations.")
+	arguments = parser.parse_args()
+	
+	data = run(arguments.quick)
+	if arguments.output == None:
+		json.dump(data, sys.stdout, indent = "\t")
+		sys.stdout.write("\n")
+	else:
+		with open(arguments.output, "w") as f:
+			json.dump(data, f, indent = "\t")
@@ -0,0 +1,85 @@
+""" Benchmark of ``Variable.encode`` and ``Variable.decode``.
+
+The module is not collected by pytest, thus it is excluded from normal test runs. Run it from the root of the repository with:
+	
+	python -m tests.benchmark.variable_benchmark --output variable.json
+
+The results are written as JSON, so they can be compared across versions.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+import canopen
+from canopen.objectdictionary import Variable
+from canopen.objectdictionary.datatypes import *
+
+
+#: The data types to measure with a value of each type
+VALUES = [
+	("BOOLEAN", BOOLEAN, True),
+	("INTEGER8", INTEGER8, -5),
+	("INTEGER16", INTEGER16, -1234),
+	("INTEGER32", INTEGER32, -123456),
+	("UNSIGNED8", UNSIGNED8, 5),
+	("UNSIGNED16", UNSIGNED16, 1234),
+	("UNSIGNED32", UNSIGNED32, 123456),
+	("REAL32", REAL32, 1.5),
+	("VISIBLE_STRING", VISIBLE_STRING, "abcdefgh"),
+	("TIME_OF_DAY", TIME_OF_DAY, 1000000000.5),
+	("INTEGER24", INTEGER24, -123456),
+	("REAL64", REAL64, 1.5),
+	("INTEGER64", INTEGER64, -123456789),
+	("UNSIGNED40", UNSIGNED40, 123456789),
+	("UNSIGNED64", UNSIGNED64, 123456789)]
+
+
+def codec(count = 100000):
+	""" Measures encode and decode for each data type.
+	
+	:param count: The number of calls per measurement.
+	
+	:returns: A list with one dict per data type with the calls per second.
+	"""
+	results = []
+	for name, data_type, value in VALUES:
+		variable = Variable(name, 0x2000, 0x00, data_type)
+		data = variable.encode(value)
+		encode = min(timeit.repeat(lambda: variable.encode(value), number = count, repeat = 3))
+		decode = min(timeit.repeat(lambda: variable.decode(data), number = count, repeat = 3))
+		results.append({"data_type": name, "encode_per_second": count / encode, "decode_per_second": count / decode})
+	return results
+
+
+def run(quick = False):
+	""" Runs all benchmarks.
+	
+	:param quick: If True, fewer iterations are used.
+	
+	:returns: A dict with the results and information about the environment.
+	"""
+	return {
+		"benchmark": "variable",
+		"canopen": canopen.__version__,
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"time": time.time(),
+		"quick": quick,
+		"results": {"codec": codec(20000 if quick else 100000)}}
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description = "Benchmark of Variable.encode and Variable.decode")
+	parser.add_argument("--output", help = "The path of the JSON file. If omitted, the results are written to stdout.")
+	parser.add_argument("--quick", action = "store_true", help = "Use fewer iterations.")
+	arguments = parser.parse_args()
+	
+	data = run(arguments.quick)
+	if arguments.output == None:
+		json.dump(data, sys.stdout, indent = "\t")
+		sys.stdout.write("\n")
+	else:
+		with open(arguments.output, "w") as f:
+			json.dump(data, f, indent = "\t")
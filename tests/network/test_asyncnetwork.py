@@ -0,0 +1,223 @@
+import unittest
+from unittest.mock import Mock
+import asyncio
+import threading
+import struct
+import can
+
+import canopen.network
+from canopen import AsyncNetwork, LocalNode, Network, Node, RemoteNode
+from canopen.objectdictionary import ObjectDictionary, Record, Variable, UNICODE_STRING, UNSIGNED32
+from canopen.node.service.pdo import PDOConsumer
+from canopen.node.service.sync import SYNCConsumer
+from canopen.node.service.time import TIMEConsumer
+
+
+class AsyncNetworkTestCase(unittest.TestCase):
+	def setUp(self):
+		self.loop = asyncio.new_event_loop()
+		asyncio.set_event_loop(self.loop)
+	
+	def tearDown(self):
+		asyncio.set_event_loop(None)
+		self.loop.close()
+	
+	def test_attach_detach(self):
+		network = AsyncNetwork(self.loop)
+		self.assertEqual(network.loop, self.loop)
+		bus = can.Bus(interface = "virtual", channel = 0)
+		
+		with self.assertRaises(TypeError):
+			network.attach(None)
+		
+		network.attach(bus)
+		self.assertTrue(network.is_attached())
+		network.detach()
+		self.assertFalse(network.is_attached())
+		
+		network.attach(bus, False)
+		self.assertTrue(network.is_attached())
+		network.detach()
+		
+		#### Test step: Without an event loop, attach must be called on a running event loop
+		network = AsyncNetwork()
+		with self.assertRaises(RuntimeError):
+			network.attach(bus)
+		self.assertFalse(network.is_attached())
+		network.attach(bus, False)
+		network.detach()
+		
+		bus.shutdown()
+	
+	def test_init(self):
+		#### Test step: The parameters of Network are passed through
+		executor = canopen.network.Executor(1)
+		transmit_queue = canopen.network.TransmitQueue()
+		metrics = canopen.network.Metrics()
+		network = AsyncNetwork(self.loop, executor, transmit_queue, metrics)
+		self.assertIs(network.loop, self.loop)
+		self.assertIs(network.executor, executor)
+		self.assertIs(network.transmit_queue, transmit_queue)
+		self.assertIs(network.metrics, metrics)
+		executor.stop()
+		
+		with self.assertRaises(TypeError):
+			AsyncNetwork(self.loop, metrics = object())
+	
+	def test_callbacks_on_loop(self):
+		network = AsyncNetwork()
+		self.assertEqual(network.loop, None)
+		bus1 = can.Bus(interface = "virtual", channel = 0)
+		bus2 = can.Bus(interface = "virtual", channel = 0)
+		
+		threads = []
+		cb = Mock(side_effect = lambda message: threads.append(threading.current_thread()))
+		network.subscribe(cb, 0x100)
+		
+		async def run():
+			network.attach(bus1)
+			#### Test step: The running event loop of attach is the loop of the network while attached
+			self.assertIs(network.loop, self.loop)
+			bus2.send(can.Message(arbitration_id = 0x100, is_extended_id = False, data = []))
+			for i in range(100):
+				if cb.called:
+					break
+				await asyncio.sleep(0.01)
+			network.detach()
+			self.assertEqual(network.loop, None)
+		
+		self.loop.run_until_complete(run())
+		cb.assert_called_once()
+		self.assertEqual(threads[0], threading.current_thread())
+		
+		bus1.shutdown()
+		bus2.shutdown()
+	
+	def test_wait_for_async(self):
+		network = AsyncNetwork(self.loop)
+		bus1 = can.Bus(interface = "virtual", channel = 0)
+		bus2 = can.Bus(interface = "virtual", channel = 0)
+		dictionary = ObjectDictionary()
+		node = Node("a", 1, dictionary)
+		sync = SYNCConsumer(node)
+		pdo = PDOConsumer(node)
+		time = TIMEConsumer(node)
+		
+		network.attach(bus1)
+		node.attach(network)
+		sync.attach()
+		pdo.attach()
+		time.attach()
+		
+		async def run():
+			#### Test step: Many waiting coroutines on one thread, woken up by one message
+			waiters = [asyncio.ensure_future(sync.wait_for_sync_async(1)) for i in range(1000)]
+			await asyncio.sleep(0.01)
+			bus2.send(can.Message(arbitration_id = 0x80, is_extended_id = False, data = []))
+			results = await asyncio.gather(*waiters)
+			self.assertTrue(all(results))
+			
+			#### Test step: Timeout
+			self.assertFalse(await sync.wait_for_sync_async(0.05))
+			
+			#### Test step: Disabled service
+			sync.disable()
+			self.assertFalse(await sync.wait_for_sync_async(0.05))
+			sync.enable()
+			
+			waiter = asyncio.ensure_future(pdo.wait_for_pdo_async(1))
+			await asyncio.sleep(0.01)
+			bus2.send(can.Message(arbitration_id = 0x201, is_extended_id = False, data = b"\x11\x22"))
+			self.assertTrue(await waiter)
+			self.assertFalse(await pdo.wait_for_pdo_async(0.05))
+			pdo.disable()
+			self.assertFalse(await pdo.wait_for_pdo_async(0.05))
+			pdo.enable()
+			
+			waiter = asyncio.ensure_future(time.wait_for_time_async(1))
+			await asyncio.sleep(0.01)
+			bus2.send(can.Message(arbitration_id = 0x100, is_extended_id = False, data = struct.pack("<LH", 0, 60)))
+			self.assertTrue(await waiter)
+			self.assertFalse(await time.wait_for_time_async(0.05))
+			time.disable()
+			self.assertFalse(await time.wait_for_time_async(0.05))
+			time.enable()
+		
+		self.loop.run_until_complete(run())
+		
+		time.detach()
+		pdo.detach()
+		sync.detach()
+		node.detach()
+		network.detach()
+		bus1.shutdown()
+		bus2.shutdown()
+	
+	def test_sdo_async(self):
+		dictionary = ObjectDictionary()
+		dictionary.add(Record("rec", 0x1234, 0x00))
+		dictionary["rec"].add(Variable("unicode", 0x1234, 0x0B, UNICODE_STRING, "rw"))
+		dictionary.add(Variable("var", 0x5678, 0x00, UNSIGNED32, "rw"))
+		
+		bus1 = can.Bus(interface = "virtual", channel = 0)
+		bus2 = can.Bus(interface = "virtual", channel = 0)
+		
+		client_network = AsyncNetwork(self.loop)
+		client_network.attach(bus1)
+		client = RemoteNode("remote", 1, dictionary)
+		client_network.add(client)
+		
+		server_network = Network()
+		server_network.attach(bus2)
+		server = LocalNode("local", 1, dictionary)
+		server_network.add(server)
+		
+		async def run():
+			#### Test step: Expedited transfer
+			await client.sdo.download_async(0x5678, 0x00, 0x12345678)
+			self.assertEqual(server.get_data(0x5678, 0x00), 0x12345678)
+			self.assertEqual(await client.sdo.upload_async(0x5678, 0x00), 0x12345678)
+			
+			#### Test step: Segmented transfer
+			await client.sdo.download_async(0x1234, 0x0B, "abcdefghijklmnop")
+			self.assertEqual(server.get_data(0x1234, 0x0B), "abcdefghijklmnop")
+			self.assertEqual(await client.sdo.upload_async(0x1234, 0x0B), "abcdefghijklmnop")
+			
+			#### Test step: Concurrent transfers are serialized
+			results = await asyncio.gather(client.sdo.upload_async(0x5678, 0x00), client.sdo.upload_async(0x1234, 0x0B))
+			self.assertEqual(results, [0x12345678, "abcdefghijklmnop"])
+			
+			#### Test step: Synchronous transfers of another thread are serialized with the awaitable transfers
+			sync_results = []
+			def transfer():
+				for i in range(5):
+					sync_results.append(client.sdo.upload(0x1234, 0x0B))
+			thread = threading.Thread(target = transfer)
+			thread.start()
+			for i in range(5):
+				self.assertEqual(await client.sdo.upload_async(0x5678, 0x00), 0x12345678)
+			while thread.is_alive():
+				await asyncio.sleep(0.01)
+			self.assertEqual(sync_results, ["abcdefghijklmnop"] * 5)
+			
+			#### Test step: Timeout
+			server.sdo.disable()
+			client.sdo.timeout = 0.1
+			with self.assertRaises(TimeoutError):
+				await client.sdo.upload_async(0x5678, 0x00)
+			with self.assertRaises(TimeoutError):
+				await client.sdo.download_async(0x5678, 0x00, 0x00)
+			server.sdo.enable()
+		
+		self.loop.run_until_complete(run())
+		
+		del server_network["local"]
+		del client_network["remote"]
+		server_network.detach()
+		client_network.detach()
+		bus1.shutdown()
+		bus2.shutdown()
+
+
+if __name__ == "__main__":
+	unittest.main()
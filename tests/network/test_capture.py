@@ -0,0 +1,135 @@
+import unittest
+from unittest.mock import Mock
+import io
+import os
+import tempfile
+import time
+import can
+import canopen
+from canopen.network import CaptureWriter, read_capture, replay
+from canopen.network.capture import HEADER, RECORD
+
+
+class CaptureTestCase(unittest.TestCase):
+	def test_write_read(self):
+		buffer = io.BytesIO()
+		messages = [
+			(can.Message(timestamp = 1.5, arbitration_id = 0x181, is_extended_id = False, data = b"\x11\x22"), False),
+			(can.Message(timestamp = 1.75, arbitration_id = 0x1FFFFFFF, is_extended_id = True, data = b"\x01\x02\x03\x04\x05\x06\x07\x08"), True),
+			(can.Message(timestamp = 2.0, arbitration_id = 0x701, is_extended_id = False, is_remote_frame = True, dlc = 1), False),
+			(can.Message(timestamp = 2.5, arbitration_id = 0x080, is_extended_id = False), True)]
+		
+		writer = CaptureWriter(buffer)
+		for message, tx in messages:
+			writer.write(message, tx)
+		writer.close()
+		self.assertEqual(writer.count, 4)
+		self.assertEqual(len(buffer.getvalue()), len(HEADER) + 4 * RECORD.size)
+		
+		buffer.seek(0)
+		result = list(read_capture(buffer))
+		self.assertEqual(len(result), 4)
+		for (message, tx), (expected, expected_tx) in zip(result, messages):
+			self.assertEqual(tx, expected_tx)
+			self.assertEqual(message.timestamp, expected.timestamp)
+			self.assertEqual(message.arbitration_id, expected.arbitration_id)
+			self.assertEqual(message.is_extended_id, expected.is_extended_id)
+			self.assertEqual(message.is_remote_frame, expected.is_remote_frame)
+			self.assertEqual(message.dlc, expected.dlc)
+			self.assertEqual(message.data, expected.data)
+		
+		#### Test step: Reads, which return less than requested
+		class ShortReader(object):
+			def __init__(self, data):
+				self._buffer = io.BytesIO(data)
+			def read(self, size):
+				return self._buffer.read(min(size, 5))
+		result = list(read_capture(ShortReader(buffer.getvalue())))
+		self.assertEqual([(message.arbitration_id, tx) for message, tx in result], [(m.arbitration_id, tx) for m, tx in messages])
+		
+		#### Test step: Invalid header
+		with self.assertRaises(ValueError):
+			list(read_capture(io.BytesIO(b"\x00" * 100)))
+		
+		#### Test step: Truncated file
+		with self.assertRaises(ValueError):
+			list(read_capture(io.BytesIO(buffer.getvalue()[:-1])))
+		with self.assertRaises(ValueError):
+			list(read_capture(ShortReader(buffer.getvalue()[:-1])))
+	
+	def test_file(self):
+		fd, path = tempfile.mkstemp()
+		os.close(fd)
+		try:
+			with CaptureWriter(path) as writer:
+				for i in range(10000):
+					writer.write(can.Message(timestamp = i, arbitration_id = i & 0x7FF, is_extended_id = False, data = [i & 0xFF]))
+			self.assertEqual(os.path.getsize(path), len(HEADER) + 10000 * RECORD.size)
+			
+			result = [m for m, tx in read_capture(path)]
+			self.assertEqual(len(result), 10000)
+			self.assertEqual(result[-1].arbitration_id, 9999 & 0x7FF)
+			self.assertEqual(result[-1].data, bytearray([9999 & 0xFF]))
+		finally:
+			os.remove(path)
+	
+	def test_network(self):
+		network = canopen.Network()
+		bus1 = can.Bus(interface = "virtual", channel = 0)
+		bus2 = can.Bus(interface = "virtual", channel = 0)
+		buffer = io.BytesIO()
+		
+		with self.assertRaises(TypeError):
+			network.recorder = object()
+		
+		writer = CaptureWriter(buffer)
+		network.recorder = writer
+		self.assertEqual(network.recorder, writer)
+		network.attach(bus1)
+		
+		#### Test step: Received and sent messages are recorded
+		bus2.send(can.Message(arbitration_id = 0x181, is_extended_id = False, data = b"\x01"))
+		time.sleep(0.05)
+		network.send(can.Message(arbitration_id = 0x201, is_extended_id = False, data = b"\x02"))
+		network.send_many([can.Message(arbitration_id = 0x202, is_extended_id = False)])
+		network.recorder = None
+		bus2.send(can.Message(arbitration_id = 0x182, is_extended_id = False))
+		time.sleep(0.05)
+		writer.close()
+		
+		buffer.seek(0)
+		result = [(m.arbitration_id, tx) for m, tx in read_capture(buffer)]
+		self.assertEqual(result, [(0x181, False), (0x201, True), (0x202, True)])
+		
+		network.detach()
+		bus1.shutdown()
+		bus2.shutdown()
+	
+	def test_replay(self):
+		buffer = io.BytesIO()
+		writer = CaptureWriter(buffer)
+		for i in range(10):
+			writer.write(can.Message(timestamp = 100 + i * 0.01, arbitration_id = 0x181, is_extended_id = False, data = [i]))
+		writer.write(can.Message(timestamp = 100.1, arbitration_id = 0x181, is_extended_id = False, data = [10]), True)
+		writer.close()
+		
+		network = canopen.Network()
+		cb = Mock()
+		network.subscribe(cb, 0x181)
+		
+		#### Test step: Original timing
+		buffer.seek(0)
+		t = time.monotonic()
+		self.assertEqual(replay(network, buffer), 10)
+		self.assertGreaterEqual(time.monotonic() - t, 0.085)
+		self.assertEqual([c[0][0].data for c in cb.call_args_list], [bytearray([i]) for i in range(10)])
+		
+		#### Test step: As fast as possible, including the sent messages
+		cb.reset_mock()
+		buffer.seek(0)
+		self.assertEqual(replay(network, buffer, False, True), 11)
+		self.assertEqual(cb.call_count, 11)
+
+
+if __name__ == "__main__":
+	unittest.main()
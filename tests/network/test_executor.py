@@ -0,0 +1,146 @@
+import unittest
+from unittest.mock import Mock
+import threading
+import time
+import can
+import canopen
+from canopen.network import Executor
+
+
+class ExecutorTestCase(unittest.TestCase):
+	def test_init(self):
+		with self.assertRaises(ValueError):
+			Executor(0)
+		with self.assertRaises(ValueError):
+			Executor(1, 0)
+		with self.assertRaises(ValueError):
+			Executor(1, 1, "xxx")
+		
+		examinee = Executor(2, 10, Executor.BLOCK)
+		self.assertEqual(examinee.workers, 2)
+		self.assertEqual(examinee.queue_depth, 10)
+		self.assertEqual(examinee.overflow, Executor.BLOCK)
+		self.assertEqual(examinee.dropped, 0)
+		examinee.stop()
+		
+		with self.assertRaises(RuntimeError):
+			examinee.submit(0x100, Mock())
+	
+	def test_order(self):
+		examinee = Executor(3, 1000, Executor.BLOCK)
+		
+		results = {}
+		lock = threading.Lock()
+		
+		def record(message_id, n):
+			with lock:
+				results.setdefault(message_id, []).append(n)
+		
+		for n in range(500):
+			for message_id in range(5):
+				examinee.submit(message_id, record, message_id, n)
+		
+		time.sleep(0.2)
+		
+		for message_id in range(5):
+			self.assertEqual(results[message_id], list(range(500)))
+		self.assertEqual(examinee.dropped, 0)
+		
+		examinee.stop()
+	
+	def test_drop_oldest(self):
+		examinee = Executor(1, 2, Executor.DROP_OLDEST)
+		
+		gate = threading.Event()
+		cb = Mock()
+		
+		#### Test step: Block the worker, then overflow the queue
+		examinee.submit(0, gate.wait)
+		time.sleep(0.05)
+		for n in range(5):
+			examinee.submit(0, cb, n)
+		self.assertEqual(examinee.dropped, 3)
+		
+		#### Test step: Only the newest calls are executed
+		gate.set()
+		time.sleep(0.05)
+		self.assertEqual([c[0][0] for c in cb.call_args_list], [3, 4])
+		
+		examinee.stop()
+	
+	def test_block(self):
+		examinee = Executor(1, 1, Executor.BLOCK)
+		
+		gate = threading.Event()
+		cb = Mock()
+		
+		examinee.submit(0, gate.wait)
+		time.sleep(0.05)
+		examinee.submit(0, cb, 1)
+		
+		#### Test step: A full queue blocks the caller until there is space
+		producer = threading.Thread(target = examinee.submit, args = (0, cb, 2), daemon = True)
+		producer.start()
+		time.sleep(0.05)
+		self.assertTrue(producer.is_alive())
+		
+		gate.set()
+		producer.join(1)
+		self.assertFalse(producer.is_alive())
+		time.sleep(0.05)
+		self.assertEqual([c[0][0] for c in cb.call_args_list], [1, 2])
+		self.assertEqual(examinee.dropped, 0)
+		
+		#### Test step: Stop discards pending calls
+		gate.clear()
+		examinee.submit(0, gate.wait)
+		time.sleep(0.05)
+		examinee.submit(0, cb, 3)
+		producer = threading.Thread(target = examinee.submit, args = (0, cb, 4), daemon = True)
+		producer.start()
+		time.sleep(0.05)
+		
+		stopper = threading.Thread(target = examinee.stop, daemon = True)
+		stopper.start()
+		time.sleep(0.05)
+		gate.set()
+		stopper.join(1)
+		producer.join(1)
+		self.assertFalse(producer.is_alive())
+		self.assertEqual(examinee.dropped, 2)
+		self.assertEqual(cb.call_count, 2)
+	
+	def test_network(self):
+		with self.assertRaises(TypeError):
+			canopen.Network(object())
+		
+		executor = Executor(2)
+		network = canopen.Network(executor)
+		self.assertEqual(network.executor, executor)
+		
+		threads = []
+		cb = Mock(side_effect = lambda message: threads.append(threading.current_thread()))
+		network.subscribe(cb, 0x100)
+		network.subscribe(self.__callback_raise, 0x100)
+		
+		#### Test step: The callbacks are called by a worker of the executor
+		message = can.Message(arbitration_id = 0x100, is_extended_id = False, data = [])
+		network.on_message(message)
+		time.sleep(0.05)
+		cb.assert_called_once_with(message)
+		self.assertNotEqual(threads[0], threading.current_thread())
+		
+		#### Test step: Messages without subscribers are not queued
+		message = can.Message(arbitration_id = 0x200, is_extended_id = False, data = [])
+		network.on_message(message)
+		time.sleep(0.05)
+		cb.assert_called_once()
+		
+		executor.stop()
+	
+	def __callback_raise(self, message):
+		raise Exception()
+
+
+if __name__ == "__main__":
+	unittest.main()
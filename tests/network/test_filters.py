@@ -0,0 +1,129 @@
+import unittest
+from unittest.mock import Mock
+import random
+import time
+import can
+import canopen
+import threading
+from canopen.network.filters import acceptance_filters, MAX_IDENTIFIERS
+
+
+class AcceptanceFiltersTestCase(unittest.TestCase):
+	def matches(self, filters, message_id):
+		return any((f["can_id"] ^ message_id) & f["can_mask"] == 0 for f in filters)
+	
+	def test_empty(self):
+		self.assertEqual(acceptance_filters([]), [])
+	
+	def test_merge(self):
+		#### Test step: Single identifier
+		self.assertEqual(acceptance_filters([0x181]), [{"can_id": 0x181, "can_mask": 0x7FF, "extended": False}])
+		
+		#### Test step: Identifiers which differ in one bit
+		self.assertEqual(acceptance_filters([0x100, 0x101]), [{"can_id": 0x100, "can_mask": 0x7FE, "extended": False}])
+		
+		#### Test step: All 2048 standard identifiers
+		self.assertEqual(acceptance_filters(range(0x800)), [{"can_id": 0x000, "can_mask": 0x000, "extended": False}])
+		
+		#### Test step: Extended identifiers
+		self.assertEqual(acceptance_filters([0x1FFFFFFE, 0x1FFFFFFF], True), [{"can_id": 0x1FFFFFFE, "can_mask": 0x1FFFFFFE, "extended": True}])
+		
+		#### Test step: The TPDO1 of all nodes
+		filters = acceptance_filters(range(0x181, 0x200))
+		self.assertEqual(len(filters), 7)
+	
+	def test_exact(self):
+		r = random.Random(0)
+		for n in [1, 5, 30, 100, MAX_IDENTIFIERS]:
+			with self.subTest("n=" + str(n)):
+				identifiers = set(r.sample(range(0x800), n))
+				filters = acceptance_filters(identifiers)
+				self.assertLessEqual(len(filters), len(identifiers))
+				for message_id in range(0x800):
+					self.assertEqual(self.matches(filters, message_id), message_id in identifiers)
+
+
+	def test_limit(self):
+		#### Test step: All messages are accepted for too many identifiers
+		identifiers = random.Random(0).sample(range(0x800), MAX_IDENTIFIERS + 1)
+		self.assertEqual(acceptance_filters(identifiers), [{"can_id": 0x000, "can_mask": 0x000, "extended": False}])
+		self.assertEqual(acceptance_filters(range(MAX_IDENTIFIERS + 1), True), [{"can_id": 0x000, "can_mask": 0x000, "extended": True}])
+
+
+class NetworkFiltersTestCase(unittest.TestCase):
+	def test_auto_filters(self):
+		network = canopen.Network()
+		bus1 = can.Bus(interface = "virtual", channel = 0)
+		bus2 = can.Bus(interface = "virtual", channel = 0)
+		
+		cb = Mock()
+		network.subscribe(cb, 0x100)
+		
+		#### Test step: The filters are set on attach
+		network.attach(bus1, True, True)
+		self.assertEqual(bus1.filters, acceptance_filters([0x100]))
+		
+		#### Test step: Changes of the subscriptions are merged into one update
+		network.subscribe(cb, 0x101)
+		network.subscribe(cb, 0x1234, True)
+		time.sleep(0.2)
+		self.assertEqual(bus1.filters, acceptance_filters([0x100, 0x101]) + acceptance_filters([0x1234], True))
+		
+		#### Test step: Messages without subscribers do not pass the filters
+		bus2.send(can.Message(arbitration_id = 0x200, is_extended_id = False, data = []))
+		bus2.send(can.Message(arbitration_id = 0x100, is_extended_id = True, data = []))
+		bus2.send(can.Message(arbitration_id = 0x101, is_extended_id = False, data = []))
+		time.sleep(0.1)
+		cb.assert_called_once()
+		self.assertEqual(cb.call_args[0][0].arbitration_id, 0x101)
+		
+		network.unsubscribe(cb, 0x1234, True)
+		time.sleep(0.2)
+		self.assertEqual(bus1.filters, acceptance_filters([0x100, 0x101]))
+		
+		#### Test step: The filters are removed on detach
+		network.detach()
+		self.assertEqual(bus1.filters, None)
+		
+		network.subscribe(cb, 0x102)
+		time.sleep(0.2)
+		self.assertEqual(bus1.filters, None)
+		
+		bus1.shutdown()
+		bus2.shutdown()
+	
+	def test_thread(self):
+		network = canopen.Network()
+		bus = can.Bus(interface = "virtual", channel = 0)
+		threads = []
+		set_filters = bus.set_filters
+		def record(filters):
+			threads.append(threading.current_thread())
+			set_filters(filters)
+		bus.set_filters = record
+		
+		network.attach(bus, True, True)
+		network.subscribe(Mock(), 0x100)
+		time.sleep(0.2)
+		
+		#### Test step: The filters are computed by a worker, not by the thread of the shared scheduler
+		self.assertEqual(len(threads), 2)
+		self.assertIsNot(threads[1], canopen.util.Scheduler.default()._thread)
+		self.assertIsNot(threads[1], threading.current_thread())
+		self.assertEqual(bus.filters, acceptance_filters([0x100]))
+		
+		#### Test step: Many changes are merged into one update without a thread per update
+		count = threading.active_count()
+		for message_id in range(0x101, 0x140):
+			network.subscribe(Mock(), message_id)
+		time.sleep(0.2)
+		self.assertEqual(len(threads), 3)
+		self.assertLessEqual(threading.active_count(), count + 1)
+		self.assertEqual(bus.filters, acceptance_filters(list(range(0x100, 0x140))))
+		
+		network.detach()
+		bus.shutdown()
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+from unittest.mock import Mock
+import time
+import can
+import canopen
+from canopen import LocalNode, RemoteNode
+from canopen.network import LoopbackBus
+from canopen.nmt.states import PRE_OPERATIONAL
+from canopen.objectdictionary import ObjectDictionary, Variable, UNSIGNED32
+
+
+class LoopbackBusTestCase(unittest.TestCase):
+	def test_send_recv(self):
+		bus1 = LoopbackBus("test_send_recv")
+		bus2 = LoopbackBus("test_send_recv")
+		bus3 = LoopbackBus("test_send_recv", receive_own_messages = True)
+		self.assertFalse(bus1.deterministic)
+		
+		#### Test step: Different mode on the same channel
+		with self.assertRaises(ValueError):
+			LoopbackBus("test_send_recv", True)
+		
+		#### Test step: The message is copied
+		message = can.Message(arbitration_id = 0x181, is_extended_id = False, data = b"\x01")
+		bus1.send(message)
+		message.data = bytearray(b"\x02")
+		for bus in [bus2, bus3]:
+			message_recv = bus.recv(0.1)
+			self.assertEqual(message_recv.arbitration_id, 0x181)
+			self.assertEqual(message_recv.data, b"\x01")
+			self.assertEqual(message_recv.channel, "test_send_recv")
+		self.assertEqual(bus1.recv(0.01), None)
+		
+		#### Test step: Own messages
+		bus3.send(message)
+		self.assertEqual(bus3.recv(0.1).data, b"\x02")
+		self.assertEqual(bus2.recv(0.1).data, b"\x02")
+		
+		#### Test step: Filters
+		bus2.set_filters([{"can_id": 0x200, "can_mask": 0x7FF, "extended": False}])
+		bus1.send(can.Message(arbitration_id = 0x181, is_extended_id = False))
+		bus1.send(can.Message(arbitration_id = 0x200, is_extended_id = False))
+		self.assertEqual(bus2.recv(0.1).arbitration_id, 0x200)
+		
+		bus2.shutdown()
+		with self.assertRaises(can.CanError):
+			bus2.send(message)
+		
+		bus1.shutdown()
+		bus3.shutdown()
+	
+	def test_network(self):
+		network1 = canopen.Network()
+		network2 = canopen.Network()
+		bus1 = LoopbackBus("test_network")
+		bus2 = LoopbackBus("test_network")
+		network1.attach(bus1)
+		network2.attach(bus2)
+		
+		dictionary = ObjectDictionary()
+		dictionary.add(Variable("var", 0x5678, 0x00, UNSIGNED32, "rw"))
+		local = LocalNode("local", 1, dictionary)
+		remote = RemoteNode("remote", 1, dictionary)
+		network1.add(local)
+		network2.add(remote)
+		
+		#### Test step: Blocking SDO transfers work in the default mode
+		remote.set_data(0x5678, 0x00, 0x12345678)
+		self.assertEqual(local.get_data(0x5678, 0x00), 0x12345678)
+		self.assertEqual(remote.get_data(0x5678, 0x00), 0x12345678)
+		
+		#### Test step: After detach, the messages are queued for recv
+		del network1["local"]
+		network1.detach()
+		network2.send(can.Message(arbitration_id = 0x123, is_extended_id = False))
+		self.assertEqual(bus1.recv(0.1).arbitration_id, 0x123)
+		
+		del network2["remote"]
+		network2.detach()
+		bus1.shutdown()
+		bus2.shutdown()
+	
+	def test_deterministic(self):
+		master_bus = LoopbackBus("test_deterministic", True)
+		master = canopen.Network()
+		master.attach(master_bus)
+		self.assertTrue(master_bus.deterministic)
+		
+		nodes = []
+		for node_id in range(1, 128):
+			network = canopen.Network()
+			network.attach(LoopbackBus("test_deterministic", True))
+			node = LocalNode("n" + str(node_id), node_id, ObjectDictionary())
+			network.add(node)
+			node.nmt.state = PRE_OPERATIONAL
+			nodes.append(node)
+		
+		received = []
+		cb = Mock(side_effect = lambda message: received.append(message.arbitration_id))
+		for node_id in range(1, 128):
+			master.subscribe(cb, 0x700 + node_id)
+		
+		#### Test step: Nothing is delivered before process
+		master.send_many(can.Message(arbitration_id = 0x700 + node_id, is_extended_id = False, is_remote_frame = True, dlc = 1) for node_id in range(1, 128))
+		time.sleep(0.01)
+		cb.assert_not_called()
+		
+		#### Test step: The guard requests and the responses sent by the callbacks are delivered in order
+		self.assertEqual(master_bus.process(), 254)
+		self.assertEqual(received, [0x700 + node_id for node_id in range(1, 128)])
+		self.assertEqual(master_bus.process(), 0)
+		
+		for node in nodes:
+			network = node.network
+			bus = network._bus
+			del network[node.id]
+			network.detach()
+			bus.shutdown()
+		master.detach()
+		master_bus.shutdown()
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import Mock
+import time
+import can
+import canopen
+from canopen.network import Metrics
+from canopen.objectdictionary import ObjectDictionary
+from canopen.node.service.sync import SYNCConsumer
+
+
+class MetricsTestCase(unittest.TestCase):
+	def test_init(self):
+		examinee = Metrics()
+		snapshot = examinee.snapshot()
+		self.assertEqual(snapshot["rx"], {})
+		self.assertEqual(snapshot["tx"], {})
+		self.assertEqual(snapshot["unsubscribed"], 0)
+		self.assertEqual(snapshot["exceptions"], 0)
+		self.assertEqual(snapshot["last_traceback"], None)
+		self.assertEqual(snapshot["callback_time"]["count"], 0)
+		self.assertEqual(snapshot["latency"]["counts"], [0] * (len(Metrics.BOUNDS) + 1))
+	
+	def test_record(self):
+		examinee = Metrics()
+		
+		examinee.record_rx(can.Message(arbitration_id = 0x181, is_extended_id = False), True)
+		examinee.record_rx(can.Message(arbitration_id = 0x181, is_extended_id = False), False)
+		examinee.record_rx(can.Message(arbitration_id = 0x181, is_extended_id = True), True)
+		examinee.record_tx(can.Message(arbitration_id = 0x201, is_extended_id = False))
+		examinee.record_callback_time(0.000005)
+		examinee.record_callback_time(0.05)
+		examinee.record_callback_time(5)
+		examinee.record_latency(0.0005)
+		try:
+			raise KeyError("xyz")
+		except:
+			examinee.record_exception()
+		self.assertIn("KeyError: 'xyz'", examinee.snapshot()["last_traceback"])
+		try:
+			raise KeyError("xyz")
+		except KeyError as e:
+			exception = e
+		examinee.record_exception(exception)
+		self.assertEqual(examinee.snapshot()["exceptions"], 2)
+		examinee.record_exception(KeyError("xyz"))
+		
+		snapshot = examinee.snapshot()
+		self.assertEqual(snapshot["rx"], {0x181: 2, (1 << 29) | 0x181: 1})
+		self.assertEqual(snapshot["tx"], {0x201: 1})
+		self.assertEqual(snapshot["unsubscribed"], 1)
+		self.assertEqual(snapshot["exceptions"], 3)
+		self.assertEqual(snapshot["last_traceback"], "KeyError: 'xyz'\n")
+		self.assertEqual(snapshot["callback_time"]["counts"], [1, 0, 0, 0, 1, 0, 1])
+		self.assertEqual(snapshot["callback_time"]["count"], 3)
+		self.assertAlmostEqual(snapshot["callback_time"]["sum"], 5.050005)
+		self.assertEqual(snapshot["callback_time"]["max"], 5)
+		self.assertEqual(snapshot["latency"]["counts"], [0, 0, 1, 0, 0, 0, 0])
+		
+		#### Test step: The snapshot is a copy
+		examinee.record_tx(can.Message(arbitration_id = 0x201, is_extended_id = False))
+		self.assertEqual(snapshot["tx"], {0x201: 1})
+		
+		examinee.reset()
+		self.assertEqual(examinee.snapshot()["tx"], {})
+
+
+class NetworkMetricsTestCase(unittest.TestCase):
+	def test_network(self):
+		with self.assertRaises(TypeError):
+			canopen.Network(None, None, object())
+		
+		metrics = Metrics()
+		network = canopen.Network(metrics = metrics)
+		self.assertEqual(network.metrics, metrics)
+		bus1 = can.Bus(interface = "virtual", channel = 0)
+		bus2 = can.Bus(interface = "virtual", channel = 0)
+		network.attach(bus1)
+		
+		cb1 = Mock()
+		cb2 = Mock(side_effect = ValueError())
+		network.subscribe(cb1, 0x100)
+		network.subscribe(cb2, 0x100)
+		
+		bus2.send(can.Message(arbitration_id = 0x100, is_extended_id = False))
+		bus2.send(can.Message(arbitration_id = 0x100, is_extended_id = False))
+		bus2.send(can.Message(arbitration_id = 0x200, is_extended_id = False))
+		network.send(can.Message(arbitration_id = 0x300, is_extended_id = False))
+		network.send_many([can.Message(arbitration_id = 0x300, is_extended_id = False), can.Message(arbitration_id = 0x301, is_extended_id = True)])
+		time.sleep(0.1)
+		
+		snapshot = metrics.snapshot()
+		self.assertEqual(snapshot["rx"], {0x100: 2, 0x200: 1})
+		self.assertEqual(snapshot["tx"], {0x300: 2, (1 << 29) | 0x301: 1})
+		self.assertEqual(snapshot["unsubscribed"], 1)
+		self.assertEqual(snapshot["exceptions"], 2)
+		self.assertIn("ValueError", snapshot["last_traceback"])
+		self.assertEqual(snapshot["callback_time"]["count"], 4)
+		self.assertEqual(snapshot["latency"]["count"], 2)
+		self.assertEqual(cb1.call_count, 2)
+		
+		network.detach()
+		bus1.shutdown()
+		bus2.shutdown()
+	
+	def test_service(self):
+		metrics = Metrics()
+		network = canopen.Network(metrics = metrics)
+		node = canopen.Node("a", 1, ObjectDictionary())
+		examinee = SYNCConsumer(node)
+		examinee.add_callback("sync", Mock(side_effect = RuntimeError()))
+		
+		#### Test step: Node without network
+		examinee.notify("sync", examinee, None)
+		self.assertEqual(metrics.snapshot()["exceptions"], 0)
+		
+		#### Test step: Exceptions of the service callbacks are recorded
+		node.attach(network)
+		examinee.notify("sync", examinee, None)
+		self.assertEqual(metrics.snapshot()["exceptions"], 1)
+		self.assertIn("RuntimeError", metrics.snapshot()["last_traceback"])
+		node.detach()
+
+
+if __name__ == "__main__":
+	unittest.main()
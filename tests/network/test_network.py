@@ -46,22 +46,92 @@ class NetworkTestCase(unittest.TestCase):
 		network.subscribe(cb, 0x100)
 		network.subscribe(self.__callback_raise, 0x100)
 		
-		message = can.Message(arbitration_id = 0x100, data = [])
+		message = can.Message(arbitration_id = 0x100, is_extended_id = False, data = [])
 		network.on_message(message)
 		cb.assert_called_once()
 		
-		message = can.Message(arbitration_id = 0x200, data = [])
+		message = can.Message(arbitration_id = 0x200, is_extended_id = False, data = [])
 		network.on_message(message)
 		cb.assert_called_once()
 		
 		network.unsubscribe(cb, 0x100)
 		
-		message = can.Message(arbitration_id = 0x100, data = [])
+		message = can.Message(arbitration_id = 0x100, is_extended_id = False, data = [])
 		network.on_message(message)
 		cb.assert_called_once()
 		
 		network.unsubscribe(self.__callback_raise, 0x100)
 	
+	def test_message_invalid_id(self):
+		metrics = canopen.network.Metrics()
+		network = canopen.Network(metrics = metrics)
+		cb = Mock()
+		network.subscribe(cb, 0x7FF)
+		
+		#### Test step: Standard identifiers out of range do not wrap around and are recorded as unsubscribed
+		for arbitration_id in [-1, 0x800, 0xFFF]:
+			network.on_message(can.Message(arbitration_id = arbitration_id, is_extended_id = False, data = []))
+		cb.assert_not_called()
+		self.assertEqual(metrics.snapshot()["unsubscribed"], 3)
+	
+	def test_message_extended(self):
+		network = canopen.Network()
+		
+		cb_standard = Mock()
+		cb_extended = Mock()
+		network.subscribe(cb_standard, 0x100)
+		network.subscribe(cb_extended, 0x100, True)
+		
+		#### Test step: Frames with the same identifier are distinguished by the frame format
+		message = can.Message(arbitration_id = 0x100, is_extended_id = False, data = [])
+		network.on_message(message)
+		cb_standard.assert_called_once_with(message)
+		cb_extended.assert_not_called()
+		
+		message = can.Message(arbitration_id = 0x100, is_extended_id = True, data = [])
+		network.on_message(message)
+		cb_standard.assert_called_once()
+		cb_extended.assert_called_once_with(message)
+		
+		#### Test step: Extended identifiers out of the standard range
+		network.subscribe(cb_extended, 0x1FFFFFFF, True)
+		message = can.Message(arbitration_id = 0x1FFFFFFF, is_extended_id = True, data = [])
+		network.on_message(message)
+		self.assertEqual(cb_extended.call_count, 2)
+		
+		network.unsubscribe(cb_standard, 0x100)
+		network.unsubscribe(cb_extended, 0x100, True)
+		network.unsubscribe(cb_extended, 0x1FFFFFFF, True)
+		
+		with self.assertRaises(KeyError):
+			network.unsubscribe(cb_extended, 0x100, True)
+		with self.assertRaises(KeyError):
+			network.unsubscribe(cb_standard, 0x800)
+	
+	def test_subscribe_during_dispatch(self):
+		network = canopen.Network()
+		
+		cb1 = Mock(side_effect = lambda message: network.unsubscribe(cb1, 0x100))
+		cb2 = Mock()
+		network.subscribe(cb1, 0x100)
+		network.subscribe(cb2, 0x100)
+		
+		#### Test step: Unsubscribing during dispatch does not affect the ongoing dispatch
+		message = can.Message(arbitration_id = 0x100, is_extended_id = False, data = [])
+		network.on_message(message)
+		cb1.assert_called_once()
+		cb2.assert_called_once()
+		
+		#### Test step: The next message is dispatched with the changed subscriptions
+		network.on_message(message)
+		cb1.assert_called_once()
+		self.assertEqual(cb2.call_count, 2)
+		
+		#### Test step: The identifier is removed when the last callback is unsubscribed
+		network.unsubscribe(cb2, 0x100)
+		with self.assertRaises(KeyError):
+			network.unsubscribe(cb2, 0x100)
+	
 	def test_subscribe(self):
 		network = canopen.Network()
 		
@@ -75,9 +145,22 @@ class NetworkTestCase(unittest.TestCase):
 		
 		cb = Mock()
 		
+		with self.assertRaises(ValueError):
+			network.subscribe(cb, -1)
+		with self.assertRaises(ValueError):
+			network.subscribe(cb, 0x800)
+		with self.assertRaises(ValueError):
+			network.subscribe(cb, -1, True)
+		with self.assertRaises(ValueError):
+			network.subscribe(cb, 0x20000000, True)
+		
 		network.subscribe(cb, 0x100)
 		with self.assertRaises(KeyError):
 			network.unsubscribe(cb, 0x200)
+		with self.assertRaises(KeyError):
+			network.unsubscribe(cb, 0x100, True)
+		with self.assertRaises(ValueError):
+			network.unsubscribe(Mock(), 0x100)
 		network.unsubscribe(cb, 0x100)
 	
 	def test_collection(self):
@@ -163,6 +246,34 @@ class NetworkTestCase(unittest.TestCase):
 		bus1.shutdown()
 		bus2.shutdown()
 	
+	def test_send_many(self):
+		network = canopen.Network()
+		bus1 = can.Bus(interface = "virtual", channel = 0)
+		bus2 = can.Bus(interface = "virtual", channel = 0)
+		
+		#### Test step: Send on detached bus
+		with self.assertRaises(RuntimeError):
+			network.send_many([can.Message(arbitration_id = 0x00, dlc = 0)])
+		
+		network.attach(bus1)
+		
+		#### Test step: Empty sequence
+		network.send_many([])
+		self.assertEqual(bus2.recv(0.01), None)
+		
+		#### Test step: Messages are sent in the given order, also from a generator
+		messages = [can.Message(arbitration_id = 0x200 + i, is_extended_id = False, data = [i]) for i in range(4)]
+		network.send_many(m for m in messages)
+		for message_send in messages:
+			message_recv = bus2.recv(0.1)
+			self.assertEqual(message_recv.arbitration_id, message_send.arbitration_id)
+			self.assertEqual(message_recv.data, message_send.data)
+		
+		network.detach()
+		
+		bus1.shutdown()
+		bus2.shutdown()
+	
 	def __callback_raise(self, message):
 		raise Exception()
 
@@ -176,7 +287,7 @@ class MessageListenerTestCase(unittest.TestCase):
 	def test_message(self):
 		network = canopen.Network()
 		listener = canopen.network.MessageListener(network)
-		message = can.Message(arbitration_id = 0x100, data = [])
+		message = can.Message(arbitration_id = 0x100, is_extended_id = False, data = [])
 		
 		network.on_message = Mock()
 		
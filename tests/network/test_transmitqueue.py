@@ -0,0 +1,182 @@
+import unittest
+from unittest.mock import Mock
+import threading
+import time
+import can
+import canopen
+from canopen.network import TransmitQueue
+
+
+class TransmitQueueTestCase(unittest.TestCase):
+	def test_init(self):
+		with self.assertRaises(ValueError):
+			TransmitQueue(0)
+		with self.assertRaises(ValueError):
+			TransmitQueue(None, -1)
+		with self.assertRaises(ValueError):
+			TransmitQueue(None, None, 0)
+		
+		examinee = TransmitQueue(100, 50000, 10)
+		self.assertEqual(examinee.frames_per_second, 100)
+		self.assertEqual(examinee.bits_per_second, 50000)
+		self.assertEqual(examinee.queue_depth, 10)
+		self.assertEqual(examinee.pending, 0)
+		self.assertEqual(examinee.dropped, 0)
+		self.assertEqual(examinee.errors, 0)
+		self.assertEqual(examinee.statistics, {})
+		
+		#### Test step: Submit without bus
+		with self.assertRaises(RuntimeError):
+			examinee.submit(can.Message(arbitration_id = 0x100, is_extended_id = False))
+		
+		examinee.stop()
+		
+		with self.assertRaises(RuntimeError):
+			examinee.submit(can.Message(arbitration_id = 0x100, is_extended_id = False))
+	
+	def test_priority(self):
+		examinee = TransmitQueue()
+		
+		gate = threading.Event()
+		sent = []
+		def send(message):
+			gate.wait()
+			sent.append(message)
+		bus = Mock()
+		bus.send = Mock(side_effect = send)
+		examinee.attach(bus)
+		
+		#### Test step: Block the worker with the first message, then queue messages in reverse order of priority
+		examinee.submit(can.Message(arbitration_id = 0x7FF, is_extended_id = False))
+		time.sleep(0.05)
+		examinee.submit(can.Message(arbitration_id = 0x600, is_extended_id = False, data = [1]))
+		examinee.submit(can.Message(arbitration_id = 0x600, is_extended_id = False, data = [2]))
+		examinee.submit(can.Message(arbitration_id = 0x100 << 18, is_extended_id = True))
+		examinee.submit(can.Message(arbitration_id = 0x100, is_extended_id = False))
+		examinee.submit(can.Message(arbitration_id = 0x080, is_extended_id = False))
+		examinee.submit(can.Message(arbitration_id = 0x000, is_extended_id = True))
+		self.assertEqual(examinee.pending, 6)
+		
+		gate.set()
+		self.assertTrue(examinee.flush(1))
+		
+		self.assertEqual([(m.arbitration_id, m.is_extended_id) for m in sent], [(0x7FF, False), (0x000, True), (0x080, False), (0x100, False), (0x100 << 18, True), (0x600, False), (0x600, False)])
+		self.assertEqual(sent[5].data, b"\x01")
+		self.assertEqual(sent[6].data, b"\x02")
+		
+		#### Test step: Statistics per function code
+		statistics = examinee.statistics
+		self.assertEqual(statistics[0x0]["count"], 1)
+		self.assertEqual(statistics[0x1]["count"], 1)
+		self.assertEqual(statistics[0x2]["count"], 2)
+		self.assertEqual(statistics[0xC]["count"], 2)
+		self.assertEqual(statistics[0xF]["count"], 1)
+		self.assertGreaterEqual(statistics[0xC]["latency_max"], statistics[0xC]["latency_mean"])
+		self.assertGreater(statistics[0xC]["latency_mean"], 0)
+		
+		examinee.reset_statistics()
+		self.assertEqual(examinee.statistics, {})
+		
+		examinee.stop()
+	
+	def test_copy(self):
+		examinee = TransmitQueue()
+		bus1 = can.Bus(interface = "virtual", channel = 0)
+		bus2 = can.Bus(interface = "virtual", channel = 0)
+		examinee.attach(bus1)
+		
+		#### Test step: A reused message may be modified after submission
+		message = can.Message(arbitration_id = 0x181, is_extended_id = False, data = b"\x01")
+		for i in range(10):
+			message.data = bytearray([i])
+			examinee.submit(message)
+		for i in range(10):
+			self.assertEqual(bus2.recv(0.1).data, bytearray([i]))
+		
+		examinee.stop()
+		bus1.shutdown()
+		bus2.shutdown()
+	
+	def test_budget(self):
+		bus = Mock()
+		
+		#### Test step: Frames per second
+		examinee = TransmitQueue(200)
+		examinee.attach(bus)
+		t = time.monotonic()
+		for i in range(21):
+			examinee.submit(can.Message(arbitration_id = 0x181, is_extended_id = False, data = [i]))
+		self.assertTrue(examinee.flush(2))
+		self.assertGreaterEqual(time.monotonic() - t, 0.09)
+		self.assertEqual(bus.send.call_count, 21)
+		examinee.stop()
+		
+		#### Test step: Bits per second, 111 bits for each standard frame with 8 bytes
+		bus.reset_mock()
+		examinee = TransmitQueue(None, 11100)
+		examinee.attach(bus)
+		t = time.monotonic()
+		for i in range(11):
+			examinee.submit(can.Message(arbitration_id = 0x181, is_extended_id = False, data = [0] * 8))
+		self.assertTrue(examinee.flush(2))
+		self.assertGreaterEqual(time.monotonic() - t, 0.09)
+		self.assertEqual(bus.send.call_count, 11)
+		examinee.stop()
+	
+	def test_detach(self):
+		examinee = TransmitQueue(10)
+		bus = Mock()
+		bus.send = Mock(side_effect = can.CanError())
+		examinee.attach(bus)
+		
+		#### Test step: Errors of the bus are counted
+		examinee.submit(can.Message(arbitration_id = 0x181, is_extended_id = False))
+		self.assertTrue(examinee.flush(1))
+		self.assertEqual(examinee.errors, 1)
+		
+		#### Test step: Pending messages are dropped on detach
+		for i in range(5):
+			examinee.submit(can.Message(arbitration_id = 0x181, is_extended_id = False))
+		examinee.detach()
+		self.assertEqual(examinee.pending, 0)
+		self.assertGreaterEqual(examinee.dropped, 4)
+		
+		examinee.stop()
+
+
+class NetworkTransmitQueueTestCase(unittest.TestCase):
+	def test_send(self):
+		with self.assertRaises(TypeError):
+			canopen.Network(None, object())
+		
+		transmit_queue = TransmitQueue()
+		network = canopen.Network(None, transmit_queue)
+		self.assertEqual(network.transmit_queue, transmit_queue)
+		bus1 = can.Bus(interface = "virtual", channel = 0)
+		bus2 = can.Bus(interface = "virtual", channel = 0)
+		
+		with self.assertRaises(RuntimeError):
+			network.send(can.Message(arbitration_id = 0x100, is_extended_id = False))
+		
+		network.attach(bus1)
+		
+		network.send(can.Message(arbitration_id = 0x100, is_extended_id = False, data = b"\x11"))
+		network.send_many([can.Message(arbitration_id = 0x200 + i, is_extended_id = False) for i in range(3)])
+		self.assertTrue(transmit_queue.flush(1))
+		
+		self.assertEqual(bus2.recv(0.1).arbitration_id, 0x100)
+		for i in range(3):
+			self.assertEqual(bus2.recv(0.1).arbitration_id, 0x200 + i)
+		
+		network.detach()
+		
+		with self.assertRaises(RuntimeError):
+			transmit_queue.submit(can.Message(arbitration_id = 0x100, is_extended_id = False))
+		
+		transmit_queue.stop()
+		bus1.shutdown()
+		bus2.shutdown()
+
+
+if __name__ == "__main__":
+	unittest.main()
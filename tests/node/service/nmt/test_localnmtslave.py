@@ -520,7 +520,7 @@ class LocalNMTSlaveTestCase(unittest.TestCase):
 		
 		# Interval 0, Trigger guarding with the first RTR
 		
-		message = can.Message(arbitration_id = 0x700 + node.id, is_remote_frame = True, dlc = 1)
+		message = can.Message(arbitration_id = 0x700 + node.id, is_extended_id = False, is_remote_frame = True, dlc = 1)
 		bus2.send(message)
 		
 		time.sleep(0.05 + start_time - time.time())
@@ -535,7 +535,7 @@ class LocalNMTSlaveTestCase(unittest.TestCase):
 		time.sleep(0.15 + start_time - time.time())
 		
 		# Interval 1, t = 0.15
-		message = can.Message(arbitration_id = 0x700 + node.id, is_remote_frame = True, dlc = 1)
+		message = can.Message(arbitration_id = 0x700 + node.id, is_extended_id = False, is_remote_frame = True, dlc = 1)
 		bus2.send(message)
 		
 		time.sleep(0.2 + start_time - time.time())
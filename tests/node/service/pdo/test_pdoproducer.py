@@ -181,7 +181,34 @@ class PDOProducerTest(unittest.TestCase):
 				self.assertEqual(message.is_extended_id, bool(cob_id_tx & (1 << 29)))
 				self.assertEqual(message.data, data)
 				
+				#### Test step: A message returned before is not changed by new data
+				message = examinee.message
+				examinee.data = b"\x11\x22"
+				self.assertIsNot(examinee.message, message)
+				self.assertEqual(message.data, b"\x00")
+				self.assertEqual(examinee.message.data, b"\x11\x22")
+				self.assertEqual(examinee.message.dlc, 2)
+				self.assertIs(examinee.message, examinee.message)
+				examinee.send()
+				
+				message = bus2.recv(0.1)
+				self.assertEqual(message.data, b"\x11\x22")
+				
 			examinee.detach()
+			self.assertEqual(examinee.message, None)
+		
+		#### Test step: Send the PDOs of several services at once
+		examinees = [PDOProducer(node) for i in range(4)]
+		for i, e in enumerate(examinees):
+			e.attach(0x200 + 0x100 * i + node.id)
+			e.data = bytes([i])
+		network.send_many(e.message for e in examinees)
+		for i in range(4):
+			message = bus2.recv(0.1)
+			self.assertEqual(message.arbitration_id, 0x200 + 0x100 * i + node.id)
+			self.assertEqual(message.data, bytes([i]))
+		for e in examinees:
+			e.detach()
 		
 		node.detach()
 		network.detach()
@@ -1,6 +1,7 @@
 import unittest
-
-from canopen.objectdictionary import ObjectDictionary, Variable, Record, INTEGER32, UNSIGNED8
+import struct
+import canopen.node.service.objectmapping
+from canopen.objectdictionary import ObjectDictionary, Variable, Record, INTEGER32, UNSIGNED8, INTEGER24, INTEGER40, REAL32, BOOLEAN, VISIBLE_STRING
 from canopen.node.service import Service
 from canopen.node.service.objectmapping import ObjectMapping
 from canopen.node.node import Node
@@ -93,6 +94,71 @@ class ObjectMappingTest(unittest.TestCase):
 			examinee[3]
 		with self.assertRaises(IndexError):
 			examinee[4]
+	
+	@unittest.skipIf(canopen.node.service.objectmapping.numpy == None, "numpy is not installed")
+	def test_decode_array(self):
+		numpy = canopen.node.service.objectmapping.numpy
+		dictionary = ObjectDictionary()
+		dictionary.add(Variable("i24", 0x2000, 0x00, INTEGER24))
+		dictionary.add(Variable("r32", 0x2001, 0x00, REAL32))
+		dictionary.add(Variable("b", 0x2002, 0x00, BOOLEAN))
+		dictionary.add(Variable("u8", 0x2003, 0x00, UNSIGNED8))
+		dictionary.add(Variable("i40", 0x2004, 0x00, INTEGER40))
+		dictionary.add(Variable("s", 0x2005, 0x00, VISIBLE_STRING))
+		node = Node("a", 1, dictionary)
+		service = Service(node)
+		examinee = ObjectMapping(service)
+		
+		examinee.append((0x2000, 0x00), 24)
+		examinee.append((0x2001, 0x00), 32)
+		examinee.append((0x0001, 0x00), 1)
+		examinee.append((0x2002, 0x00), 1)
+		examinee.append((0x2003, 0x00), 6)
+		values = range(-50, 50)
+		data = b"".join(int.to_bytes(v, 3, "little", signed = True) + struct.pack("<f", v / 2) + bytes([((v & 1) << 1) | ((v & 0x3F) << 2)]) for v in values)
+		
+		#### Test step: Structured array, bit fields and 24 bit integers
+		result = examinee.decode_array(data)
+		self.assertEqual(result.dtype.names, ("i24", "r32", "b", "u8"))
+		self.assertEqual(list(result["i24"]), list(values))
+		self.assertEqual(list(result["r32"]), [v / 2 for v in values])
+		self.assertEqual(list(result["b"]), [bool(v & 1) for v in values])
+		self.assertEqual(list(result["u8"]), [v & 0x3F for v in values])
+		
+		#### Test step: Columns from an array of frames
+		result = examinee.decode_array(numpy.frombuffer(data, dtype = numpy.uint8).reshape(-1, 8), True)
+		self.assertEqual(list(result.keys()), ["i24", "r32", "b", "u8"])
+		self.assertEqual(list(result["i24"]), list(values))
+		frames = numpy.frombuffer(data, dtype = numpy.int8).reshape(-1, 8)
+		self.assertEqual(list(examinee.decode_array(frames)["i24"]), list(values))
+		
+		#### Test step: Arrays of wider elements are not truncated to bytes
+		for dtype in [numpy.uint16, numpy.int32, numpy.float64]:
+			with self.subTest(dtype = dtype):
+				with self.assertRaises(ValueError):
+					examinee.decode_array(numpy.zeros((4, 8), dtype = dtype))
+		
+		#### Test step: 40 bit integers
+		examinee.clear()
+		examinee.append((0x2004, 0x00), 40)
+		data = b"".join(int.to_bytes(v, 5, "little", signed = True) + b"\xFF\xFF\xFF" for v in [-(1 << 39), -1, 0, (1 << 39) - 1])
+		self.assertEqual(list(examinee.decode_array(data)["i40"]), [-(1 << 39), -1, 0, (1 << 39) - 1])
+		
+		#### Test step: Invalid data and mappings
+		with self.assertRaises(ValueError):
+			examinee.decode_array(b"\x00" * 9)
+		examinee.append((0x2003, 0x00), 8)
+		examinee.append((0x2003, 0x00), 8)
+		with self.assertRaises(ValueError):
+			examinee.decode_array(b"\x00" * 8)
+		examinee.clear()
+		examinee.append((0x2004, 0x00), 40)
+		examinee.append((0x2005, 0x00), 8)
+		with self.assertRaises(ValueError):
+			examinee.decode_array(b"\x00" * 8)
+		examinee.append((0x2004, 0x00), 40)
+		with self.assertRaises(ValueError):
+			examinee.decode_array(b"\x00" * 8)
 
 
 if __name__ == "__main__":
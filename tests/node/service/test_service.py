@@ -1,5 +1,8 @@
 import unittest
 from unittest.mock import Mock
+import asyncio
+import threading
+import canopen.util
 from canopen import Node
 from canopen.objectdictionary import ObjectDictionary
 from canopen.node.service import Service
@@ -81,6 +84,152 @@ class ServiceTestCase(unittest.TestCase):
 		
 		with self.assertRaises(KeyError):
 			examinee.remove_event(event)
+	
+	def test_dispatch(self):
+		dictionary = ObjectDictionary()
+		node = Node("n", 1, dictionary)
+		examinee = Service(node)
+		
+		#### Test step: The dispatcher returned by add_event notifies the callbacks
+		dispatcher = examinee.add_event("ABC")
+		self.assertEqual(dispatcher.name, "ABC")
+		self.assertEqual(dispatcher.callbacks, ())
+		dispatcher.notify(1)
+		
+		callback1 = Mock()
+		callback2 = Mock()
+		examinee.add_callback("ABC", callback1)
+		examinee.add_callback("ABC", callback2)
+		self.assertEqual(dispatcher.callbacks, (callback1, callback2))
+		dispatcher.notify(1, 2)
+		callback1.assert_called_once_with("ABC", 1, 2)
+		callback2.assert_called_once_with("ABC", 1, 2)
+		
+		#### Test step: Removing a callback while notifying does not affect the running notification
+		callback1.reset_mock()
+		callback2.reset_mock()
+		callback1.side_effect = lambda *args: examinee.remove_callback("ABC", callback2)
+		examinee.notify("ABC")
+		callback2.assert_called_once_with("ABC")
+		self.assertEqual(dispatcher.callbacks, (callback1,))
+	
+	def test_concurrent_callbacks(self):
+		dictionary = ObjectDictionary()
+		node = Node("n", 1, dictionary)
+		examinee = Service(node)
+		dispatcher = examinee.add_event("ABC")
+		
+		#### Test step: No callback is lost when callbacks are added and removed by several threads
+		callbacks = [[Mock() for i in range(200)] for j in range(8)]
+		def add_remove(callbacks):
+			for callback in callbacks:
+				examinee.add_callback("ABC", callback)
+			for callback in callbacks[::2]:
+				examinee.remove_callback("ABC", callback)
+		threads = [threading.Thread(target = add_remove, args = (c,)) for c in callbacks]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		
+		self.assertEqual(len(dispatcher.callbacks), 8 * 100)
+		self.assertEqual(set(dispatcher.callbacks), set(callback for c in callbacks for callback in c[1::2]))
+	
+	def test_error_handler(self):
+		dictionary = ObjectDictionary()
+		node = Node("n", 1, dictionary)
+		examinee = Service(node)
+		examinee.add_event("ABC")
+		exception = ValueError()
+		callback1 = Mock(side_effect = exception)
+		callback2 = Mock()
+		examinee.add_callback("ABC", callback1)
+		examinee.add_callback("ABC", callback2)
+		
+		self.assertEqual(examinee.error_handler, None)
+		with self.assertRaises(TypeError):
+			examinee.error_handler = 1
+		
+		#### Test step: Without a handler, the exception is dropped
+		examinee.notify("ABC", 1)
+		callback2.assert_called_once_with("ABC", 1)
+		
+		#### Test step: The handler gets the exception and the other callbacks are still called
+		handler = Mock(side_effect = Exception)
+		examinee.error_handler = handler
+		self.assertEqual(examinee.error_handler, handler)
+		examinee.notify("ABC", 1)
+		handler.assert_called_once_with(examinee, "ABC", callback1, exception)
+		self.assertEqual(callback2.call_count, 2)
+		
+		examinee.error_handler = None
+		self.assertEqual(examinee.error_handler, None)
+	
+	def test_coroutine_callback(self):
+		dictionary = ObjectDictionary()
+		node = Node("n", 1, dictionary)
+		examinee = Service(node)
+		examinee.add_event("ABC")
+		loop = asyncio.new_event_loop()
+		
+		calls = []
+		async def callback(event, value):
+			calls.append((event, value))
+			if value < 0:
+				raise ValueError()
+		
+		handler = Mock()
+		examinee.error_handler = handler
+		examinee.add_callback("ABC", callback, loop)
+		batcher = canopen.util.AsyncBatcher.for_loop(loop)
+		
+		async def run():
+			#### Test step: A burst of events from another thread is delivered with one wake-up of the event loop
+			wakeups = batcher.wakeups
+			thread = threading.Thread(target = lambda: [examinee.notify("ABC", i) for i in range(50)])
+			thread.start()
+			thread.join()
+			await asyncio.sleep(0.01)
+			self.assertEqual(calls, [("ABC", i) for i in range(50)])
+			self.assertEqual(batcher.wakeups, wakeups + 1)
+			
+			#### Test step: Exceptions are passed to the error handler
+			examinee.notify("ABC", -1)
+			await asyncio.sleep(0.01)
+			self.assertEqual(handler.call_count, 1)
+			self.assertEqual(handler.call_args[0][:3], (examinee, "ABC", callback))
+			self.assertIsInstance(handler.call_args[0][3], ValueError)
+			
+			#### Test step: Exceptions raised when the coroutine is created are passed to the error handler
+			examinee.notify("ABC")
+			await asyncio.sleep(0.01)
+			self.assertEqual(handler.call_count, 2)
+			self.assertIsInstance(handler.call_args[0][3], TypeError)
+		
+		loop.run_until_complete(run())
+		
+		#### Test step: The traceback of an exception of a coroutine function is recorded in the metrics
+		network = canopen.Network(metrics = canopen.network.Metrics())
+		network.add(node)
+		async def run_metrics():
+			examinee.notify("ABC", -2)
+			await asyncio.sleep(0.01)
+		loop.run_until_complete(run_metrics())
+		traceback = network.metrics.snapshot()["last_traceback"]
+		self.assertIn("in callback", traceback)
+		self.assertIn("ValueError", traceback)
+		del network[node.name]
+		
+		#### Test step: Without an event loop, a coroutine function is not added
+		with self.assertRaises(RuntimeError):
+			examinee.add_callback("ABC", callback)
+		self.assertEqual(len(examinee._callbacks["ABC"].callbacks), 1)
+		
+		#### Test step: The coroutine function is removed like other callbacks
+		examinee.remove_callback("ABC", callback)
+		self.assertEqual(examinee.add_event("XYZ").callbacks, ())
+		self.assertEqual(examinee._callbacks["ABC"].callbacks, ())
+		loop.close()
 
 
 if __name__ == "__main__":
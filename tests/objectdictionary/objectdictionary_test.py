@@ -129,6 +129,99 @@ class ObjectDictionaryTestCase(unittest.TestCase):
 			del dictionary[x.name]
 		
 		self.assertEqual(len(dictionary), 0)
+	
+	def test_range(self):
+		dictionary = canopen.ObjectDictionary()
+		for index in [0x1A01, 0x1400, 0x1000, 0x1600, 0x1401, 0x1A00, 0x15FF, 0x1800]:
+			dictionary.add(canopen.objectdictionary.Variable("var" + hex(index), index, 0, canopen.objectdictionary.UNSIGNED32))
+		
+		#### Test step: Range in ascending order, without the stop index
+		self.assertEqual([item.index for item in dictionary.range(0x1400, 0x1600)], [0x1400, 0x1401, 0x15FF])
+		self.assertEqual([item.index for item in dictionary.range(0x1401, 0x1401)], [])
+		self.assertEqual([item.index for item in dictionary.range(0x0000, 0x10000)], [0x1000, 0x1400, 0x1401, 0x15FF, 0x1600, 0x1800, 0x1A00, 0x1A01])
+		self.assertEqual(dictionary.range(0x2000, 0x3000), [])
+		
+		#### Test step: Prefix
+		self.assertEqual([item.index for item in dictionary.prefix(0x1A)], [0x1A00, 0x1A01])
+		self.assertEqual([item.index for item in dictionary.prefix(0x1A01, 4)], [0x1A01])
+		self.assertEqual([item.index for item in dictionary.prefix(0x1, 1)], [0x1000, 0x1400, 0x1401, 0x15FF, 0x1600, 0x1800, 0x1A00, 0x1A01])
+		self.assertEqual(dictionary.prefix(0x14)[0], dictionary[0x1400])
+		for value, digits in [(0x100, 2), (-1, 2), (0x1, 0), (0x1, 5)]:
+			with self.subTest(value = value, digits = digits):
+				with self.assertRaises(ValueError):
+					dictionary.prefix(value, digits)
+		
+		#### Test step: Removed objects
+		del dictionary[0x1401]
+		del dictionary["var" + hex(0x1A00)]
+		self.assertEqual([item.index for item in dictionary.range(0x1400, 0x1600)], [0x1400, 0x15FF])
+		self.assertEqual([item.index for item in dictionary.prefix(0x1A)], [0x1A01])
+		dictionary.add(canopen.objectdictionary.Variable("new", 0x1401, 0, canopen.objectdictionary.UNSIGNED32))
+		self.assertEqual(dictionary.range(0x1401, 0x1402)[0].name, "new")
+	
+	def test_variable(self):
+		dictionary = canopen.ObjectDictionary()
+		var = canopen.objectdictionary.Variable("var", 0x1000, 0, canopen.objectdictionary.UNSIGNED32)
+		dictionary.add(var)
+		rec = canopen.objectdictionary.Record("rec", 0x1400, 0x00)
+		rec.add(canopen.objectdictionary.Variable("first", 0x1400, 0x00, canopen.objectdictionary.UNSIGNED8))
+		dictionary.add(rec)
+		
+		#### Test step: Variables and variables of records
+		self.assertIs(dictionary.variable(0x1000, 0), var)
+		self.assertIs(dictionary.variable(0x1000, 5), var)
+		self.assertIs(dictionary.variable(0x1400, 0x00), rec["first"])
+		for index, subindex in [(0x2000, 0), (0x1400, 0x01)]:
+			with self.subTest(index = index, subindex = subindex):
+				with self.assertRaises(KeyError):
+					dictionary.variable(index, subindex)
+		
+		#### Test step: Variables added to a record of the dictionary
+		rec.add(canopen.objectdictionary.Variable("second", 0x1400, 0x01, canopen.objectdictionary.UNSIGNED32))
+		self.assertIs(dictionary.variable(0x1400, 0x01), rec["second"])
+		
+		#### Test step: Variables removed from a record of the dictionary
+		del rec["second"]
+		with self.assertRaises(KeyError):
+			dictionary.variable(0x1400, 0x01)
+		other = canopen.objectdictionary.Variable("other", 0x1400, 0x01, canopen.objectdictionary.UNSIGNED16)
+		rec.add(other)
+		self.assertIs(dictionary.variable(0x1400, 0x01), other)
+		self.assertIs(dictionary.variable(0x1400, 0x00), rec["first"])
+		
+		#### Test step: Removed objects
+		del dictionary["rec"]
+		del dictionary[0x1000]
+		for index, subindex in [(0x1000, 0), (0x1400, 0x00), (0x1400, 0x01)]:
+			with self.subTest(index = index, subindex = subindex):
+				with self.assertRaises(KeyError):
+					dictionary.variable(index, subindex)
+		dictionary.add(canopen.objectdictionary.Variable("new", 0x1400, 0x00, canopen.objectdictionary.UNSIGNED32))
+		self.assertEqual(dictionary.variable(0x1400, 0x00).name, "new")
+		
+		#### Test step: A mutable dictionary has no table
+		self.assertEqual(dictionary._variables, {})
+	
+	def test_variable_frozen(self):
+		dictionary = canopen.ObjectDictionary()
+		var = canopen.objectdictionary.Variable("var", 0x1000, 0, canopen.objectdictionary.UNSIGNED32)
+		dictionary.add(var)
+		rec = canopen.objectdictionary.Record("rec", 0x1400, 0x00)
+		dictionary.add(rec)
+		rec.add(canopen.objectdictionary.Variable("first", 0x1400, 0x00, canopen.objectdictionary.UNSIGNED8))
+		
+		#### Test step: The table is built by freeze, including the variables added to a record of the dictionary
+		dictionary.freeze()
+		table = dictionary._variables
+		self.assertIn((0x1400, 0x00), table)
+		
+		#### Test step: Lookups do not change the table of a frozen dictionary
+		self.assertIs(dictionary.variable(0x1400, 0x00), rec["first"])
+		self.assertIs(dictionary.variable(0x1000, 5), var)
+		with self.assertRaises(KeyError):
+			dictionary.variable(0x1400, 0x01)
+		self.assertIs(dictionary._variables, table)
+		self.assertEqual(len(table), 2)
 
 
 if __name__ == "__main__":
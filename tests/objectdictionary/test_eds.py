@@ -0,0 +1,129 @@
+import unittest
+import io
+import marshal
+import os
+import shutil
+import tempfile
+import canopen.objectdictionary.eds
+from canopen.objectdictionary import Array, DefStruct, DefType, Domain, Record, Variable, BOOLEAN, INTEGER16, REAL32, UNSIGNED8, UNSIGNED32, VISIBLE_STRING
+
+
+class EDSTest(unittest.TestCase):
+	def setUp(self):
+		self.path = os.path.join(os.path.dirname(__file__), "data", "sample.eds")
+		self.cache = tempfile.mkdtemp()
+	
+	def tearDown(self):
+		shutil.rmtree(self.cache)
+	
+	def check(self, dictionary, node_id):
+		self.assertEqual(len(dictionary), 12)
+		
+		self.assertIsInstance(dictionary[0x0023], DefStruct)
+		self.assertEqual(dictionary[0x0023][0x01].default_value, 7)
+		self.assertIsInstance(dictionary["deftype"], DefType)
+		
+		variable = dictionary["Device type"]
+		self.assertIsInstance(variable, Variable)
+		self.assertEqual(variable.data_type, UNSIGNED32)
+		self.assertEqual(variable.access_type, "ro")
+		self.assertEqual(variable.default_value, 0x00020192)
+		self.assertEqual(variable.pdo_mapping, "no")
+		self.assertEqual(dictionary[0x1001].pdo_mapping, "t")
+		self.assertEqual(dictionary[0x1008].data_type, VISIBLE_STRING)
+		self.assertEqual(dictionary[0x1008].access_type, "const")
+		self.assertEqual(dictionary[0x1008].default_value, "Sample device")
+		
+		self.assertIsInstance(dictionary[0x1010], Array)
+		self.assertEqual(dictionary[0x1010].data_type, UNSIGNED32)
+		self.assertEqual(len(dictionary[0x1010]), 2)
+		
+		self.assertIsInstance(dictionary[0x1018], Record)
+		self.assertEqual(dictionary[0x1018]["Vendor-ID"].default_value, 0x12345678)
+		self.assertEqual(dictionary[0x1018][0x02].default_value, 0)
+		self.assertEqual(dictionary[0x1400][0x01].default_value, 0x200 + node_id)
+		
+		self.assertIsInstance(dictionary[0x1F50], Domain)
+		self.assertEqual(dictionary[0x1F50].access_type, "wo")
+		
+		#### Test step: Compact array
+		self.assertEqual(len(dictionary[0x2000]), 4)
+		self.assertEqual(dictionary[0x2000][0x00].data_type, UNSIGNED8)
+		self.assertEqual(dictionary[0x2000][0x00].default_value, 3)
+		self.assertEqual(dictionary[0x2000][0x03].name, "Output3")
+		self.assertEqual(dictionary[0x2000][0x03].data_type, INTEGER16)
+		self.assertEqual(dictionary[0x2000][0x03].default_value, -1)
+		self.assertEqual(dictionary[0x2000][0x03].access_type, "rw")
+		self.assertEqual(dictionary[0x2000][0x03].pdo_mapping, "r")
+		
+		self.assertEqual(dictionary[0x2100].data_type, REAL32)
+		self.assertEqual(dictionary[0x2100].default_value, 1.5)
+		self.assertEqual(dictionary[0x2101].data_type, BOOLEAN)
+		self.assertEqual(dictionary[0x2101].default_value, True)
+		self.assertEqual(dictionary[0x2101].pdo_mapping, "t")
+	
+	def test_load(self):
+		dictionary = canopen.objectdictionary.eds.load(self.path, 5)
+		self.check(dictionary, 5)
+		
+		#### Test step: File objects in text and binary mode
+		with open(self.path, "r") as f:
+			self.assertEqual(canopen.objectdictionary.eds.load(f, 5), dictionary)
+		with open(self.path, "rb") as f:
+			self.assertEqual(canopen.objectdictionary.eds.load(f, 5), dictionary)
+		
+		#### Test step: Node id of a DCF file
+		with open(self.path, "r") as f:
+			text = f.read()
+		text = text.replace("DefaultValue=0x12345678", "DefaultValue=0\nParameterValue=0x12345678") + "\n[DeviceComissioning]\nNodeID=0x10\n"
+		self.check(canopen.objectdictionary.eds.load(io.StringIO(text)), 0x10)
+		
+		#### Test step: Invalid files
+		with self.assertRaises(ValueError):
+			canopen.objectdictionary.eds.load(io.StringIO("[1000]\nObjectType=0x7\nDataType=0x7\nAccessType=xx\n"))
+		with self.assertRaises(ValueError):
+			canopen.objectdictionary.eds.load(io.StringIO("[1000]\nObjectType=0x3\n"))
+		
+		#### Test step: Only sections named like 1000 and 1000sub1 are objects and sub-objects
+		record = "[1000]\nParameterName=Rec\nObjectType=0x9\n[1000sub0]\nParameterName=Highest\nDataType=0x5\n"
+		dictionary = canopen.objectdictionary.eds.load(io.StringIO(record + "[01000sub0]\nParameterName=Other\n[1000sub]\n[1000sub1x]\n[M1SubExt1000]\n[10000]\n"))
+		self.assertEqual(len(dictionary), 1)
+		self.assertEqual([variable.name for variable in dictionary[0x1000]], ["Highest"])
+		
+		#### Test step: Duplicates are named in the message
+		with self.assertRaisesRegex(ValueError, "\"Highest\" at subindex 0x01 of index 0x1000"):
+			canopen.objectdictionary.eds.load(io.StringIO(record + "[1000sub1]\nParameterName=Highest\nDataType=0x5\n"))
+		with self.assertRaisesRegex(ValueError, "\"Rec\" at index 0x2000"):
+			canopen.objectdictionary.eds.load(io.StringIO(record + "[2000]\nParameterName=Rec\n"))
+	
+	def test_cache(self):
+		dictionary = canopen.objectdictionary.eds.load(self.path, 5, self.cache)
+		self.assertEqual(len(os.listdir(self.cache)), 1)
+		self.check(dictionary, 5)
+		
+		#### Test step: Warm start from the cache
+		cached = canopen.objectdictionary.eds.load(self.path, 5, self.cache)
+		self.check(cached, 5)
+		self.assertEqual(cached, dictionary)
+		
+		#### Test step: Another node id is another entry
+		self.check(canopen.objectdictionary.eds.load(self.path, 6, self.cache), 6)
+		self.assertEqual(len(os.listdir(self.cache)), 2)
+		
+		#### Test step: A corrupt cache file is replaced
+		for name in os.listdir(self.cache):
+			with open(os.path.join(self.cache, name), "wb") as f:
+				f.write(b"\x00")
+		self.check(canopen.objectdictionary.eds.load(self.path, 5, self.cache), 5)
+		self.check(canopen.objectdictionary.eds.load(self.path, 5, self.cache), 5)
+		
+		#### Test step: A cache file with a table of another structure is replaced
+		for name in os.listdir(self.cache):
+			with open(os.path.join(self.cache, name), "wb") as f:
+				f.write(marshal.dumps([(9, "Record")]))
+		self.check(canopen.objectdictionary.eds.load(self.path, 5, self.cache), 5)
+		self.check(canopen.objectdictionary.eds.load(self.path, 5, self.cache), 5)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,185 @@
+import unittest
+import threading
+import canopen
+from canopen.objectdictionary import ObjectDictionary, Overlay, Variable, Record, UNSIGNED8, UNSIGNED32
+
+
+class OverlayTestCase(unittest.TestCase):
+	def create_base(self):
+		base = ObjectDictionary()
+		base.add(Variable("var", 0x2000, 0x00, UNSIGNED32))
+		base.add(Record("rec", 0x3000, 0x00))
+		base["rec"].add(Variable("first", 0x3000, 0x00, UNSIGNED8))
+		base["rec"].add(Variable("second", 0x3000, 0x01, UNSIGNED32))
+		return base
+	
+	def test_freeze(self):
+		base = self.create_base()
+		with self.assertRaises(TypeError):
+			hash(base)
+		with self.assertRaises(TypeError):
+			hash(base["var"])
+		
+		base.freeze()
+		self.assertTrue(base.frozen)
+		self.assertTrue(base["rec"].frozen)
+		self.assertTrue(base["rec"]["second"].frozen)
+		
+		#### Test step: Read-only
+		with self.assertRaises(TypeError):
+			base.add(Variable("x", 0x2001, 0x00, UNSIGNED32))
+		with self.assertRaises(TypeError):
+			del base["var"]
+		with self.assertRaises(TypeError):
+			base["rec"].add(Variable("x", 0x3000, 0x02, UNSIGNED32))
+		with self.assertRaises(TypeError):
+			del base["rec"]["first"]
+		with self.assertRaises(AttributeError):
+			base["var"].default_value = 5
+		with self.assertRaises(AttributeError):
+			base["var"].access_type = "ro"
+		with self.assertRaises(AttributeError):
+			base["rec"].description = "x"
+		
+		#### Test step: Hashable, equal dictionaries have equal hashes
+		other = self.create_base()
+		other.freeze()
+		self.assertEqual(base, other)
+		self.assertEqual(hash(base), hash(other))
+		self.assertEqual(len({base, other}), 1)
+	
+	def test_overlay(self):
+		base = self.create_base()
+		with self.assertRaises(TypeError):
+			Overlay(None)
+		with self.assertRaises(ValueError):
+			Overlay(base)
+		base.freeze()
+		
+		examinee = Overlay(base)
+		self.assertIs(examinee.base, base)
+		self.assertEqual(examinee, base)
+		self.assertEqual(base, examinee)
+		self.assertEqual(len(examinee), 2)
+		self.assertIs(examinee["var"], base["var"])
+		
+		#### Test step: Modified default values are copied into the overlay
+		variable = examinee.modify(0x2000)
+		variable.default_value = 5
+		self.assertIs(examinee[0x2000], variable)
+		self.assertEqual(base[0x2000].default_value, 0)
+		self.assertEqual(len(examinee), 2)
+		self.assertNotEqual(examinee, base)
+		self.assertIs(examinee.modify(0x2000), variable)
+		
+		variable = examinee.modify(0x3000, 0x01)
+		variable.default_value = 7
+		self.assertEqual(examinee["rec"]["second"].default_value, 7)
+		self.assertIs(examinee["rec"]["first"], base["rec"]["first"])
+		self.assertEqual(base["rec"]["second"].default_value, 0)
+		with self.assertRaises(KeyError):
+			examinee.modify(0x4000)
+		
+		#### Test step: Added and removed objects
+		examinee.add(Variable("added", 0x2001, 0x00, UNSIGNED32))
+		self.assertEqual(len(examinee), 3)
+		self.assertNotIn(0x2001, base)
+		with self.assertRaises(ValueError):
+			examinee.add(Variable("var", 0x2002, 0x00, UNSIGNED32))
+		with self.assertRaises(TypeError):
+			examinee.add(None)
+		
+		del examinee["rec"]
+		self.assertNotIn(0x3000, examinee)
+		self.assertNotIn("rec", examinee)
+		self.assertIn(0x3000, base)
+		self.assertEqual(len(examinee), 2)
+		self.assertEqual(sorted(item.index for item in examinee), [0x2000, 0x2001])
+		
+		examinee.add(Record("rec", 0x3000, 0x00))
+		self.assertEqual(len(examinee["rec"]), 0)
+		self.assertEqual(len(examinee), 3)
+		
+		#### Test step: Frozen overlay
+		examinee.freeze()
+		hash(examinee)
+		with self.assertRaises(TypeError):
+			examinee.modify(0x2000)
+		with self.assertRaises(TypeError):
+			del examinee["var"]
+	
+	def test_range(self):
+		base = self.create_base()
+		base.add(Variable("other", 0x2100, 0x00, UNSIGNED32))
+		base.freeze()
+		examinee = Overlay(base)
+		examinee.add(Variable("new", 0x2050, 0x00, UNSIGNED32))
+		del examinee["other"]
+		examinee.modify(0x2000).default_value = 5
+		
+		#### Test step: Objects of the overlay and the visible objects of the base in ascending order
+		self.assertEqual([item.name for item in examinee.range(0x2000, 0x4000)], ["var", "new", "rec"])
+		self.assertEqual(examinee.range(0x2000, 0x2001)[0].default_value, 5)
+		self.assertIs(examinee.prefix(0x30)[0], base["rec"])
+		self.assertEqual(examinee.prefix(0x21), [])
+		self.assertEqual([item.name for item in base.range(0x2000, 0x4000)], ["var", "other", "rec"])
+		
+		del examinee["new"]
+		self.assertEqual([item.name for item in examinee.range(0x2000, 0x4000)], ["var", "rec"])
+	
+	def test_variable(self):
+		base = self.create_base()
+		base.freeze()
+		table = dict(base._variables)
+		examinee = Overlay(base)
+		self.assertIs(examinee.variable(0x3000, 0x01), base["rec"]["second"])
+		
+		#### Test step: Modified variables
+		modified = examinee.modify(0x3000, 0x01)
+		self.assertIs(examinee.variable(0x3000, 0x01), modified)
+		self.assertIs(base.variable(0x3000, 0x01), base["rec"]["second"])
+		self.assertIs(examinee.variable(0x2000, 0x00), base["var"])
+		modified = examinee.modify(0x2000)
+		self.assertIs(examinee.variable(0x2000, 0x00), modified)
+		
+		#### Test step: Removed and added objects
+		del examinee["rec"]
+		with self.assertRaises(KeyError):
+			examinee.variable(0x3000, 0x01)
+		examinee.add(Variable("new", 0x3000, 0x00, UNSIGNED8))
+		self.assertIs(examinee.variable(0x3000, 0x00), examinee["new"])
+		self.assertIs(base.variable(0x3000, 0x00), base["rec"]["first"])
+		
+		#### Test step: The table of the shared base is not changed
+		self.assertEqual(base._variables, table)
+		
+		#### Test step: A frozen overlay has a table of its own and the visible objects of the base
+		examinee.freeze()
+		self.assertIs(examinee.variable(0x3000, 0x00), examinee["new"])
+		self.assertIs(examinee.variable(0x2000, 0x00), modified)
+		self.assertEqual(len(examinee._variables), 2)
+	
+	def test_nodes(self):
+		base = self.create_base()
+		base.freeze()
+		
+		#### Test step: Many nodes share one base
+		nodes = []
+		for node_id in range(1, 101):
+			dictionary = Overlay(base)
+			dictionary.modify(0x2000).default_value = node_id
+			nodes.append(canopen.LocalNode("n" + str(node_id), node_id, dictionary))
+		
+		results = []
+		def read(node):
+			results.append(node.get_data(0x2000, 0x00) == node.id and node.get_data(0x3000, 0x01) == 0)
+		threads = [threading.Thread(target = read, args = (node,)) for node in nodes]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		self.assertEqual(results, [True] * 100)
+
+
+if __name__ == "__main__":
+	unittest.main()
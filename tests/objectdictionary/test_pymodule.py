@@ -0,0 +1,71 @@
+import unittest
+import importlib
+import io
+import math
+import os
+import shutil
+import sys
+import tempfile
+import canopen.objectdictionary.eds
+import canopen.objectdictionary.pymodule
+from canopen.objectdictionary import ObjectDictionary, Record, Variable, REAL64, UNSIGNED8
+
+
+class PyModuleTest(unittest.TestCase):
+	def setUp(self):
+		self.path = os.path.join(os.path.dirname(__file__), "data", "sample.eds")
+		self.directory = tempfile.mkdtemp()
+		sys.path.insert(0, self.directory)
+	
+	def tearDown(self):
+		sys.path.remove(self.directory)
+		for name in os.listdir(self.directory):
+			sys.modules.pop(os.path.splitext(name)[0], None)
+		shutil.rmtree(self.directory)
+	
+	def generate(self, dictionary):
+		# A new name for each module, thus no cached module or bytecode is used
+		name = "generated_od_" + str(len(os.listdir(self.directory)))
+		with open(os.path.join(self.directory, name + ".py"), "w") as f:
+			canopen.objectdictionary.pymodule.dump(dictionary, f, "sample.eds")
+		importlib.invalidate_caches()
+		return importlib.import_module(name)
+	
+	def test_dump(self):
+		dictionary = canopen.objectdictionary.eds.load(self.path, 5)
+		module = self.generate(dictionary)
+		self.assertEqual(module.load(), dictionary)
+		self.assertEqual(module.load()[0x1400][0x01].default_value, 0x205)
+		self.assertEqual(module.load()[0x2101].pdo_mapping, "t")
+		
+		#### Test step: Each call returns a new dictionary
+		self.assertIsNot(module.load(), module.load())
+		module.load()[0x1000].default_value = 1
+		self.assertEqual(module.load()[0x1000].default_value, 0x00020192)
+		
+		#### Test step: The table is a constant
+		self.assertIsInstance(module._table, tuple)
+		self.assertIsInstance(module._table[-1], tuple)
+		
+		#### Test step: Special values
+		dictionary = ObjectDictionary()
+		record = Record("Record", 0x2000, UNSIGNED8, "A \"quoted\"\ndescription")
+		record.add(Variable("Value", 0x2000, 0x01, REAL64))
+		record[0x01].default_value = float("inf")
+		dictionary.add(record)
+		dictionary.add(Variable("NaN", 0x2001, 0x00, REAL64))
+		dictionary[0x2001].default_value = float("nan")
+		loaded = self.generate(dictionary).load()
+		self.assertEqual(loaded[0x2000], record)
+		self.assertTrue(math.isnan(loaded[0x2001].default_value))
+		
+		#### Test step: Empty dictionary
+		self.assertEqual(len(self.generate(ObjectDictionary()).load()), 0)
+	
+	def test_from_table(self):
+		with self.assertRaises(ValueError):
+			canopen.objectdictionary.pymodule.from_table((), canopen.objectdictionary.eds.CACHE_VERSION + 1)
+
+
+if __name__ == "__main__":
+	unittest.main()
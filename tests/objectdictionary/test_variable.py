@@ -157,6 +157,20 @@ class VariableTestCase(unittest.TestCase):
 		self.assertFalse(a == b)
 		self.assertEqual(a == b, b == a)
 	
+	def test_compact(self):
+		a = Variable("".join(["v", "ar"]), 100, 0, REAL32, "".join(["r", "w"]), "".join(["de", "sc"]))
+		b = Variable("".join(["va", "r"]), 101, 0, REAL32, "".join(["r", "w"]), "".join(["des", "c"]))
+		
+		#### Test step: No instance dictionary
+		with self.assertRaises(AttributeError):
+			a.x = 1
+		
+		#### Test step: Strings and default values are shared
+		self.assertIs(a.name, b.name)
+		self.assertIs(a.access_type, b.access_type)
+		self.assertIs(a.description, b.description)
+		self.assertIs(a.default_value, b.default_value)
+	
 	def test_boolean(self):
 		variable = Variable("BOOLEAN", 100, 0, BOOLEAN)
 		
@@ -554,13 +568,13 @@ class VariableTestCase(unittest.TestCase):
 		self.assertEqual(variable.size, 64)
 		
 		with self.subTest("encode"):
-			test_data = [(0.0, b"\x00\x00\x00\x00\x00\x00\x00\x00")]
+			test_data = [(0.0, b"\x00\x00\x00\x00\x00\x00\x00\x00"), (1.5, b"\x00\x00\x00\x00\x00\x00\xF8\x3F")]
 			for x, y in test_data:
 				with self.subTest("x=" + str(x) + ",y=" + str(y)):
 					self.assertEqual(variable.encode(x), y)
 		
 		with self.subTest("decode"):
-			test_data = [(b"\x00\x00\x00\x00\x00\x00\x00\x00", 0.0)]
+			test_data = [(b"\x00\x00\x00\x00\x00\x00\x00\x00", 0.0), (b"\x00\x00\x00\x00\x00\x00\xF8\x3F", 1.5)]
 			for x, y in test_data:
 				with self.subTest("x=" + str(x) + ",y=" + str(y)):
 					self.assertEqual(variable.decode(x), y)
@@ -0,0 +1,103 @@
+import unittest
+import io
+import os
+import tracemalloc
+import canopen.objectdictionary.eds
+import canopen.objectdictionary.xdd
+from canopen.objectdictionary import Record, Variable
+
+
+def _generate(count):
+	""" Returns a XDD file with ``count`` records of three sub-objects each. """
+	lines = ["<?xml version=\"1.0\" encoding=\"utf-8\"?>",
+		"<ISO15745ProfileContainer xmlns=\"http://www.canopen.org/xml/1.0\"><ISO15745Profile><ProfileBody><ApplicationLayers><CANopenObjectList>"]
+	for i in range(count):
+		lines.append("<CANopenObject index=\"{0:04X}\" name=\"Object {0}\" objectType=\"9\" subNumber=\"3\">".format(0x2000 + i))
+		lines.append("<CANopenSubObject subIndex=\"00\" name=\"Highest sub-index supported\" objectType=\"7\" dataType=\"0005\" accessType=\"ro\" defaultValue=\"2\"/>")
+		lines.append("<CANopenSubObject subIndex=\"01\" name=\"Value\" objectType=\"7\" dataType=\"0007\" accessType=\"rw\" defaultValue=\"{0}\" PDOmapping=\"optional\"/>".format(i))
+		lines.append("<CANopenSubObject subIndex=\"02\" name=\"Description\" objectType=\"7\" dataType=\"0009\" accessType=\"ro\" defaultValue=\"{0}\"/>".format("x" * 200))
+		lines.append("</CANopenObject>")
+	lines.append("</CANopenObjectList></ApplicationLayers></ProfileBody></ISO15745Profile></ISO15745ProfileContainer>")
+	return "\n".join(lines).encode("utf-8")
+
+
+class XDDTest(unittest.TestCase):
+	def setUp(self):
+		directory = os.path.join(os.path.dirname(__file__), "data")
+		self.path = os.path.join(directory, "sample.xdd")
+		self.eds_path = os.path.join(directory, "sample.eds")
+	
+	def test_load(self):
+		#### Test step: The same objects as of the EDS file
+		dictionary = canopen.objectdictionary.xdd.load(self.path, 5)
+		self.assertEqual(len(dictionary), 12)
+		self.assertEqual(dictionary, canopen.objectdictionary.eds.load(self.eds_path, 5))
+		self.assertEqual(dictionary[0x1400][0x01].default_value, 0x205)
+		self.assertEqual(dictionary[0x1001].pdo_mapping, "t")
+		self.assertEqual(dictionary[0x2000][0x03].pdo_mapping, "r")
+		self.assertEqual(dictionary[0x2101].pdo_mapping, "t")
+		self.assertEqual(dictionary[0x1018][0x02].default_value, 0)
+		
+		#### Test step: File object
+		with open(self.path, "rb") as f:
+			self.assertEqual(canopen.objectdictionary.xdd.load(f, 5), dictionary)
+		
+		#### Test step: Node id and actual values of a XDC file
+		with open(self.path, "r") as f:
+			text = f.read()
+		text = text.replace("defaultValue=\"0x12345678\"", "defaultValue=\"0\" actualValue=\"0x12345678\"")
+		text = text.replace("<CANopenMasterFeatures/>", "<CANopenMasterFeatures/>\n<deviceCommissioning nodeID=\"16\" nodeName=\"Sample\" actualBaudRate=\"250 Kbps\"/>")
+		dictionary = canopen.objectdictionary.xdd.load(io.BytesIO(text.encode("utf-8")))
+		self.assertEqual(dictionary, canopen.objectdictionary.eds.load(self.eds_path, 0x10))
+		self.assertEqual(dictionary[0x1400][0x01].default_value, 0x210)
+		self.assertEqual(canopen.objectdictionary.xdd.load(io.BytesIO(text.encode("utf-8")), 5)[0x1400][0x01].default_value, 0x205)
+		
+		#### Test step: A value with $NODEID, which can not be represented, keeps the default value of the data type
+		pending = text.replace("dataType=\"0001\" accessType=\"rwr\" defaultValue=\"1\"", "dataType=\"000C\" accessType=\"rwr\" defaultValue=\"$NODEID\"")
+		variable = canopen.objectdictionary.xdd.load(io.BytesIO(pending.encode("utf-8")))[0x2101]
+		self.assertEqual(variable.default_value, Variable("x", 0x2101, 0x00, variable.data_type).default_value)
+		
+		#### Test step: Objects take the attributes, which they do not define, from the referenced parameter
+		referenced = text.replace("dataType=\"0008\" accessType=\"rw\" defaultValue=\"1.5\" uniqueIDRef", "uniqueIDRef")
+		referenced = referenced.replace("<REAL/>", "<REAL/>\n<defaultValue value=\"1.5\"/>")
+		self.assertEqual(canopen.objectdictionary.xdd.load(io.BytesIO(referenced.encode("utf-8"))), dictionary)
+		referenced = referenced.replace("access=\"readWrite\"", "access=\"read\"").replace("<defaultValue value=\"1.5\"/>", "<defaultValue value=\"1.5\"/><actualValue value=\"2.5\"/>")
+		variable = canopen.objectdictionary.xdd.load(io.BytesIO(referenced.encode("utf-8")))[0x2100]
+		self.assertEqual(variable.data_type, canopen.objectdictionary.REAL32)
+		self.assertEqual(variable.access_type, "ro")
+		self.assertEqual(variable.default_value, 2.5)
+		
+		#### Test step: Invalid files
+		for old, new in [("index=\"1000\"", "index=\"xyz\""), ("objectType=\"5\"", "objectType=\"3\""), ("accessType=\"const\"", "accessType=\"abc\""), ("subIndex=\"02\"", ""),
+			("uniqueIDRef=\"UID_PARAM_2100\"", "uniqueIDRef=\"UID_PARAM_2101\""), ("access=\"readWrite\"", "access=\"abc\"")]:
+			with self.assertRaises(ValueError):
+				canopen.objectdictionary.xdd.load(io.BytesIO(text.replace(old, new, 1).encode("utf-8")))
+	
+	def test_generated(self):
+		dictionary = canopen.objectdictionary.xdd.load(io.BytesIO(_generate(10)))
+		self.assertEqual(len(dictionary), 10)
+		self.assertIsInstance(dictionary[0x2009], Record)
+		self.assertIsInstance(dictionary[0x2009]["Value"], Variable)
+		self.assertEqual(dictionary[0x2009]["Value"].default_value, 9)
+		self.assertEqual(dictionary[0x2009]["Value"].pdo_mapping, "tr")
+	
+	def test_memory(self):
+		""" The memory for parsing, beyond the resulting dictionary, does not grow with the size of the file. """
+		def overhead(count):
+			data = io.BytesIO(_generate(count))
+			tracemalloc.start()
+			try:
+				dictionary = canopen.objectdictionary.xdd.load(data)
+				current, peak = tracemalloc.get_traced_memory()
+			finally:
+				tracemalloc.stop()
+			self.assertEqual(len(dictionary), count)
+			return peak - current
+		
+		small = overhead(500)
+		large = overhead(5000)
+		self.assertLess(large, small * 2 + 100000)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import asyncio
+import threading
+import canopen.util
+
+
+class AsyncBatcherTest(unittest.TestCase):
+	def setUp(self):
+		self.loop = asyncio.new_event_loop()
+		asyncio.set_event_loop(self.loop)
+	
+	def tearDown(self):
+		asyncio.set_event_loop(None)
+		self.loop.close()
+	
+	def test_submit(self):
+		examinee = canopen.util.AsyncBatcher.for_loop(self.loop)
+		self.assertIs(canopen.util.AsyncBatcher.for_loop(self.loop), examinee)
+		self.assertIs(examinee.loop, self.loop)
+		self.assertEqual(examinee.pending, 0)
+		
+		calls = []
+		done = []
+		async def function(value):
+			calls.append(value)
+			if value < 0:
+				raise ValueError()
+		
+		async def run():
+			#### Test step: A burst from another thread needs one wake-up
+			wakeups = examinee.wakeups
+			thread = threading.Thread(target = lambda: [examinee.submit(function, (i,)) for i in range(100)])
+			thread.start()
+			thread.join()
+			self.assertEqual(examinee.wakeups, wakeups + 1)
+			self.assertEqual(examinee.pending, 100)
+			await asyncio.sleep(0.01)
+			self.assertEqual(calls, list(range(100)))
+			self.assertEqual(examinee.pending, 0)
+			
+			#### Test step: The done callback gets the task
+			examinee.submit(function, (-1,), done.append)
+			await asyncio.sleep(0.01)
+			self.assertEqual(len(done), 1)
+			self.assertIsInstance(done[0].exception(), ValueError)
+			
+			#### Test step: The done callback gets an exception raised by the call of a function, which returns no coroutine
+			def failing(value):
+				raise KeyError()
+			examinee.submit(failing, (1,), done.append)
+			await asyncio.sleep(0.01)
+			self.assertEqual(len(done), 2)
+			self.assertIsInstance(done[1].exception(), KeyError)
+			
+			#### Test step: Without done callback, the exception handler of the event loop gets it
+			contexts = []
+			self.loop.set_exception_handler(lambda loop, context: contexts.append(context))
+			examinee.submit(failing, (1,))
+			examinee.submit(function, (5,))
+			await asyncio.sleep(0.01)
+			self.assertEqual(len(contexts), 1)
+			self.assertIsInstance(contexts[0]["exception"], KeyError)
+			self.assertEqual(calls[-1], 5)
+		
+		self.loop.run_until_complete(run())
+	
+	def test_closed(self):
+		loop = asyncio.new_event_loop()
+		examinee = canopen.util.AsyncBatcher(loop)
+		loop.close()
+		
+		#### Test step: Calls for a closed event loop are dropped
+		examinee.submit(asyncio.sleep, (0,))
+		self.assertEqual(examinee.pending, 0)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import asyncio
+import threading
+import canopen.util
+
+
+class AsyncConditionTest(unittest.TestCase):
+	def setUp(self):
+		self.loop = asyncio.new_event_loop()
+		asyncio.set_event_loop(self.loop)
+	
+	def tearDown(self):
+		asyncio.set_event_loop(None)
+		self.loop.close()
+	
+	def test_wait(self):
+		examinee = canopen.util.AsyncCondition()
+		
+		async def run():
+			#### Test step: Timeout without notification
+			self.assertFalse(await examinee.wait(0.05))
+			
+			#### Test step: Notification from the event loop
+			waiter = asyncio.ensure_future(examinee.wait(1))
+			await asyncio.sleep(0.01)
+			examinee.notify_all()
+			self.assertTrue(await waiter)
+			
+			#### Test step: Notification from another thread
+			waiter = asyncio.ensure_future(examinee.wait())
+			await asyncio.sleep(0.01)
+			threading.Thread(target = examinee.notify_all).start()
+			self.assertTrue(await asyncio.wait_for(waiter, 1))
+			
+			#### Test step: All waiters share one future
+			self.assertIs(examinee.waiter(), examinee.waiter())
+			
+			#### Test step: A registered waiter gets a notification which occurs before awaiting it
+			waiter = examinee.waiter()
+			examinee.notify_all()
+			self.assertTrue(await examinee.wait(1, waiter))
+			
+			#### Test step: Cancelling one waiter does not affect the others
+			waiter1 = asyncio.ensure_future(examinee.wait())
+			waiter2 = asyncio.ensure_future(examinee.wait())
+			await asyncio.sleep(0.01)
+			waiter1.cancel()
+			await asyncio.sleep(0.01)
+			examinee.notify_all()
+			self.assertTrue(await asyncio.wait_for(waiter2, 1))
+		
+		self.loop.run_until_complete(run())
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import Mock
+import threading
+import time
+import canopen.util
+
+
+class SchedulerTest(unittest.TestCase):
+	def test_schedule(self):
+		examinee = canopen.util.Scheduler()
+		self.assertEqual(examinee.pending, 0)
+		
+		calls = []
+		start_time = time.perf_counter()
+		
+		#### Test step: Deadlines are called in order, independent of the order of scheduling
+		examinee.schedule(start_time + 0.06, calls.append, 3)
+		examinee.schedule(start_time + 0.02, calls.append, 1)
+		examinee.call_later(0.04, calls.append, 2)
+		self.assertEqual(examinee.pending, 3)
+		
+		time.sleep(0.1)
+		self.assertEqual(calls, [1, 2, 3])
+		self.assertEqual(examinee.pending, 0)
+		
+		#### Test step: Cancel
+		m = Mock()
+		entry = examinee.call_later(0.02, m)
+		entry.cancel()
+		self.assertEqual(examinee.pending, 0)
+		entry.cancel()
+		time.sleep(0.05)
+		m.assert_not_called()
+		
+		#### Test step: Exceptions do not stop the scheduler
+		examinee.call_later(0.01, Mock(side_effect = ValueError()))
+		examinee.call_later(0.02, m, 10)
+		time.sleep(0.05)
+		m.assert_called_once_with(10)
+		
+		examinee.stop()
+		with self.assertRaises(RuntimeError):
+			examinee.call_later(0.01, m)
+	
+	def test_many(self):
+		examinee = canopen.util.Scheduler()
+		m = Mock()
+		
+		#### Test step: Many cancelled deadlines are dropped
+		entries = [examinee.call_later(10, m) for i in range(1000)]
+		for entry in entries[:900]:
+			entry.cancel()
+		self.assertEqual(examinee.pending, 100)
+		self.assertLess(len(examinee._heap), 1000)
+		
+		for entry in entries[900:]:
+			entry.cancel()
+		self.assertEqual(examinee.pending, 0)
+		
+		examinee.stop()
+	
+	def test_workers(self):
+		self.assertEqual(canopen.util.Scheduler().workers, None)
+		self.assertNotEqual(canopen.util.Scheduler.default().workers, None)
+		
+		examinee = canopen.util.Scheduler(workers = True)
+		self.assertEqual(examinee.workers, 0)
+		calls = []
+		start_time = time.perf_counter()
+		
+		#### Test step: A slow function does not delay the other deadlines
+		examinee.schedule(start_time + 0.01, time.sleep, 0.3)
+		examinee.schedule(start_time + 0.05, lambda: calls.append(time.perf_counter() - start_time))
+		time.sleep(0.1)
+		self.assertEqual(len(calls), 1)
+		self.assertLess(calls[0], 0.09)
+		
+		#### Test step: Exceptions do not stop the workers
+		m = Mock()
+		examinee.call_later(0.01, Mock(side_effect = ValueError()))
+		examinee.call_later(0.02, m, 10)
+		time.sleep(0.05)
+		m.assert_called_once_with(10)
+		
+		#### Test step: Slow functions do not hold back further calls and idle workers end
+		examinee.IDLE_TIMEOUT = 0.1
+		calls = []
+		start_time = time.perf_counter()
+		for i in range(20):
+			examinee.schedule(start_time + 0.01, time.sleep, 0.2)
+		examinee.schedule(start_time + 0.02, lambda: calls.append(time.perf_counter() - start_time))
+		time.sleep(0.06)
+		self.assertEqual(len(calls), 1)
+		self.assertLess(calls[0], 0.05)
+		self.assertGreaterEqual(examinee.workers, 20)
+		time.sleep(0.4)
+		self.assertEqual(examinee.workers, 0)
+		
+		examinee.stop()
+	
+	def test_timers_share_thread(self):
+		threads = threading.active_count()
+		m = Mock()
+		
+		timers = [canopen.util.Timer(m) for i in range(200)]
+		for timer in timers:
+			timer.start(0.05)
+		self.assertLessEqual(threading.active_count(), threads + 1)
+		
+		time.sleep(0.15)
+		self.assertEqual(m.call_count, 200)
+		
+		for timer in timers:
+			timer.stop()
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import Mock
+import threading
 import time
 import canopen.util
 
@@ -150,7 +151,7 @@ class TimerTest(unittest.TestCase):
 		m.reset_mock()
 		with self.subTest("Start, start, cancel -> no call"):
 			self.assertEqual(examinee.start(0.1), True)
-			self.assertEqual(examinee.start(0.1), True)
+			self.assertEqual(examinee.start(0.1), False)
 			start_time = time.time()
 			
 			time.sleep(0.03 + start_time - time.time())
@@ -311,6 +312,215 @@ class TimerTest(unittest.TestCase):
 		del self.examinee
 		del m
 	
+	def test_restart(self):
+		m = Mock()
+		examinee = canopen.util.Timer(m)
+		
+		#### Test step: Restart postpones the pending timer cycle
+		start_time = time.time()
+		self.assertEqual(examinee.restart(0.1), True)
+		for i in range(5):
+			time.sleep(0.05)
+			self.assertEqual(examinee.restart(0.1), True)
+		m.assert_not_called()
+		
+		time.sleep(0.15)
+		m.assert_called_once()
+		self.assertGreater(time.time() - start_time, 0.35)
+		
+		with self.assertRaises(ValueError):
+			examinee.restart(0)
+		
+		#### Test step: Restart of a stopped timer
+		examinee.stop()
+		self.assertFalse(examinee.is_alive())
+		self.assertEqual(examinee.restart(0.1), False)
+		self.assertEqual(examinee.start(0.1), False)
+	
+	def test_statistics(self):
+		m = Mock()
+		examinee = canopen.util.Timer(m)
+		
+		statistics = examinee.statistics
+		self.assertEqual(statistics["count"], 0)
+		self.assertEqual(statistics["mean"], None)
+		self.assertEqual(statistics["p99"], None)
+		self.assertEqual(statistics["missed"], 0)
+		
+		examinee.start(0.01, True)
+		time.sleep(0.105)
+		examinee.cancel()
+		
+		statistics = examinee.statistics
+		self.assertEqual(statistics["count"], m.call_count)
+		self.assertGreaterEqual(statistics["count"], 9)
+		self.assertLessEqual(statistics["min"], statistics["mean"])
+		self.assertLessEqual(statistics["mean"], statistics["max"])
+		self.assertLessEqual(statistics["p99"], statistics["max"])
+		self.assertGreaterEqual(statistics["min"], 0)
+		
+		examinee.reset_statistics()
+		self.assertEqual(examinee.statistics["count"], 0)
+		examinee.stop()
+	
+	def test_missed(self):
+		#### Test step: A callback which takes longer than two periods
+		calls = []
+		def callback():
+			calls.append(time.perf_counter())
+			if len(calls) == 1:
+				time.sleep(0.25)
+		examinee = canopen.util.Timer(callback)
+		examinee.start(0.1, True)
+		time.sleep(0.45)
+		examinee.stop()
+		
+		# Calls at 0.1 (until 0.35), 0.35 (late deadline 0.2), 0.4. The deadline 0.3 is missed.
+		self.assertEqual(len(calls), 3)
+		self.assertEqual(examinee.statistics["missed"], 1)
+	
+	def test_slow_callback(self):
+		#### Test step: A slow callback does not delay other timers
+		calls = []
+		slow = canopen.util.Timer(time.sleep, [0.5])
+		fast = canopen.util.Timer(lambda: calls.append(time.perf_counter()))
+		start_time = time.perf_counter()
+		slow.start(0.01)
+		fast.start(0.05)
+		time.sleep(0.1)
+		self.assertEqual(len(calls), 1)
+		self.assertLess(calls[0] - start_time, 0.09)
+		fast.stop()
+		
+		#### Test step: Join waits for the running call of a stopped timer
+		slow.stop()
+		slow.join(0.01)
+		self.assertLess(time.perf_counter() - start_time, 0.4)
+		slow.join()
+		self.assertGreaterEqual(time.perf_counter() - start_time, 0.5)
+	
+	def test_blocking_callbacks(self):
+		#### Test step: Many blocking callbacks do not delay an independent timer
+		calls = []
+		blocking = [canopen.util.Timer(time.sleep, [0.5]) for i in range(32)]
+		independent = canopen.util.Timer(lambda: calls.append(time.perf_counter()))
+		start_time = time.perf_counter()
+		for timer in blocking:
+			timer.start(0.01, True)
+		independent.start(0.05)
+		time.sleep(0.1)
+		self.assertEqual(len(calls), 1)
+		self.assertLess(calls[0] - start_time, 0.09)
+		
+		#### Test step: Deadlines, which expire during a running call, do not occupy further workers
+		workers = canopen.util.Scheduler.default().workers
+		time.sleep(0.2)
+		self.assertLessEqual(canopen.util.Scheduler.default().workers, workers)
+		
+		for timer in blocking:
+			timer.stop()
+		independent.stop()
+		for timer in blocking:
+			timer.join()
+		
+		#### Test step: A deadline, which expired during the running call, is passed to it
+		calls = []
+		def callback():
+			calls.append(time.perf_counter())
+			if len(calls) == 1:
+				examinee.restart(0.01)
+				time.sleep(0.1)
+		examinee = canopen.util.Timer(callback)
+		start_time = time.perf_counter()
+		examinee.start(0.01)
+		time.sleep(0.2)
+		self.assertEqual(len(calls), 2)
+		self.assertGreaterEqual(calls[1] - start_time, 0.11)
+		self.assertEqual(examinee.start(0.01), True)
+		examinee.stop()
+	
+	def test_thread_compatibility(self):
+		examinee = canopen.util.Timer(Mock())
+		self.assertTrue(examinee.daemon)
+		with self.assertRaises(RuntimeError):
+			examinee.daemon = False
+		
+		#### Test step: Join returns after the timeout while the timer is not stopped
+		start_time = time.perf_counter()
+		examinee.join(0.02)
+		self.assertGreaterEqual(time.perf_counter() - start_time, 0.02)
+		self.assertTrue(examinee.is_alive())
+		
+		examinee.stop()
+		examinee.join()
+		self.assertFalse(examinee.is_alive())
+	
+	def test_error_handler(self):
+		exception = ValueError()
+		m = Mock(side_effect = exception)
+		examinee = canopen.util.Timer(m)
+		self.assertEqual(examinee.error_handler, None)
+		with self.assertRaises(TypeError):
+			examinee.error_handler = 1
+		
+		#### Test step: Without error handler, the exception is dropped
+		examinee.start(0.01, True)
+		time.sleep(0.035)
+		self.assertGreaterEqual(m.call_count, 2)
+		examinee.cancel()
+		
+		#### Test step: The exception is passed to the error handler, also if the error handler raises an exception
+		handler = Mock(side_effect = KeyError())
+		examinee.error_handler = handler
+		examinee.start(0.01)
+		time.sleep(0.03)
+		handler.assert_called_once_with(examinee, exception)
+		
+		examinee.stop()
+	
+	def test_high_resolution(self):
+		with self.assertRaises(ValueError):
+			canopen.util.Timer(Mock(), spin = -1)
+		with self.assertRaises(ValueError):
+			canopen.util.Timer(Mock(), scheduler = canopen.util.Scheduler.default(), spin = 0.001)
+		
+		m = Mock()
+		examinee = canopen.util.Timer(m, spin = 0.002)
+		examinee.start(0.005, True)
+		time.sleep(0.2)
+		examinee.stop()
+		
+		statistics = examinee.statistics
+		self.assertGreaterEqual(statistics["count"], 35)
+		self.assertLess(statistics["mean"], 0.002)
+	
+	def test_lazy(self):
+		threads = threading.active_count()
+		
+		#### Test step: Creating timers does not start threads
+		timers = [canopen.util.Timer(Mock(), spin = 0.001) for i in range(100)]
+		timers += [canopen.util.Timer(Mock()) for i in range(100)]
+		self.assertEqual(threading.active_count(), threads)
+		for timer in timers:
+			timer.stop()
+		
+		#### Test step: The scheduler of a stopped high resolution timer is reused
+		m = Mock()
+		examinee = canopen.util.Timer(m, spin = 0.001)
+		examinee.start(0.01)
+		scheduler = examinee._scheduler
+		time.sleep(0.02)
+		examinee.stop()
+		m.assert_called_once()
+		
+		examinee = canopen.util.Timer(m, spin = 0.002)
+		examinee.start(0.01)
+		self.assertIs(examinee._scheduler, scheduler)
+		self.assertEqual(scheduler.spin, 0.002)
+		time.sleep(0.02)
+		self.assertEqual(m.call_count, 2)
+		examinee.stop()
+	
 	def stoptimer_callback(self, testcase):
 		testcase.counter += 1
 		if testcase.counter == 3: